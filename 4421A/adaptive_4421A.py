@@ -0,0 +1,222 @@
+"""
+Example Description:
+        This example is an adaptive poller for the Bird 4421A Multifuntion
+        Power Meter. It learns how often the meter actually produces a new
+        averaged reading and polls just faster than that, backing off while
+        the readings are static and speeding up when the power changes
+        sharply, so the bus is not spent re-reading identical values and
+        changes are not missed.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file adaptive_4421A.py
+
+"""
+import math
+import threading
+import time
+
+from sampler_4421A import Sample
+
+
+class AdaptivePoller():
+    """Polls a connected Series4421A at a rate that follows the meter.
+
+    Every poll reads all requested sensors with one scan list query. A
+    reading that differs from the previous one marks a meter update, and
+    the time between updates feeds an exponentially weighted moving
+    average (weight smoothing) of the meter's update interval. The poll
+    interval is that estimate divided by oversample, so each update is
+    seen within a fraction of an interval, clamped to
+    [min_interval, max_interval].
+
+    When no update has been seen for twice the estimated interval the
+    poll interval is multiplied by backoff on each further static poll,
+    up to max_interval. When any value moves by more than transient (as
+    a fraction of its previous value) the poller drops straight to
+    min_interval, then relaxes back toward the estimate by backoff on
+    each static poll.
+
+    Iterating yields a Sample per sensor for every meter update only;
+    with changes_only=False every poll is yielded. A sink receives the
+    same samples through append(timestamp, sensor, forward, reflected).
+    """
+    def __init__(self, meter, sensors=(1,), min_interval:float=0.01, max_interval:float=1.0,
+                 initial_interval:float=0.1, oversample:float=2.0, smoothing:float=0.2,
+                 backoff:float=1.5, transient:float=0.05, changes_only:bool=True,
+                 count:int=None, sink=None):
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if oversample < 1:
+            raise ValueError("oversample must be at least 1")
+        self.__meter = meter
+        self.__sensors = tuple(sensors)
+        self.__min_interval = min_interval
+        self.__max_interval = max_interval
+        self.__oversample = oversample
+        self.__smoothing = smoothing
+        self.__backoff = backoff
+        self.__transient = transient
+        self.__changes_only = changes_only
+        self.__count = count
+        self.__sink = sink
+        self.__stop = threading.Event()
+
+        self.__scan = None
+        self.__last = None
+        self.__last_change = None
+        self.update_interval = None
+        self.poll_interval = self.__clamp(initial_interval)
+
+        self.polls = 0
+        self.updates = 0
+        self.backoffs = 0
+        self.transients = 0
+        self.errors = 0
+        self.last_error = None
+
+    def __clamp(self, interval:float):
+        return min(self.__max_interval, max(self.__min_interval, interval))
+
+    def stats(self):
+        """Reports the poll counters and the current interval estimates.
+
+        Returns:
+            dict: Poll, update, backoff, transient and error counts, and
+                the update and poll intervals in seconds.
+        """
+        return {
+            "polls": self.polls,
+            "updates": self.updates,
+            "backoffs": self.backoffs,
+            "transients": self.transients,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "update_interval": self.update_interval,
+            "poll_interval": self.poll_interval,
+        }
+
+    def stop(self):
+        """Ends iteration after the current poll.
+        """
+        self.__stop.set()
+
+    def __is_transient(self, reading):
+        for old, new in zip(self.__last, reading):
+            if math.isnan(old) or math.isnan(new):
+                continue
+            if abs(new - old) > self.__transient * max(abs(old), 1e-12):
+                return True
+        return False
+
+    def __adapt(self, reading, now:float):
+        """Update the interval estimates from one reading; True on a meter update."""
+        if self.__last is None:
+            self.__last = reading
+            self.__last_change = now
+            return True
+
+        if reading == self.__last:
+            # Until a first update is seen the poll interval stands in for
+            # the estimate.
+            estimate = self.update_interval or self.poll_interval
+            target = self.__clamp(estimate / self.__oversample)
+            if self.update_interval is not None and self.poll_interval < target:
+                # Relax from a transient back toward the estimate.
+                self.poll_interval = min(target, self.poll_interval * self.__backoff)
+            elif now - self.__last_change > 2 * estimate:
+                interval = self.__clamp(self.poll_interval * self.__backoff)
+                if interval > self.poll_interval:
+                    self.backoffs += 1
+                self.poll_interval = interval
+            return False
+
+        self.updates += 1
+
+        elapsed = now - self.__last_change
+        if self.update_interval is None:
+            self.update_interval = elapsed
+        else:
+            # A long static stretch says little about the update rate, so
+            # one observation may stretch the estimate by at most 2x its
+            # weight; a meter that really slowed down is still followed.
+            elapsed = min(elapsed, 2 * self.update_interval)
+            self.update_interval += self.__smoothing * (elapsed - self.update_interval)
+        transient = self.__is_transient(reading)
+        self.__last = reading
+        self.__last_change = now
+        if transient:
+            self.transients += 1
+            self.poll_interval = self.__min_interval
+        else:
+            self.poll_interval = self.__clamp(self.update_interval / self.__oversample)
+        return True
+
+    def poll(self):
+        """
+        Take one reading and update the interval estimates.
+
+        Returns:
+            list: One Sample per sensor, empty when the reading failed or,
+                with changes_only, when the meter had not updated.
+        """
+        if self.__scan is None:
+            self.__scan = self.__meter.measure.scan_list(self.__sensors)
+        self.polls += 1
+        try:
+            reading = self.__scan.run()
+        except Exception as err:
+            self.errors += 1
+            self.last_error = f"{err}"
+            return []
+        timestamp = time.time()
+        now = time.monotonic()
+        if not self.__adapt(tuple(reading), now) and self.__changes_only:
+            return []
+
+        samples = []
+        for i, sensor in enumerate(self.__sensors):
+            sample = Sample(timestamp, now, sensor, reading[2 * i], reading[2 * i + 1])
+            if self.__sink is not None:
+                self.__sink.append(timestamp, sensor, sample.forward, sample.reflected)
+            samples.append(sample)
+        return samples
+
+    def __iter__(self):
+        self.__stop.clear()
+        next_poll = time.monotonic()
+        while not self.__stop.is_set():
+            delay = next_poll - time.monotonic()
+            if delay > 0 and self.__stop.wait(delay):
+                return
+            started = time.monotonic()
+            yield from self.poll()
+            if self.__count is not None and self.polls >= self.__count:
+                return
+            # Schedule from the start of this poll, so the query time is
+            # not added to the interval.
+            next_poll = max(started + self.poll_interval, time.monotonic())
@@ -0,0 +1,297 @@
+"""
+Example Description:
+        This example is an alarm and trip engine for the Bird 4421A
+        Multifuntion Power Meter. Threshold and rate-of-change rules with
+        hysteresis are evaluated on every sample inside the acquisition
+        loop, before anything is buffered, stored or plotted, and the time
+        from reading to callback is measured and reported.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file alarm_4421A.py
+
+"""
+import threading
+import time
+from collections import namedtuple
+
+from instrumentation_4421A import LatencyHistogram
+from metrics_4421A import METRICS, derive_sample
+
+AlarmEvent = namedtuple("AlarmEvent", [
+    "rule", "state", "sensor", "metric", "value", "timestamp", "monotonic", "latency",
+])
+
+_DERIVED = ("rho", "vswr", "return_loss_db", "mismatch_loss_db")
+
+
+class Threshold():
+    """Trips when a metric goes above (or below) a limit.
+
+    With hysteresis the alarm clears only once the metric is back inside
+    the limit by that margin, so a value sitting on the limit does not
+    chatter. count is the number of consecutive samples past the limit
+    needed to trip; 1 trips on the first.
+
+    A NaN value, which is how an over-range reply and a Sampler gap arrive,
+    counts as past the limit unless trip_on_invalid is False, in which
+    case it is skipped and leaves the alarm as it was.
+
+    Args:
+        name (str): Name reported in events.
+        metric (str): "forward", "reflected", "rho", "vswr", "return_loss_db"
+            or "mismatch_loss_db".
+        above (float, optional): Trip when the metric is above this.
+        below (float, optional): Trip when the metric is below this.
+        hysteresis (float, optional): Clearing margin. Defaults to 0.
+        count (int, optional): Consecutive samples to trip. Defaults to 1.
+        sensor (int, optional): Only watch this sensor. Defaults to every sensor.
+        trip_on_invalid (bool, optional): Treat NaN as past the limit. Defaults to True.
+    """
+    def __init__(self, name:str, metric:str, above:float=None, below:float=None,
+                 hysteresis:float=0.0, count:int=1, sensor:int=None, trip_on_invalid:bool=True):
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric: {metric}")
+        if (above is None) == (below is None):
+            raise ValueError("give exactly one of above and below")
+        self.name = name
+        self.metric = metric
+        self.sensor = sensor
+        self.__above = above
+        self.__below = below
+        self.__hysteresis = hysteresis
+        self.__count = count
+        self.__trip_on_invalid = trip_on_invalid
+        self.__past = {}
+
+    def check(self, sensor:int, value:float, monotonic:float, active:bool):
+        """Returns whether the alarm should be active after this value."""
+        if value != value:
+            if not self.__trip_on_invalid:
+                return active
+            past, inside = True, False
+        elif self.__above is not None:
+            past = value > self.__above
+            inside = value <= self.__above - self.__hysteresis
+        else:
+            past = value < self.__below
+            inside = value >= self.__below + self.__hysteresis
+        run = self.__past.get(sensor, 0) + 1 if past else 0
+        self.__past[sensor] = run
+        if active:
+            return not inside
+        return run >= self.__count
+
+
+class RateOfChange():
+    """Trips when a metric changes faster than a limit, in units per second.
+
+    The rate is taken between consecutive samples of a sensor on the
+    monotonic clock. direction is "rising", "falling" or "both". The alarm
+    clears once the rate has stayed within the limit less hysteresis for
+    hold seconds.
+
+    A NaN value trips the alarm unless trip_on_invalid is False, in which
+    case it is skipped. Either way no rate is taken across it: the next
+    valid value starts afresh.
+
+    Args:
+        name (str): Name reported in events.
+        metric (str): Metric to watch, as for Threshold.
+        max_rate (float): Largest allowed change per second.
+        direction (str, optional): Defaults to "rising".
+        hysteresis (float, optional): Clearing margin in units per second. Defaults to 0.
+        hold (float, optional): Seconds of normal rate before clearing. Defaults to 0.
+        sensor (int, optional): Only watch this sensor. Defaults to every sensor.
+        trip_on_invalid (bool, optional): Trip on NaN. Defaults to True.
+    """
+    def __init__(self, name:str, metric:str, max_rate:float, direction:str="rising",
+                 hysteresis:float=0.0, hold:float=0.0, sensor:int=None, trip_on_invalid:bool=True):
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric: {metric}")
+        if direction not in ("rising", "falling", "both"):
+            raise ValueError(f"unknown direction: {direction}")
+        self.name = name
+        self.metric = metric
+        self.sensor = sensor
+        self.__max_rate = max_rate
+        self.__direction = direction
+        self.__hysteresis = hysteresis
+        self.__hold = hold
+        self.__trip_on_invalid = trip_on_invalid
+        self.__previous = {}
+        self.__normal_since = {}
+
+    def check(self, sensor:int, value:float, monotonic:float, active:bool):
+        """Returns whether the alarm should be active after this value."""
+        if value != value:
+            self.__previous.pop(sensor, None)
+            if not self.__trip_on_invalid:
+                return active
+            self.__normal_since.pop(sensor, None)
+            return True
+        previous = self.__previous.get(sensor)
+        self.__previous[sensor] = (monotonic, value)
+        if previous is None or monotonic <= previous[0]:
+            return active
+        rate = (value - previous[1]) / (monotonic - previous[0])
+        if self.__direction == "falling":
+            rate = -rate
+        elif self.__direction == "both":
+            rate = abs(rate)
+
+        if rate > self.__max_rate:
+            self.__normal_since.pop(sensor, None)
+            return True
+        if not active:
+            return False
+        if rate > self.__max_rate - self.__hysteresis:
+            self.__normal_since.pop(sensor, None)
+            return True
+        since = self.__normal_since.setdefault(sensor, monotonic)
+        return monotonic - since < self.__hold
+
+
+class AlarmEngine():
+    """Evaluates alarm rules on every sample and fires callbacks on changes.
+
+    Pass the engine to a Sampler as on_sample, so it runs on the
+    acquisition thread as soon as each reading is parsed, before the
+    sink and queue; it can also be called directly with any Sample.
+    Derived metrics are only computed when a rule uses one.
+
+    Callbacks are called as callback(event) with an AlarmEvent when a
+    rule trips ("trip") or clears ("clear"). event.latency is the time in
+    seconds from the reading being taken (Sample.monotonic) to the
+    callback being called; it is also collected in a histogram reported
+    by stats(), together with the time spent evaluating each sample. A
+    callback that raises is counted and does not stop the others.
+    """
+    def __init__(self, rules, callbacks=()):
+        self.__rules = list(rules)
+        self.__callbacks = list(callbacks)
+        self.__derive = any(rule.metric in _DERIVED for rule in self.__rules)
+        self.__active = {}
+        self.__lock = threading.Lock()
+        self.__fire_latency = LatencyHistogram()
+        self.__eval_latency = LatencyHistogram()
+
+        self.samples = 0
+        self.trips = 0
+        self.clears = 0
+        self.callback_errors = 0
+        self.last_error = None
+
+    def add_callback(self, callback):
+        self.__callbacks.append(callback)
+
+    @property
+    def active(self):
+        """The (rule name, sensor) pairs currently in alarm.
+        """
+        return sorted(key for key, on in self.__active.items() if on)
+
+    def __fire(self, event_args, monotonic:float):
+        latency = time.monotonic() - monotonic
+        self.__fire_latency.record(int(latency * 1e9))
+        event = AlarmEvent(*event_args, latency)
+        for callback in self.__callbacks:
+            try:
+                callback(event)
+            except Exception as err:
+                self.callback_errors += 1
+                self.last_error = f"{err}"
+        return event
+
+    def __call__(self, sample):
+        return self.evaluate(sample)
+
+    def evaluate(self, sample):
+        """
+        Evaluate every rule against one sample.
+
+        Args:
+            sample (Sample): The reading, as produced by the Sampler.
+
+        Returns:
+            list: The AlarmEvents fired by this sample.
+        """
+        start = time.perf_counter_ns()
+        values = {"forward": sample.forward, "reflected": sample.reflected}
+        if self.__derive:
+            values.update(zip(_DERIVED, derive_sample(sample.forward, sample.reflected)))
+
+        events = []
+        with self.__lock:
+            self.samples += 1
+            for rule in self.__rules:
+                if rule.sensor is not None and rule.sensor != sample.sensor:
+                    continue
+                key = (rule.name, sample.sensor)
+                active = self.__active.get(key, False)
+                value = values[rule.metric]
+                now_active = rule.check(sample.sensor, value, sample.monotonic, active)
+                if now_active == active:
+                    continue
+                self.__active[key] = now_active
+                if now_active:
+                    self.trips += 1
+                else:
+                    self.clears += 1
+                events.append(self.__fire(
+                    (rule.name, "trip" if now_active else "clear", sample.sensor, rule.metric,
+                     value, sample.timestamp, sample.monotonic),
+                    sample.monotonic,
+                ))
+            self.__eval_latency.record(time.perf_counter_ns() - start)
+        return events
+
+    def stats(self):
+        """Reports alarm counts and latencies.
+
+        Returns:
+            dict: Sample, trip, clear and callback error counts; the active
+                alarms; and p50, p99 and max in ms of the time from reading
+                to callback and of the time to evaluate one sample.
+        """
+        with self.__lock:
+            fire = self.__fire_latency
+            evaluate = self.__eval_latency
+            return {
+                "samples": self.samples,
+                "trips": self.trips,
+                "clears": self.clears,
+                "callback_errors": self.callback_errors,
+                "last_error": self.last_error,
+                "active": self.active,
+                "callback_latency_p50_ms": fire.percentile(50) / 1e6,
+                "callback_latency_p99_ms": fire.percentile(99) / 1e6,
+                "callback_latency_max_ms": fire.max_ns / 1e6,
+                "evaluate_p50_ms": evaluate.percentile(50) / 1e6,
+                "evaluate_p99_ms": evaluate.percentile(99) / 1e6,
+                "evaluate_max_ms": evaluate.max_ns / 1e6,
+            }
@@ -0,0 +1,344 @@
+"""
+Example Description:
+        This example is an asyncio instrument class library used for
+        automation of the Bird 4421A Multifuntion Power Meter over its
+        raw SCPI socket (TCP port 5025). Queries are line framed and may
+        be pipelined so several requests are in flight on one connection.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file async_series_4421A.py
+
+"""
+import asyncio
+from collections import deque
+
+from series_4421A import parse_float
+
+SCPI_PORT = 5025
+
+
+class AsyncSeries4421A():
+    """asyncio driver for the 4421A speaking SCPI directly over TCP.
+
+    Every query is written to the socket as soon as it is issued and its
+    reply future is queued in send order. A single reader task takes one
+    newline-terminated line per outstanding query, so any number of
+    coroutines may share the connection and keep several queries on the
+    wire at once.
+
+    Replies are matched to queries by position alone, so a timeout puts
+    the connection out of step: the reply may still arrive, or may never
+    come. The driver then resyncs. Queries still waiting fail with
+    TimeoutError, *OPC? is sent as a marker, and every line is discarded
+    until its "1" comes back. Queries sent after the marker are answered
+    as normal.
+    """
+    RESYNC_QUERY = "*OPC?"
+    RESYNC_REPLY = "1"
+
+    def __init__(self, host:str=None, port:int=SCPI_PORT):
+        self.__host = host
+        self.__port = port
+        self.__timeout = 5000
+        self.__reader = None
+        self.__writer = None
+        self.__reader_task = None
+        self.__pending = deque()
+        self.__marker = None
+        self.__encoded = {}
+
+        self.measure = None
+        self.system = None
+
+    async def connect(self, host:str=None, port:int=None, timeout:int=None):
+        """Opens the TCP connection to the instrument SCPI socket.
+
+        Args:
+            host (str, optional): Instrument IP address or host name. Defaults to None.
+            port (int, optional): Instrument SCPI port. Defaults to None (5025).
+            timeout (int, optional): The instrument timeout response value in ms. Defaults to None.
+        """
+        if host is not None:
+            self.__host = host
+        if port is not None:
+            self.__port = port
+        if timeout is not None:
+            self.__timeout = timeout
+
+        self.__reader, self.__writer = await asyncio.wait_for(
+            asyncio.open_connection(self.__host, self.__port),
+            self.__timeout / 1000
+        )
+        self.__reader_task = asyncio.get_running_loop().create_task(self.__read_replies())
+
+        self.measure = self.Measure(self)
+        self.system = self.System(self)
+
+    async def disconnect(self):
+        """
+        Close the connection to the instrument and fail any query that is
+        still waiting for a reply.
+        """
+        if self.__reader_task is not None:
+            self.__reader_task.cancel()
+            try:
+                await self.__reader_task
+            except asyncio.CancelledError:
+                pass
+            self.__reader_task = None
+        self.__fail_pending(ConnectionError("connection closed"))
+        if self.__writer is not None:
+            self.__writer.close()
+            try:
+                await self.__writer.wait_closed()
+            except OSError:
+                pass
+            self.__writer = None
+            self.__reader = None
+
+    @property
+    def outstanding(self):
+        """Reports the number of queries sent but not yet answered.
+
+        Returns:
+            int: Number of queries in flight.
+        """
+        return len(self.__pending)
+
+    def __encode(self, cmd:str):
+        encoded = self.__encoded.get(cmd)
+        if encoded is None:
+            encoded = f"{cmd}\n".encode()
+            self.__encoded[cmd] = encoded
+        return encoded
+
+    def __send(self, cmd:str):
+        if self.__writer is None:
+            raise ConnectionError("not connected")
+        self.__writer.write(self.__encode(cmd))
+        if "?" not in cmd:
+            return None
+        reply = asyncio.get_running_loop().create_future()
+        self.__pending.append(reply)
+        return reply
+
+    async def __wait(self, reply):
+        try:
+            return await asyncio.wait_for(reply, self.__timeout / 1000)
+        except asyncio.TimeoutError:
+            if not reply.cancelled():
+                # Failed by a resync that an earlier timeout started.
+                raise
+            self.__resync()
+            raise TimeoutError("timed out waiting for the instrument reply") from None
+
+    def __resync(self):
+        if self.__writer is None:
+            return
+        error = TimeoutError("reply lost while resyncing after a timeout")
+        for reply in self.__pending:
+            if not reply.done():
+                reply.set_exception(error)
+        # The marker is a done future, so nothing ever waits on it or fails
+        # it; the reader finds it by identity.
+        marker = asyncio.get_running_loop().create_future()
+        marker.cancel()
+        self.__writer.write(self.__encode(self.RESYNC_QUERY))
+        self.__pending.append(marker)
+        self.__marker = marker
+
+    async def __read_replies(self):
+        try:
+            while True:
+                line = await self.__reader.readline()
+                if not line.endswith(b"\n"):
+                    break
+                if self.__marker is not None:
+                    # Resyncing: everything up to the marker's reply is
+                    # stale. Any "1" ends it, so a lost marker is covered
+                    # by the next one.
+                    if line.decode().rstrip() != self.RESYNC_REPLY:
+                        continue
+                    while self.__pending and self.__pending.popleft() is not self.__marker:
+                        pass
+                    self.__marker = None
+                    continue
+                if not self.__pending:
+                    continue
+                # Each line answers the oldest query still pending; a query
+                # that has already failed leaves its line unused.
+                reply = self.__pending.popleft()
+                if not reply.done():
+                    reply.set_result(line.decode().rstrip())
+        except (OSError, asyncio.IncompleteReadError) as err:
+            self.__fail_pending(ConnectionError(f"{err}"))
+            return
+        self.__fail_pending(ConnectionError("connection closed by instrument"))
+
+    def __fail_pending(self, error:Exception):
+        self.__marker = None
+        while self.__pending:
+            reply = self.__pending.popleft()
+            if not reply.done():
+                reply.set_exception(error)
+
+    async def write(self, cmd:str):
+        self.__send(cmd)
+        await self.__writer.drain()
+
+    async def query(self, cmd:str):
+        reply = self.__send(cmd)
+        await self.__writer.drain()
+        if reply is None:
+            return ""
+        return await self.__wait(reply)
+
+    async def query_many(self, cmds):
+        """Pipelines several queries on the connection before awaiting any
+        of the replies.
+
+        Args:
+            cmds (list): SCPI query strings.
+
+        Returns:
+            list: The reply strings, in the order the queries were given.
+        """
+        replies = [self.__send(cmd) for cmd in cmds]
+        await self.__writer.drain()
+        return [
+            "" if reply is None else await self.__wait(reply)
+            for reply in replies
+        ]
+
+    async def idn(self):
+        """Returns the full instrument ID string.
+
+        Returns:
+            str: Returns the full instrument ID string.
+        """
+        return await self.query("*IDN?")
+
+    class Measure():
+        def __init__(self, instrobj):
+            self.__instr_obj = instrobj
+
+        async def forward_power(self, sensor_number:int=1):
+            """
+            Initiate, and retrieve a forward average power measurment.
+            If the sensor channel to read (1 or 2) is omitted, channel 1 is returned.
+
+            Args:
+                sensor_number (int): The number of the sensor connected to the meter input.
+
+            Returns:
+                float: Power in Watts, NaN when over range or unavailable.
+            """
+            if sensor_number is None:
+                sensor_number = 1
+            return parse_float(await self.__instr_obj.query(f"MEAS:AVER? {sensor_number}"))
+
+        async def reflected_power(self, sensor_number:int=1):
+            """
+            Initiate, and retrieve a reflected average power measurement. If the sensor
+            channel to read (1 or 2) is omitted, channel 1 is returned.
+
+            Args:
+                sensor_number (int): The number of the sensor connected to the meter input.
+
+            Returns:
+                float: Power in Watts, NaN when over range or unavailable.
+            """
+            if sensor_number is None:
+                sensor_number = 1
+            return parse_float(await self.__instr_obj.query(f"MEAS:REFL:AVER? {sensor_number}"))
+
+        async def power(self, sensor_number:int=1):
+            """
+            Retrieve forward and reflected average power with both queries
+            pipelined on the connection.
+
+            Args:
+                sensor_number (int): The number of the sensor connected to the meter input.
+
+            Returns:
+                tuple: Forward and reflected power in Watts
+            """
+            if sensor_number is None:
+                sensor_number = 1
+            fwd, refl = await self.__instr_obj.query_many((
+                f"MEAS:AVER? {sensor_number}",
+                f"MEAS:REFL:AVER? {sensor_number}",
+            ))
+            return parse_float(fwd), parse_float(refl)
+
+    class System():
+        def __init__(self, instrobj):
+            self.__instr_obj = instrobj
+
+        async def firmware_version(self):
+            """
+            Reads the MCU firmware revision.
+
+            Returns:
+                str: MCU firmware revision
+            """
+            return await self.__instr_obj.query("SYST:IDEN:FWR?")
+
+        async def model_number(self):
+            """
+            Returns the model number as given in the *IDN? response
+
+            Returns:
+                str: Instrument model number
+            """
+            return await self.__instr_obj.query("SYST:IDEN:MOD?")
+
+        async def serial_number(self):
+            """
+            Returns the serial number as given in the *IDN? response
+
+            Returns:
+                str: Instrument serial number
+            """
+            return await self.__instr_obj.query("SYST:IDEN:SN?")
+
+        async def preset(self):
+            """
+            Restores factory settings without changing the RS232 or LAN
+            settings.
+            """
+            await self.__instr_obj.write("SYST:PRES")
+
+        async def scpi_version(self):
+            """
+            Returns the SCPI version.
+
+            Returns:
+                str: SCPI version.
+            """
+            return await self.__instr_obj.query("SYST:VERS?")
@@ -0,0 +1,475 @@
+"""
+Example Description:
+        This example is a performance benchmark suite for the 4421A driver.
+        It runs against the bundled emulator on the loopback interface and
+        measures round-trip latency and readings per second on each
+        transport and on the asyncio driver, reply parsing and derived
+        metric cost, sampling loop jitter and memory per million stored
+        samples, and writes the results as JSON.
+
+        python bench_4421A.py --output bench.json
+        python bench_4421A.py --baseline bench.json --tolerance 0.25
+
+        With --baseline, any rate that fell or time or size that grew by
+        more than the tolerance is reported and the exit status is 1.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file bench_4421A.py
+
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from async_series_4421A import AsyncSeries4421A
+from emulator_4421A import Emulator4421A, Faults, constant_latency
+from metrics_4421A import derive_sample, derived
+from parse_4421A import parse_block, parse_values
+from ringbuffer_4421A import PowerRingBuffer
+from sampler_4421A import Sample, Sampler
+from series_4421A import ScanList, Series4421A, parse_float
+from transports_4421A import SerialTransport, SocketTransport, VisaTransport
+
+MILLION = 1_000_000
+
+
+def _latency_summary(ns):
+    ordered = sorted(ns)
+    return {
+        "rtt_p50_ms": ordered[len(ordered) // 2] / 1e6,
+        "rtt_p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] / 1e6,
+        "rtt_max_ms": ordered[-1] / 1e6,
+    }
+
+
+def _time_calls(call, calls:int, values_per_call:int, warmup:int=100):
+    for _ in range(warmup):
+        call()
+    ns = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(calls):
+        t0 = clock()
+        call()
+        ns.append(clock() - t0)
+    elapsed = (clock() - start) / 1e9
+    return dict(_latency_summary(ns), readings_per_s=calls * values_per_call / elapsed)
+
+
+def _transports(host:str, port:int):
+    return {
+        "socket": lambda: SocketTransport(host, port),
+        "serial": lambda: SerialTransport(f"socket://{host}:{port}"),
+        "visa": lambda: VisaTransport(f"TCPIP0::{host}::{port}::SOCKET"),
+    }
+
+
+def bench_transports(emulator:Emulator4421A, calls:int=2000, backends=None):
+    """
+    Measure round-trip latency and readings per second on each transport.
+
+    Args:
+        emulator (Emulator4421A): A running emulator.
+        calls (int, optional): Calls per measurement. Defaults to 2000.
+        backends (list, optional): Transport names to run. Defaults to all.
+
+    Returns:
+        dict: Per transport, per operation latency percentiles and rates,
+            or {"skipped": reason} when the transport is unavailable.
+    """
+    host, port = emulator.address
+    results = {}
+    for name, factory in _transports(host, port).items():
+        if backends is not None and name not in backends:
+            continue
+        meter = Series4421A()
+        try:
+            meter.connect(timeout=2000, transport=factory())
+        except ImportError as err:
+            results[name] = {"skipped": f"{err}"}
+            continue
+        if meter.measure is None:
+            results[name] = {"skipped": "connect failed"}
+            continue
+        try:
+            scan = meter.measure.scan_list((1, 2))
+            results[name] = {
+                "forward_power": _time_calls(lambda: meter.measure.forward_power(1), calls, 1),
+                "reflected_power": _time_calls(lambda: meter.measure.reflected_power(1), calls, 1),
+                "scan_list_2_sensors": _time_calls(scan.run, calls, len(scan.fields)),
+            }
+        finally:
+            meter.disconnect()
+    return results
+
+
+async def _bench_async(host:str, port:int, calls:int):
+    meter = AsyncSeries4421A(host, port)
+    await meter.connect(timeout=2000)
+    try:
+        idn = await meter.idn()
+        for _ in range(100):
+            await meter.measure.forward_power(1)
+        ns = []
+        clock = time.perf_counter_ns
+        start = clock()
+        for _ in range(calls):
+            t0 = clock()
+            await meter.measure.forward_power(1)
+            ns.append(clock() - t0)
+        sequential = dict(_latency_summary(ns), readings_per_s=calls / ((clock() - start) / 1e9))
+
+        # Pipelined: every reply must come back to its own query.
+        batch = ["*IDN?", "MEAS:AVER? 1", "MEAS:REFL:AVER? 1"] * 10
+        start = time.perf_counter()
+        for _ in range(max(1, calls // len(batch))):
+            replies = await meter.query_many(batch)
+            if replies[::3] != [idn] * 10:
+                raise RuntimeError(f"pipelined replies out of order: {replies[:3]}")
+        rounds = max(1, calls // len(batch))
+        pipelined = {"readings_per_s": rounds * 20 / (time.perf_counter() - start)}
+    finally:
+        await meter.disconnect()
+    return {"forward_power": sequential, "query_many_30": pipelined}
+
+
+async def _check_resync(host:str, port:int, faults:Faults):
+    # The emulator answers MEAS:REFL:AVER? after 250 ms and the timeout is
+    # 200 ms, so its reply arrives while the next query waits. Then one
+    # reply is dropped outright. Every query after each timeout must still
+    # get its own reply.
+    meter = AsyncSeries4421A(host, port)
+    await meter.connect(timeout=200)
+    try:
+        idn = await meter.idn()
+        for lose, lost in (("late", meter.measure.reflected_power),
+                           ("dropped", meter.measure.forward_power)):
+            faults.drop = 1.0 if lose == "dropped" else 0.0
+            query = asyncio.ensure_future(lost(1))
+            # Only that one reply is lost, not the resync marker after it.
+            await asyncio.sleep(0.05)
+            faults.drop = 0.0
+            try:
+                await query
+            except TimeoutError:
+                pass
+            else:
+                raise RuntimeError(f"query with a {lose} reply did not time out")
+            for _ in range(4):
+                reply = await meter.idn()
+                if reply != idn:
+                    raise RuntimeError(f"after a {lose} reply, *IDN? returned {reply!r}")
+    finally:
+        await meter.disconnect()
+    return True
+
+
+def bench_async(emulator:Emulator4421A, calls:int=2000):
+    """
+    Measure the asyncio driver on the loopback emulator, and check that
+    replies stay with their queries when pipelined and after a timeout.
+
+    Args:
+        emulator (Emulator4421A): A running emulator.
+        calls (int, optional): Queries per measurement. Defaults to 2000.
+
+    Returns:
+        dict: Sequential latency percentiles and rate, pipelined rate, and
+            whether the driver resynced after a late and a dropped reply.
+
+    Raises:
+        RuntimeError: A reply was delivered to the wrong query.
+    """
+    host, port = emulator.address
+    results = asyncio.run(_bench_async(host, port, calls))
+    faults = Faults()
+    with Emulator4421A(port=0, latency={"MEAS:REFL:AVER?": constant_latency(0.25)},
+                       faults=faults) as slow:
+        results["resynced_after_timeout"] = asyncio.run(_check_resync(*slow.address, faults))
+    return results
+
+
+def bench_parse(values:int=200000):
+    """
+    Measure the cost of turning meter replies into floats.
+
+    Args:
+        values (int, optional): Values parsed per measurement. Defaults to 200000.
+
+    Returns:
+        dict: ns per value for single replies, compound scan replies, and
+            the bulk parser on one long reply and on a block of scan lines.
+    """
+    single = "1.000000E+02\n"
+    start = time.perf_counter_ns()
+    for _ in range(values):
+        parse_float(single)
+    single_ns = (time.perf_counter_ns() - start) / values
+
+    scan = ScanList(None, (1, 2))
+    compound = "1.000000E+02;1.000000E+00;5.000000E+01;5.000000E-01\n"
+    replies = values // len(scan.fields)
+    start = time.perf_counter_ns()
+    for _ in range(replies):
+        scan.parse(compound)
+    scan_ns = (time.perf_counter_ns() - start) / (replies * len(scan.fields))
+
+    text = ";".join([compound.rstrip()] * replies)
+    start = time.perf_counter_ns()
+    parse_values(text)
+    bulk_ns = (time.perf_counter_ns() - start) / (replies * len(scan.fields))
+
+    block = compound * replies
+    start = time.perf_counter_ns()
+    parse_block(block)
+    block_ns = (time.perf_counter_ns() - start) / (replies * len(scan.fields))
+
+    return {
+        "single_ns_per_value": single_ns,
+        "scan_list_ns_per_value": scan_ns,
+        "bulk_values_ns_per_value": bulk_ns,
+        "bulk_block_ns_per_value": block_ns,
+    }
+
+
+def bench_metrics(values:int=200000):
+    """
+    Measure the per-sample derived metrics, and check they agree with the
+    vectorized ones, including for NaN, zero, negative and infinite power.
+
+    Args:
+        values (int, optional): Samples derived per measurement. Defaults to 200000.
+
+    Returns:
+        dict: ns per sample for derive_sample() and for derived() on arrays,
+            and whether the two agree.
+
+    Raises:
+        RuntimeError: derive_sample() and derived() disagree.
+    """
+    edges = (math.nan, 0.0, -1.0, 1e-12, 0.5, 1.0, 2.0, 100.0, math.inf, -math.inf)
+    names = ("rho", "vswr", "return_loss_db", "mismatch_loss_db")
+    for forward, reflected in itertools.product(edges, edges):
+        vector = derived(np.array([forward]), np.array([reflected]))
+        expected = np.array([vector[name][0] for name in names])
+        got = np.array(derive_sample(forward, reflected))
+        if not np.allclose(got, expected, rtol=1e-12, equal_nan=True):
+            raise RuntimeError(
+                f"derive_sample({forward}, {reflected}) = {tuple(got.tolist())}, "
+                f"derived() gives {tuple(expected.tolist())}"
+            )
+
+    rng = np.random.default_rng(4421)
+    forward = rng.uniform(50.0, 150.0, values)
+    reflected = rng.uniform(0.0, 10.0, values)
+    pairs = list(zip(forward.tolist(), reflected.tolist()))
+    start = time.perf_counter_ns()
+    for f, r in pairs:
+        derive_sample(f, r)
+    sample_ns = (time.perf_counter_ns() - start) / values
+
+    start = time.perf_counter_ns()
+    derived(forward, reflected)
+    vector_ns = (time.perf_counter_ns() - start) / values
+
+    return {
+        "derive_sample_ns_per_value": sample_ns,
+        "derived_ns_per_value": vector_ns,
+        "matches_vectorized": True,
+    }
+
+
+def bench_sampler(emulator:Emulator4421A, rate_hz:float=200.0, duration:float=2.0):
+    """
+    Measure how closely the Sampler keeps to its schedule over the socket
+    transport.
+
+    Args:
+        emulator (Emulator4421A): A running emulator.
+        rate_hz (float, optional): Sample rate. Defaults to 200.
+        duration (float, optional): Seconds to sample. Defaults to 2.
+
+    Returns:
+        dict: Interval jitter percentiles in ms, achieved rate and the
+            sampler counters.
+    """
+    host, port = emulator.address
+    meter = Series4421A()
+    meter.connect(timeout=2000, transport=SocketTransport(host, port))
+    count = int(rate_hz * duration)
+    sampler = Sampler(meter, rate_hz, count=count, max_queue=count + 1)
+    stamps = [sample.monotonic for sample in sampler]
+    meter.disconnect()
+
+    period = 1.0 / rate_hz
+    jitter = sorted(abs(b - a - period) * 1000 for a, b in zip(stamps, stamps[1:]))
+    stats = sampler.stats()
+    stats.pop("last_error")
+    return {
+        "rate_hz": rate_hz,
+        "achieved_hz": (len(stamps) - 1) / (stamps[-1] - stamps[0]) if len(stamps) > 1 else 0.0,
+        "jitter_p50_ms": jitter[len(jitter) // 2] if jitter else 0.0,
+        "jitter_p99_ms": jitter[min(len(jitter) - 1, int(len(jitter) * 0.99))] if jitter else 0.0,
+        "jitter_max_ms": jitter[-1] if jitter else 0.0,
+        "counters": stats,
+    }
+
+
+def bench_memory(samples:int=200000):
+    """
+    Compare the memory needed to hold one million samples in a
+    PowerRingBuffer and in a list of Sample tuples.
+
+    Args:
+        samples (int, optional): Samples actually stored; the result is
+            scaled to a million. Defaults to 200000.
+
+    Returns:
+        dict: Bytes per million samples, and ring buffer append rate.
+    """
+    buffer = PowerRingBuffer(samples)
+    start = time.perf_counter()
+    for i in range(samples):
+        buffer.append(float(i), 1, 100.0, 1.0)
+    append_rate = samples / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    stored = [Sample(float(i), float(i), 1, 100.0 + i, 1.0 + i) for i in range(samples)]
+    list_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del stored
+
+    scale = MILLION / samples
+    return {
+        "ring_buffer_bytes_per_million": buffer.nbytes * scale,
+        "sample_list_bytes_per_million": list_bytes * scale,
+        "ring_buffer_appends_per_s": append_rate,
+    }
+
+
+def run(calls:int=2000, duration:float=2.0, backends=None):
+    """
+    Run the whole suite against a private emulator.
+
+    Args:
+        calls (int, optional): Calls per transport measurement. Defaults to 2000.
+        duration (float, optional): Seconds of sampler run. Defaults to 2.
+        backends (list, optional): Transport names to run. Defaults to all.
+
+    Returns:
+        dict: All results.
+    """
+    with Emulator4421A(port=0, seed=4421) as emulator:
+        transports = bench_transports(emulator, calls, backends)
+        async_driver = bench_async(emulator, calls)
+        sampler = bench_sampler(emulator, duration=duration)
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "transports": transports,
+        "async": async_driver,
+        "parse": bench_parse(),
+        "metrics": bench_metrics(),
+        "sampler": sampler,
+        "memory": bench_memory(),
+    }
+
+
+def _better_when_lower(key:str):
+    # Maxima are single outliers and too noisy to gate on.
+    if key.endswith("_max_ms"):
+        return False
+    return key.endswith(("_ms", "_ns_per_value", "_per_million"))
+
+
+def _better_when_higher(key:str):
+    return key.endswith(("_per_s", "achieved_hz"))
+
+
+def compare(results:dict, baseline:dict, tolerance:float=0.25, path:str=""):
+    """
+    List the figures that regressed against a baseline run.
+
+    Args:
+        results (dict): Results from run().
+        baseline (dict): Earlier results from run().
+        tolerance (float, optional): Allowed fractional change. Defaults to 0.25.
+
+    Returns:
+        list: One description per regression.
+    """
+    regressions = []
+    for key, value in results.items():
+        old = baseline.get(key)
+        name = f"{path}{key}"
+        if isinstance(value, dict) and isinstance(old, dict):
+            regressions += compare(value, old, tolerance, f"{name}.")
+        elif isinstance(value, (int, float)) and isinstance(old, (int, float)) and old > 0:
+            change = value / old - 1
+            if (_better_when_lower(key) and change > tolerance) or \
+               (_better_when_higher(key) and change < -tolerance):
+                regressions.append(f"{name}: {old:.6g} -> {value:.6g} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="4421A driver benchmark suite")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--backend", action="append", choices=["socket", "serial", "visa"],
+                        help="transport to run; repeat for several (default: all)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this earlier JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args.calls, args.duration, args.backend)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
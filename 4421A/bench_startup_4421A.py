@@ -0,0 +1,140 @@
+"""
+Example Description:
+        This example is a start-up benchmark for the 4421A driver. It
+        measures, in fresh interpreter processes, how long it takes to
+        import series_4421A and how long it takes from process start to
+        the first forward power reading from the bundled emulator.
+
+        python bench_startup_4421A.py --repeat 10 --output startup.json
+        python bench_startup_4421A.py --max-import-ms 50
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file bench_startup_4421A.py
+
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from emulator_4421A import Emulator4421A
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_PROBE = """
+import time
+t0 = time.perf_counter()
+import series_4421A
+t1 = time.perf_counter()
+import sys
+print(t1 - t0, "pyvisa" in sys.modules)
+"""
+
+FIRST_READING_PROBE = """
+import time
+t0 = time.perf_counter()
+from series_4421A import Series4421A
+from transports_4421A import SocketTransport
+mysensor = Series4421A()
+mysensor.connect(timeout=5000, transport=SocketTransport("127.0.0.1", {port}))
+fwd = mysensor.measure.forward_power(1)
+t1 = time.perf_counter()
+mysensor.disconnect()
+print(t1 - t0, fwd)
+"""
+
+
+def _run_probe(code:str):
+    env = dict(os.environ, PYTHONPATH=HERE + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable, "-c", code], cwd=HERE, env=env,
+                         capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def _summary(values):
+    return {
+        "min_ms": min(values) * 1000,
+        "median_ms": statistics.median(values) * 1000,
+        "max_ms": max(values) * 1000,
+    }
+
+
+def run(repeat:int=5):
+    """
+    Run the start-up benchmark.
+
+    Args:
+        repeat (int, optional): Fresh processes per measurement. Defaults to 5.
+
+    Returns:
+        dict: Import and time-to-first-reading results in milliseconds.
+    """
+    import_times = []
+    pyvisa_loaded = False
+    for _ in range(repeat):
+        elapsed, loaded = _run_probe(IMPORT_PROBE)
+        import_times.append(float(elapsed))
+        pyvisa_loaded |= loaded == "True"
+
+    with Emulator4421A(port=0) as emulator:
+        port = emulator.address[1]
+        first_times = [
+            float(_run_probe(FIRST_READING_PROBE.format(port=port))[0]) for _ in range(repeat)
+        ]
+
+    return {
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "import": _summary(import_times),
+        "import_loads_pyvisa": pyvisa_loaded,
+        "time_to_first_reading_socket": _summary(first_times),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="4421A driver start-up benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--max-import-ms", type=float,
+                        help="exit with status 1 if the median import time exceeds this")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if args.max_import_ms is not None and results["import"]["median_ms"] > args.max_import_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Example Description:
+        This example is a binary capture log writer used to record Bird
+        4421A forward and reflected power samples at full rate for long
+        runs. Samples are written in fixed-width columnar chunks behind a
+        small file header, with batched fsync and file rotation.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file capturelog_4421A.py
+
+File layout (all little endian):
+
+    file header   "B4421CAP", u16 version, u16 reserved, u32 length,
+                  JSON metadata padded with spaces to an 8 byte boundary
+    chunk header  "CHNK", u32 records, f8 first timestamp, f8 last
+                  timestamp, u32 payload crc32, u32 payload length
+    chunk payload timestamp[n] f8, forward[n] f8, reflected[n] f8,
+                  sensor[n] u1, zero padded to an 8 byte boundary
+
+"""
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import deque
+
+import numpy as np
+
+FILE_MAGIC = b"B4421CAP"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<8sHHI")
+CHUNK_MAGIC = b"CHNK"
+CHUNK_HEADER = struct.Struct("<4sIddII")
+CAPTURE_SUFFIX = ".b4421"
+
+# Column name, dtype and byte width, in payload order.
+COLUMNS = (
+    ("timestamp", "<f8", 8),
+    ("forward", "<f8", 8),
+    ("reflected", "<f8", 8),
+    ("sensor", "u1", 1),
+)
+RECORD_WIDTH = sum(width for _, _, width in COLUMNS)
+
+
+def payload_length(records:int):
+    """Returns the padded byte length of a chunk payload."""
+    return (records * RECORD_WIDTH + 7) & ~7
+
+
+def read_file_header(buffer):
+    """
+    Parse the file header at the start of a capture log.
+
+    Args:
+        buffer (bytes-like): The start of the file.
+
+    Returns:
+        tuple: The metadata dict and the offset of the first chunk.
+    """
+    magic, version, _, length = FILE_HEADER.unpack_from(buffer, 0)
+    if magic != FILE_MAGIC:
+        raise ValueError("not a 4421A capture log")
+    if version != FILE_VERSION:
+        raise ValueError(f"unsupported capture log version {version}")
+    start = FILE_HEADER.size
+    meta = json.loads(bytes(buffer[start:start + length]).decode())
+    return meta, start + length
+
+
+def scan_chunks(buffer, offset:int, verify:bool=True):
+    """
+    Walk the chunk headers of a capture log, stopping at the first chunk
+    that is truncated or fails its checksum.
+
+    Args:
+        buffer (bytes-like): The whole file, typically a memory map.
+        offset (int): Offset of the first chunk.
+        verify (bool, optional): Check each payload crc32. Defaults to True.
+
+    Yields:
+        tuple: (payload offset, records, first timestamp, last timestamp).
+    """
+    end = len(buffer)
+    while offset + CHUNK_HEADER.size <= end:
+        magic, records, t_first, t_last, crc, length = CHUNK_HEADER.unpack_from(buffer, offset)
+        start = offset + CHUNK_HEADER.size
+        if magic != CHUNK_MAGIC or length != payload_length(records) or start + length > end:
+            return
+        if verify and zlib.crc32(buffer[start:start + length]) != crc:
+            return
+        yield start, records, t_first, t_last
+        offset = start + length
+
+
+def recover_capture(path:str, verify_tail:int=1):
+    """
+    Truncate a capture log after its last complete chunk, discarding a
+    chunk that was only partly written when the writer stopped.
+
+    The file is memory mapped and only the chunk headers are walked; the
+    crc32 is checked on the last verify_tail chunks alone, the unsynced
+    tail that a crash can have left incomplete, so recovery does not read
+    the rest of the payload.
+
+    Args:
+        path (str): Capture log file.
+        verify_tail (int, optional): Trailing chunks to checksum. Defaults to 1.
+
+    Returns:
+        int: Number of bytes removed.
+    """
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < FILE_HEADER.size:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                _, end = read_file_header(data)
+            except (ValueError, struct.error):
+                return 0
+            tail = deque(maxlen=max(1, verify_tail))
+            for chunk in scan_chunks(data, end, verify=False):
+                tail.append(chunk)
+                end = chunk[0] + payload_length(chunk[1])
+            if tail:
+                end = tail[0][0] - CHUNK_HEADER.size
+                for start, records, _, _ in scan_chunks(data, end):
+                    end = start + payload_length(records)
+        removed = size - end
+        if removed:
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+    return removed
+
+
+class CaptureLogWriter():
+    """Append-only chunked capture log for power samples.
+
+    Samples are collected in preallocated column arrays and written one
+    chunk at a time, so the number of write calls is one per chunk_records
+    samples. The file is fsynced after every fsync_chunks chunks, and a new
+    file is started once the current one exceeds max_bytes or max_seconds.
+    On start-up the newest capture log with the same prefix is recovered,
+    dropping a partly written tail left by a crash or power loss. Older
+    files were synced and closed on rotation, so they are left alone.
+
+    The writer can be used as a Sampler sink.
+    """
+    def __init__(self, directory:str, idn:str="", sensor:int=1, chunk_records:int=4096,
+                 fsync_chunks:int=16, max_bytes:int=256 * 1024 * 1024, max_seconds:float=None,
+                 prefix:str="capture", recover:bool=True):
+        self.__directory = directory
+        self.__idn = idn
+        self.__sensor = sensor
+        self.__chunk_records = chunk_records
+        self.__fsync_chunks = fsync_chunks
+        self.__max_bytes = max_bytes
+        self.__max_seconds = max_seconds
+        self.__prefix = prefix
+
+        self.__columns = {name: np.empty(chunk_records, dtype=dtype) for name, dtype, _ in COLUMNS}
+        self.__fill = 0
+        self.__file = None
+        self.__path = None
+        self.__opened = 0.0
+        self.__size = 0
+        self.__unsynced = 0
+        self.__sequence = 0
+
+        self.files = []
+        self.chunks = 0
+        self.records = 0
+
+        os.makedirs(directory, exist_ok=True)
+        if recover:
+            paths = [
+                os.path.join(directory, name) for name in os.listdir(directory)
+                if name.startswith(f"{prefix}_") and name.endswith(CAPTURE_SUFFIX)
+            ]
+            if paths:
+                recover_capture(max(paths, key=os.path.getmtime), fsync_chunks)
+
+    @property
+    def path(self):
+        """The file currently being written.
+        """
+        return self.__path
+
+    def __open(self, start_time:float):
+        stamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(start_time))
+        # A writer restarted within the same second, as after a crash, finds
+        # its first names taken; move on to the next free sequence number.
+        while True:
+            self.__sequence += 1
+            path = os.path.join(
+                self.__directory, f"{self.__prefix}_{stamp}_{self.__sequence:04d}{CAPTURE_SUFFIX}"
+            )
+            try:
+                self.__file = open(path, "xb")
+                break
+            except FileExistsError:
+                continue
+        self.__path = path
+        meta = json.dumps({
+            "idn": self.__idn,
+            "sensor": self.__sensor,
+            "start_time": start_time,
+            "columns": [[name, dtype] for name, dtype, _ in COLUMNS],
+        }).encode()
+        meta += b" " * (-(FILE_HEADER.size + len(meta)) % 8)
+        header = FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 0, len(meta)) + meta
+
+        self.__file.write(header)
+        self.__size = len(header)
+        self.__opened = time.monotonic()
+        self.__unsynced = 0
+        self.files.append(self.__path)
+
+    def __sync(self):
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__unsynced = 0
+
+    def __close_file(self):
+        if self.__file is not None:
+            self.__sync()
+            self.__file.close()
+            self.__file = None
+
+    def __due_for_rotation(self):
+        if self.__size >= self.__max_bytes:
+            return True
+        return self.__max_seconds is not None and time.monotonic() - self.__opened >= self.__max_seconds
+
+    def __write_chunk(self):
+        n = self.__fill
+        if n == 0:
+            return
+        if self.__file is not None and self.__due_for_rotation():
+            self.__close_file()
+        if self.__file is None:
+            self.__open(float(self.__columns["timestamp"][0]))
+
+        payload = b"".join(self.__columns[name][:n].tobytes() for name, _, _ in COLUMNS)
+        payload += b"\0" * (payload_length(n) - len(payload))
+        header = CHUNK_HEADER.pack(
+            CHUNK_MAGIC, n,
+            float(self.__columns["timestamp"][0]), float(self.__columns["timestamp"][n - 1]),
+            zlib.crc32(payload), len(payload),
+        )
+        self.__file.write(header + payload)
+        self.__size += len(header) + len(payload)
+        self.__fill = 0
+        self.chunks += 1
+        self.__unsynced += 1
+        if self.__unsynced >= self.__fsync_chunks:
+            self.__sync()
+
+    def append(self, timestamp:float, sensor:int, forward:float, reflected:float):
+        """
+        Add one sample to the current chunk.
+
+        Args:
+            timestamp (float): Sample time in seconds since the epoch.
+            sensor (int): Sensor channel the sample came from.
+            forward (float): Forward power in Watts.
+            reflected (float): Reflected power in Watts.
+        """
+        i = self.__fill
+        columns = self.__columns
+        columns["timestamp"][i] = timestamp
+        columns["forward"][i] = forward
+        columns["reflected"][i] = reflected
+        columns["sensor"][i] = sensor
+        self.__fill = i + 1
+        self.records += 1
+        if self.__fill == self.__chunk_records:
+            self.__write_chunk()
+
+    def extend(self, records):
+        """
+        Add a block of samples, such as a PowerRingBuffer window.
+
+        Args:
+            records (numpy.ndarray): Array with timestamp, sensor, forward and reflected fields.
+        """
+        offset = 0
+        while offset < len(records):
+            take = min(self.__chunk_records - self.__fill, len(records) - offset)
+            for name, _, _ in COLUMNS:
+                self.__columns[name][self.__fill:self.__fill + take] = records[name][offset:offset + take]
+            self.__fill += take
+            self.records += take
+            offset += take
+            if self.__fill == self.__chunk_records:
+                self.__write_chunk()
+
+    def flush(self):
+        """
+        Write any partly filled chunk and fsync the file.
+        """
+        self.__write_chunk()
+        if self.__file is not None:
+            self.__sync()
+
+    def close(self):
+        self.__write_chunk()
+        self.__close_file()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
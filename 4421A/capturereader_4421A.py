@@ -0,0 +1,180 @@
+"""
+Example Description:
+        This example is a reader for Bird 4421A binary capture logs. Files
+        are memory mapped and indexed by chunk time range so a window of
+        samples can be pulled out of a multi-GB capture without reading
+        the rest of it.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file capturereader_4421A.py
+
+"""
+import os
+
+import numpy as np
+
+from capturelog_4421A import CAPTURE_SUFFIX, COLUMNS, read_file_header, scan_chunks
+
+
+def _seconds(t):
+    # Accept epoch seconds or anything with a timestamp() method (datetime).
+    return t.timestamp() if hasattr(t, "timestamp") else float(t)
+
+
+class CaptureLogReader():
+    """Time-indexed, memory-mapped access to one or more capture logs.
+
+    Opening the reader walks only the chunk headers and builds a sparse
+    index holding each chunk's file, offset, record count and first and
+    last timestamp. Range queries binary search that index, then the
+    timestamp column of the first and last chunks involved, and slice the
+    column data straight out of the memory map. Nothing outside the
+    requested window is read or parsed.
+
+    Samples are returned as a dict of column arrays (timestamp, forward,
+    reflected, sensor).
+    """
+    def __init__(self, paths, verify:bool=False):
+        if isinstance(paths, str):
+            if os.path.isdir(paths):
+                paths = [
+                    os.path.join(paths, name) for name in sorted(os.listdir(paths))
+                    if name.endswith(CAPTURE_SUFFIX)
+                ]
+            else:
+                paths = [paths]
+
+        self.__maps = []
+        self.meta = []
+        entries = []
+        for path in paths:
+            if os.path.getsize(path) == 0:
+                continue
+            data = np.memmap(path, dtype=np.uint8, mode="r")
+            meta, offset = read_file_header(data)
+            file_index = len(self.__maps)
+            self.__maps.append(data)
+            self.meta.append(dict(meta, path=path))
+            for start, records, t_first, t_last in scan_chunks(data, offset, verify):
+                entries.append((t_first, t_last, file_index, start, records))
+
+        entries.sort()
+        self.__t_first = np.array([e[0] for e in entries], dtype=float)
+        self.__t_last = np.maximum.accumulate(np.array([e[1] for e in entries], dtype=float))
+        self.__chunks = [e[2:] for e in entries]
+        self.records = int(sum(e[4] for e in entries))
+
+    def __len__(self):
+        return self.records
+
+    @property
+    def chunk_count(self):
+        return len(self.__chunks)
+
+    @property
+    def start_time(self):
+        return float(self.__t_first[0]) if len(self.__t_first) else None
+
+    @property
+    def end_time(self):
+        return float(self.__t_last[-1]) if len(self.__t_last) else None
+
+    def chunk(self, index:int):
+        """
+        Return the columns of one chunk as views into the memory map.
+
+        Args:
+            index (int): Chunk number in time order.
+
+        Returns:
+            dict: Column name to read-only NumPy view.
+        """
+        file_index, start, records = self.__chunks[index]
+        data = self.__maps[file_index]
+        columns = {}
+        offset = start
+        for name, dtype, width in COLUMNS:
+            columns[name] = data[offset:offset + records * width].view(dtype)
+            offset += records * width
+        return columns
+
+    def iter_chunks(self):
+        """
+        Stream the whole capture one chunk at a time. Only the pages of the
+        chunk in use are resident, so memory stays bounded for any file size.
+
+        Yields:
+            dict: Column name to read-only NumPy view.
+        """
+        for index in range(len(self.__chunks)):
+            yield self.chunk(index)
+
+    def iter_range(self, start, end):
+        """
+        Stream the samples with start <= timestamp <= end, one chunk slice
+        at a time, without copying.
+
+        Args:
+            start (float or datetime): Window start.
+            end (float or datetime): Window end.
+
+        Yields:
+            dict: Column name to read-only NumPy view.
+        """
+        start = _seconds(start)
+        end = _seconds(end)
+        first = int(np.searchsorted(self.__t_last, start, side="left"))
+        last = int(np.searchsorted(self.__t_first, end, side="right"))
+        for index in range(first, last):
+            columns = self.chunk(index)
+            stamps = columns["timestamp"]
+            lo = int(np.searchsorted(stamps, start, side="left"))
+            hi = int(np.searchsorted(stamps, end, side="right"))
+            if hi > lo:
+                yield {name: column[lo:hi] for name, column in columns.items()}
+
+    def range(self, start, end):
+        """
+        Return the samples with start <= timestamp <= end. A window inside
+        one chunk is returned as views into the memory map; a window that
+        spans chunks is joined, copying only the samples in the window.
+
+        Args:
+            start (float or datetime): Window start.
+            end (float or datetime): Window end.
+
+        Returns:
+            dict: Column name to NumPy array.
+        """
+        parts = list(self.iter_range(start, end))
+        if len(parts) == 1:
+            return parts[0]
+        return {
+            name: np.concatenate([part[name] for part in parts]) if parts else np.empty(0, dtype=dtype)
+            for name, dtype, _ in COLUMNS
+        }
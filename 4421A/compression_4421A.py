@@ -0,0 +1,301 @@
+"""
+Example Description:
+        This example is a compression stage for Bird 4421A power histories.
+        Deadband and swinging-door trending keep only the points needed to
+        redraw forward and reflected power within a per-channel tolerance,
+        in Watts or percent, with a guaranteed maximum interval between
+        stored points, and reconstruct() turns the stored points back into
+        a regularly sampled series.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file compression_4421A.py
+
+"""
+import math
+
+import numpy as np
+
+METHODS = ("deadband", "swinging_door")
+
+
+def _tolerance(spec):
+    """A tolerance given as Watts (number) or percent ("2%") to (absolute, fraction)."""
+    if isinstance(spec, str) and spec.strip().endswith("%"):
+        return 0.0, float(spec.strip()[:-1]) / 100
+    return float(spec), 0.0
+
+
+class Compressor():
+    """Streaming compressor for one group of channels sampled together.
+
+    Every offered point carries one value per channel. A point is stored
+    for all channels at once, so the stored rows stay aligned; the test
+    that decides to store runs on each channel with its own tolerance,
+    and a percent tolerance is taken of the value stored last.
+
+    "deadband" stores a point as soon as any channel moves outside the
+    tolerance of the value stored last. Redrawn as a step (reconstruct
+    method "previous"), every dropped value is within the tolerance.
+
+    "swinging_door" keeps, per channel, the range of slopes from the
+    last stored point that pass within the tolerance of every point seen
+    since. When the line to a new value leaves that range on any
+    channel, the previous point is stored and becomes the new pivot. Redrawn with straight lines
+    (reconstruct method "linear"), every dropped value is within the
+    tolerance, and ramps cost two points instead of one per sample.
+
+    With either method consecutive stored points are never more than
+    max_interval seconds apart, as long as samples arrive at least that
+    often. A change between NaN and a number is always stored.
+    """
+    def __init__(self, tolerances, method:str="swinging_door", max_interval:float=60.0):
+        if method not in METHODS:
+            raise ValueError(f"unknown compression method: {method}")
+        self.__tolerances = [_tolerance(spec) for spec in tolerances]
+        self.__swinging_door = method == "swinging_door"
+        self.__max_interval = max_interval
+        self.__anchor = None
+        self.__previous = None
+        self.__widths = None
+        self.__upper = None
+        self.__lower = None
+
+        self.offered = 0
+        self.stored = 0
+
+    def __limits(self, anchor_values):
+        return [absolute + fraction * abs(value)
+                for (absolute, fraction), value in zip(self.__tolerances, anchor_values)]
+
+    def __store(self, point, out):
+        out.append(point)
+        self.stored += 1
+        self.__anchor = point
+        self.__widths = self.__limits(point[1])
+        self.__upper = [math.inf] * len(point[1])
+        self.__lower = [-math.inf] * len(point[1])
+
+    def __outside(self, point):
+        """True when point cannot be dropped relative to the current anchor."""
+        t, values = point
+        anchor_t, anchor_values = self.__anchor
+        dt = t - anchor_t
+        if dt <= 0:
+            return False
+        for i, (value, pivot, width) in enumerate(zip(values, anchor_values, self.__widths)):
+            if value != value or pivot != pivot:
+                # NaN to NaN is no change; NaN to a number or back is.
+                if (value != value) != (pivot != pivot):
+                    return True
+                continue
+            if not self.__swinging_door:
+                if abs(value - pivot) > width:
+                    return True
+                continue
+            # The segment may end here only if the line to this value
+            # passes within the tolerance of every point since the pivot.
+            slope = (value - pivot) / dt
+            if slope > self.__upper[i] or slope < self.__lower[i]:
+                return True
+            self.__upper[i] = min(self.__upper[i], (value + width - pivot) / dt)
+            self.__lower[i] = max(self.__lower[i], (value - width - pivot) / dt)
+        return False
+
+    def offer(self, timestamp:float, values):
+        """
+        Offer one point.
+
+        Args:
+            timestamp (float): Sample time in seconds.
+            values (sequence): One value per channel.
+
+        Returns:
+            list: (timestamp, values) points to store, oldest first; often empty.
+        """
+        point = (timestamp, tuple(values))
+        self.offered += 1
+        out = []
+        if self.__anchor is None:
+            self.__store(point, out)
+        elif self.__swinging_door:
+            if timestamp - self.__anchor[0] > self.__max_interval or self.__outside(point):
+                # Store the last point that still fitted and pivot on it,
+                # then re-check the new point against the new pivot.
+                if self.__previous is not self.__anchor:
+                    self.__store(self.__previous, out)
+                if timestamp - self.__anchor[0] > self.__max_interval or self.__outside(point):
+                    self.__store(point, out)
+        else:
+            if timestamp - self.__anchor[0] > self.__max_interval:
+                if self.__previous is not self.__anchor:
+                    self.__store(self.__previous, out)
+            if timestamp - self.__anchor[0] > self.__max_interval or self.__outside(point):
+                self.__store(point, out)
+        self.__previous = point
+        return out
+
+    def flush(self):
+        """
+        Return the last point offered if it has not been stored, so the end
+        of the series is kept.
+
+        Returns:
+            list: Zero or one (timestamp, values) points.
+        """
+        out = []
+        if self.__previous is not None and self.__previous is not self.__anchor:
+            self.__store(self.__previous, out)
+        return out
+
+
+class CompressingSink():
+    """Sink that compresses samples before passing them on to another sink.
+
+    It sits between a Sampler (or any other source calling
+    append(timestamp, sensor, forward, reflected)) and a storage sink such
+    as a CaptureLogWriter or PowerRingBuffer, with one Compressor per
+    sensor. tolerance is one spec for both channels or a dict with
+    "forward" and "reflected" specs, each in Watts (0.5) or percent ("2%").
+    """
+    def __init__(self, sink, tolerance=0.1, method:str="swinging_door", max_interval:float=60.0):
+        if not isinstance(tolerance, dict):
+            tolerance = {"forward": tolerance, "reflected": tolerance}
+        self.__sink = sink
+        self.__tolerances = (tolerance["forward"], tolerance["reflected"])
+        self.__method = method
+        self.__max_interval = max_interval
+        self.__compressors = {}
+        # Fail on a bad method or tolerance now rather than on the first sample.
+        Compressor(self.__tolerances, method, max_interval)
+
+    @property
+    def offered(self):
+        return sum(c.offered for c in self.__compressors.values())
+
+    @property
+    def stored(self):
+        return sum(c.stored for c in self.__compressors.values())
+
+    def stats(self):
+        """Reports how many samples came in and how many were stored.
+
+        Returns:
+            dict: Offered and stored counts and the compression ratio.
+        """
+        offered = self.offered
+        stored = self.stored
+        return {"offered": offered, "stored": stored, "ratio": offered / stored if stored else 0.0}
+
+    def __forward(self, sensor:int, points):
+        for timestamp, (forward, reflected) in points:
+            self.__sink.append(timestamp, sensor, forward, reflected)
+
+    def append(self, timestamp:float, sensor:int, forward:float, reflected:float):
+        compressor = self.__compressors.get(sensor)
+        if compressor is None:
+            compressor = Compressor(self.__tolerances, self.__method, self.__max_interval)
+            self.__compressors[sensor] = compressor
+        points = compressor.offer(timestamp, (forward, reflected))
+        if points:
+            self.__forward(sensor, points)
+
+    def flush(self):
+        """Passes on the latest pending sample of each sensor, then flushes
+        the wrapped sink if it can be flushed.
+        """
+        for sensor, compressor in self.__compressors.items():
+            self.__forward(sensor, compressor.flush())
+        if hasattr(self.__sink, "flush"):
+            self.__sink.flush()
+
+    def close(self):
+        self.flush()
+        if hasattr(self.__sink, "close"):
+            self.__sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def compress(timestamps, *channels, tolerance=0.1, method:str="swinging_door",
+             max_interval:float=60.0):
+    """
+    Compress recorded columns, for example from a CaptureLogReader.
+
+    Args:
+        timestamps (array): Sample times in seconds.
+        *channels (array): One array per channel, such as forward and reflected.
+        tolerance: One spec for every channel, or a sequence with one per channel.
+        method (str, optional): "deadband" or "swinging_door". Defaults to "swinging_door".
+        max_interval (float, optional): Longest gap between stored points. Defaults to 60.
+
+    Returns:
+        numpy.ndarray: Indices of the samples to keep.
+    """
+    if isinstance(tolerance, (str, int, float)):
+        tolerance = [tolerance] * len(channels)
+    compressor = Compressor(tolerance, method, max_interval)
+    kept = []
+    i = -1
+    for i, row in enumerate(zip(timestamps, *channels)):
+        point_time = float(row[0])
+        # A stored point is either this sample or the one before it.
+        for t, _ in compressor.offer(point_time, row[1:]):
+            kept.append(i if t == point_time else i - 1)
+    if compressor.flush():
+        kept.append(i)
+    return np.array(kept, dtype=np.int64)
+
+
+def reconstruct(timestamps, values, times, method:str="linear"):
+    """
+    Redraw a compressed series at the requested times.
+
+    Args:
+        timestamps (array): Stored sample times, ascending.
+        values (array): Stored values.
+        times (array): Times to evaluate at.
+        method (str, optional): "linear" for swinging-door data, or
+            "previous" to hold each stored value, for deadband data.
+            Defaults to "linear".
+
+    Returns:
+        numpy.ndarray: The values at times.
+    """
+    timestamps = np.asarray(timestamps, dtype=float)
+    values = np.asarray(values, dtype=float)
+    times = np.asarray(times, dtype=float)
+    if method == "linear":
+        return np.interp(times, timestamps, values)
+    if method == "previous":
+        index = np.searchsorted(timestamps, times, side="right") - 1
+        return values[np.clip(index, 0, len(values) - 1)]
+    raise ValueError(f"unknown reconstruction method: {method}")
@@ -0,0 +1,433 @@
+"""
+Example Description:
+        This example is a pure-Python emulator of the Bird 4421A
+        Multifuntion Power Meter SCPI socket. It answers the commands used
+        by Series4421A with synthetic power waveforms, and can add
+        per-command latency, jitter, dropped or garbled replies and
+        connection resets so driver throughput and recovery can be tested
+        without a real meter.
+
+        python emulator_4421A.py --port 5025 --latency-ms 2 --jitter-ms 0.5 --drop 0.001
+
+        The same command set is available to pyvisa-sim through
+        emulator_4421A.yaml; see sim_resource_manager().
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file emulator_4421A.py
+
+"""
+import argparse
+import math
+import os
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+SCPI_PORT = 5025
+SIM_DEFINITION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emulator_4421A.yaml")
+SIM_RESOURCE = "TCPIP0::127.0.0.1::5025::SOCKET"
+
+# Long form to short form for every SCPI node the emulator understands.
+_LONG_FORMS = {
+    "MEASURE": "MEAS",
+    "AVERAGE": "AVER",
+    "REFLECTED": "REFL",
+    "SYSTEM": "SYST",
+    "ERROR": "ERR",
+    "NEXT": "NEXT",
+    "IDENTITY": "IDEN",
+    "FWREVISION": "FWR",
+    "MODEL": "MOD",
+    "PRESET": "PRES",
+    "VERSION": "VERS",
+    "COMMUNICATE": "COMM",
+    "SERIAL": "SER",
+}
+
+BAUD_RATES = (1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200)
+
+
+def sim_resource_manager():
+    """
+    Returns a pyvisa ResourceManager backed by pyvisa-sim and the bundled
+    4421A definition, on which SIM_RESOURCE and ASRL4::INSTR can be opened.
+    """
+    import pyvisa
+
+    return pyvisa.ResourceManager(f"{SIM_DEFINITION}@sim")
+
+
+# Latency distributions. Each returns a callable giving a delay in seconds.
+
+def constant_latency(seconds:float):
+    return lambda rng: seconds
+
+
+def uniform_latency(low:float, high:float):
+    return lambda rng: rng.uniform(low, high)
+
+
+def normal_latency(mean:float, jitter:float):
+    return lambda rng: max(0.0, rng.gauss(mean, jitter))
+
+
+def lognormal_latency(median:float, sigma:float):
+    # Long right tail, as seen on busy networks.
+    return lambda rng: median * math.exp(rng.gauss(0.0, sigma))
+
+
+# Power waveforms. Each returns a callable (t, sensor, rng) -> (forward, reflected) in Watts.
+
+def constant_power(forward:float=100.0, reflected:float=1.0):
+    return lambda t, sensor, rng: (forward, reflected)
+
+
+def sine_power(mean:float=100.0, amplitude:float=5.0, period:float=10.0,
+               reflection:float=0.01, noise:float=0.0):
+    def waveform(t, sensor, rng):
+        fwd = mean + amplitude * math.sin(2 * math.pi * t / period) + rng.gauss(0.0, noise)
+        return fwd, fwd * reflection
+    return waveform
+
+
+def step_power(levels=(0.0, 50.0, 100.0), dwell:float=5.0, reflection:float=0.01):
+    def waveform(t, sensor, rng):
+        fwd = levels[int(t // dwell) % len(levels)]
+        return fwd, fwd * reflection
+    return waveform
+
+
+class Faults():
+    """Per-reply fault probabilities.
+
+    Args:
+        drop (float): The reply is never sent.
+        garble (float): The reply is replaced with corrupted text.
+        reset (float): The connection is reset instead of replying.
+    """
+    def __init__(self, drop:float=0.0, garble:float=0.0, reset:float=0.0):
+        self.drop = drop
+        self.garble = garble
+        self.reset = reset
+
+
+class _ConnectionReset(Exception):
+    pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.clients.add(self.request)
+
+    def finish(self):
+        self.server.clients.discard(self.request)
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def handle(self):
+        emulator = self.server.emulator
+        emulator.connections += 1
+        try:
+            for line in self.rfile:
+                reply = emulator.execute(line.decode(errors="replace").strip())
+                if reply is not None:
+                    self.wfile.write(reply)
+        except _ConnectionReset:
+            # SO_LINGER with a zero timeout turns close() into a TCP RST.
+            self.request.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        except (ConnectionError, OSError):
+            pass
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, *args, **kwargs):
+        self.clients = set()
+        super().__init__(*args, **kwargs)
+
+
+class Emulator4421A():
+    """A TCP stand-in for the 4421A SCPI socket.
+
+    Supported commands: *IDN?, *RST, *CLS, *OPC?, MEAS:AVER? [n],
+    MEAS:REFL:AVER? [n], SYST:ERR?, SYST:IDEN:FWR?, SYST:IDEN:MOD?,
+    SYST:IDEN:SN?, SYST:VERS?, SYST:PRES and SYST:COMM:SER:BAUD[?] (which
+    only records the rate), in short or long form, and
+    compound commands joined with ";" (a leading ":" returns to the root).
+    Unknown commands queue a -113 error for SYST:ERR?.
+
+    latency is a distribution (see constant_latency and friends) applied
+    before every reply, or a dict of them keyed by command header such as
+    "MEAS:AVER?", with "*" as the default. waveform gives the power on
+    each sensor at the time of the query; with update_interval set, each
+    reading is held for that many seconds, as the meter holds its
+    averaged value between updates. faults sets the drop, garble and
+    reset probabilities. All randomness comes from one seeded
+    generator, so runs are repeatable.
+    """
+    def __init__(self, host:str="127.0.0.1", port:int=SCPI_PORT,
+                 idn:str="Bird Electronic Corporation,4421A,EMU00001,1.0.0",
+                 latency=None, waveform=None, faults:Faults=None, seed:int=None,
+                 update_interval:float=None):
+        self.__host = host
+        self.__port = port
+        self.__idn = idn
+        self.__latency = latency if isinstance(latency, dict) else {"*": latency}
+        self.__waveform = waveform or sine_power()
+        self.__update_interval = update_interval
+        self.__held = {}
+        self.__faults = faults or Faults()
+        self.__rng = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__errors = []
+        self.__baud_rate = 9600
+        self.__start = time.monotonic()
+        self.__server = None
+        self.__thread = None
+
+        self.connections = 0
+        self.commands = 0
+        self.replies = 0
+        self.dropped = 0
+        self.garbled = 0
+        self.resets = 0
+
+    @property
+    def baud_rate(self):
+        """The serial baud rate last set with SYST:COMM:SER:BAUD.
+        """
+        return self.__baud_rate
+
+    @property
+    def address(self):
+        """The (host, port) the emulator is listening on.
+        """
+        return self.__server.server_address if self.__server else (self.__host, self.__port)
+
+    @property
+    def resource_string(self):
+        host, port = self.address
+        return f"TCPIP0::{host}::{port}::SOCKET"
+
+    def stats(self):
+        return {
+            "connections": self.connections,
+            "commands": self.commands,
+            "replies": self.replies,
+            "dropped": self.dropped,
+            "garbled": self.garbled,
+            "resets": self.resets,
+        }
+
+    def start(self):
+        """Starts listening on a background thread. Port 0 picks a free port.
+        """
+        self.__server = _Server((self.__host, self.__port), _Handler)
+        self.__server.emulator = self
+        self.__thread = threading.Thread(target=self.__server.serve_forever,
+                                         name="emulator4421A", daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stops listening and drops every open connection, as a meter
+        that is switched off or unplugged would.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            for client in list(self.__server.clients):
+                try:
+                    client.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self.__server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def serve_forever(self):
+        self.start()
+        try:
+            self.__thread.join()
+        except KeyboardInterrupt:
+            self.stop()
+
+    @staticmethod
+    def __canonical(header:str):
+        return ":".join(_LONG_FORMS.get(node, node) for node in header.upper().split(":"))
+
+    def __power(self, sensor:int):
+        t = time.monotonic() - self.__start
+        with self.__lock:
+            if not self.__update_interval:
+                return self.__waveform(t, sensor, self.__rng)
+            update = int(t // self.__update_interval)
+            held = self.__held.get(sensor)
+            if held is None or held[0] != update:
+                held = self.__held[sensor] = (
+                    update, self.__waveform(update * self.__update_interval, sensor, self.__rng)
+                )
+            return held[1]
+
+    def __answer(self, header:str, args:str):
+        sensor = int(args) if args.strip().isdigit() else 1
+        if header == "*IDN?":
+            return self.__idn
+        if header in ("*RST", "*CLS", "SYST:PRES"):
+            if header == "*CLS":
+                self.__errors.clear()
+            return None
+        if header == "*OPC?":
+            return "1"
+        if header == "MEAS:AVER?":
+            return f"{self.__power(sensor)[0]:.6E}"
+        if header == "MEAS:REFL:AVER?":
+            return f"{self.__power(sensor)[1]:.6E}"
+        if header in ("SYST:ERR?", "SYST:ERR:NEXT?"):
+            return self.__errors.pop(0) if self.__errors else '0,"No error"'
+        if header == "SYST:IDEN:MOD?":
+            return self.__idn.split(",")[1]
+        if header == "SYST:IDEN:SN?":
+            return self.__idn.split(",")[2]
+        if header == "SYST:IDEN:FWR?":
+            return self.__idn.split(",")[3]
+        if header == "SYST:VERS?":
+            return "1999.0"
+        if header == "SYST:COMM:SER:BAUD?":
+            return f"{self.__baud_rate}"
+        if header == "SYST:COMM:SER:BAUD":
+            if args.strip().isdigit() and int(args) in BAUD_RATES:
+                self.__baud_rate = int(args)
+            else:
+                self.__errors.append('-222,"Data out of range"')
+            return None
+        self.__errors.append('-113,"Undefined header"')
+        return None
+
+    def __delay(self, headers):
+        dist = None
+        for header in headers:
+            dist = self.__latency.get(header) or dist
+        dist = dist or self.__latency.get("*")
+        if dist is None:
+            return
+        with self.__lock:
+            delay = dist(self.__rng)
+        if delay > 0:
+            time.sleep(delay)
+
+    def execute(self, line:str):
+        """
+        Run one command line and return the encoded reply, or None.
+
+        Args:
+            line (str): One SCPI command line, without terminator.
+
+        Returns:
+            bytes: The reply line including its terminator, or None.
+        """
+        self.commands += 1
+        answers = []
+        headers = []
+        path = ""
+        for part in line.split(";"):
+            part = part.strip()
+            if not part:
+                continue
+            header, _, args = part.partition(" ")
+            if header.startswith(":") or header.startswith("*"):
+                header = header.lstrip(":")
+            elif path:
+                header = f"{path}:{header}"
+            header = self.__canonical(header)
+            path = header.rpartition(":")[0] if not header.startswith("*") else path
+            headers.append(header)
+            answer = self.__answer(header, args)
+            if answer is not None:
+                answers.append(answer)
+
+        if not answers:
+            return None
+        self.__delay(headers)
+
+        with self.__lock:
+            roll = self.__rng.random()
+        faults = self.__faults
+        if roll < faults.reset:
+            self.resets += 1
+            raise _ConnectionReset()
+        roll -= faults.reset
+        if roll < faults.drop:
+            self.dropped += 1
+            return None
+        roll -= faults.drop
+        reply = ";".join(answers)
+        if roll < faults.garble:
+            self.garbled += 1
+            with self.__lock:
+                reply = "".join(self.__rng.choice("#?!x0.E") for _ in reply)
+        self.replies += 1
+        return f"{reply}\n".encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bird 4421A SCPI socket emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SCPI_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--drop", type=float, default=0.0)
+    parser.add_argument("--garble", type=float, default=0.0)
+    parser.add_argument("--reset", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    latency = None
+    if args.latency_ms or args.jitter_ms:
+        latency = normal_latency(args.latency_ms / 1000, args.jitter_ms / 1000)
+    emulator = Emulator4421A(args.host, args.port, latency=latency,
+                             faults=Faults(args.drop, args.garble, args.reset), seed=args.seed)
+    print(f"4421A emulator listening on {args.host}:{args.port}")
+    emulator.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -79,12 +79,8 @@ while(not is_at_time_Limit):
     x.append(dt)
     y.append(float(my4421A.query("MEAS:AVER? 1\n").rstrip()))
     
-    # remove older graph
-    graph.remove()
-
-    # create a new graph or updating the graph
-    # plotting newer graph
-    graph = plt.plot(x,y,color = 'g')[0]
+    # update the existing graph in place
+    graph.set_data(x, y)
     plt.xlim(x[0], x[-1])
      
     # calling pause function for 0.25 seconds
@@ -71,8 +71,8 @@ COLOR_REV_W = "#3399e6"
 fig, ax1 = plt.subplots(figsize=(8, 8))
 ax2 = ax1.twinx()
 
-ax1.plot(x, y1, color=COLOR_FWD_W, lw=1) # lw = 3
-ax2.plot(x, y2, color=COLOR_REV_W, lw=1)
+fwd_line = ax1.plot(x, y1, color=COLOR_FWD_W, lw=1)[0] # lw = 3
+rev_line = ax2.plot(x, y2, color=COLOR_REV_W, lw=1)[0]
 
 ax1.set_ylim(0, 120e-3)
 ax2.set_ylim(0, 10e-3)
@@ -97,9 +97,9 @@ while(not is_at_time_Limit):
     y1.append(float(my4421A.query("MEAS:AVER? 1\n").rstrip()))
     y2.append(float(my4421A.query("MEAS:REFL:AVER? 1\n").rstrip()))
     
-    # update the lists passed to the axes
-    ax1.plot(x, y1, color=COLOR_FWD_W, lw=3)
-    ax2.plot(x, y2, color=COLOR_REV_W, lw=4)
+    # update the existing lines in place rather than adding new ones
+    fwd_line.set_data(x, y1)
+    rev_line.set_data(x, y2)
     plt.xlim(x[0], x[-1])
      
     # calling pause function for 0.25 seconds; this forces an update
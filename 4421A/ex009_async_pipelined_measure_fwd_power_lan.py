@@ -0,0 +1,67 @@
+"""
+Example Description:
+        This example shows how to connect to the 4421A with the asyncio
+        driver, then pipeline forward and reflected power queries on a
+        single socket connection.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex009_async_pipelined_measure_fwd_power_lan.py
+ 
+"""
+import asyncio
+import time
+
+from async_series_4421A import AsyncSeries4421A
+
+IPADDR = "192.168.1.44"
+SENSOR = 1
+SAMPLES = 100
+
+
+async def main():
+    mysensor = AsyncSeries4421A(IPADDR)
+    await mysensor.connect(timeout=5000)
+
+    print(await mysensor.idn())
+
+    # Queue every reading before waiting on any of them; the replies come
+    # back in order as fast as the meter and the wire allow.
+    t1 = time.perf_counter()
+    readings = await asyncio.gather(
+        *(mysensor.measure.power(SENSOR) for _ in range(SAMPLES))
+    )
+    dt = time.perf_counter() - t1
+
+    for fwd, rfl in readings[-5:]:
+        print(f"FWD Power:\t{fwd} W\nRFL Power:\t{rfl} W")
+    print(f"{SAMPLES} readings in {dt:0.3f} s ({SAMPLES / dt:0.1f} readings/s)")
+
+    await mysensor.disconnect()
+
+
+asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+Example Description:
+        This example shows how to poll several 4421A meters concurrently
+        and print one merged stream of forward and reflected power readings
+        along with the per-meter health statistics.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex010_fleet_poll_fwd_and_rev_power_lan_interface.py
+ 
+"""
+from fleet_4421A import Fleet4421A
+
+MYSENSORS = [
+    "TCPIP0::192.168.1.44::5025::SOCKET",
+    "TCPIP0::192.168.1.45::5025::SOCKET",
+    "TCPIP0::192.168.1.46::5025::SOCKET",
+]
+
+fleet = Fleet4421A(MYSENSORS, sensors=(1, 2), max_workers=len(MYSENSORS),
+                   timeout=5000, cycle_timeout=1.0)
+fleet.connect()
+
+for sample in fleet.stream(period=0.5, cycles=20):
+    print(f"{sample.timestamp:0.3f}\t{sample.meter}\tsensor {sample.sensor}\t"
+          f"FWD {sample.forward:0.3f} W\tRFL {sample.reflected:0.3f} W")
+
+for health in fleet.health.values():
+    print(health.as_dict())
+
+fleet.disconnect()
@@ -0,0 +1,58 @@
+"""
+Example Description:
+        This example shows how to compile a scan list that reads forward
+        and reflected power from both sensor channels of the 4421A in a
+        single SCPI round trip, then run it repeatedly.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex011_scan_list_fwd_and_rev_power_both_sensors.py
+ 
+"""
+import time
+
+from series_4421A import Series4421A
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::192.168.1.44::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+# Build the compound query once, outside of the sampling loop.
+scan = mysensor.measure.scan_list(sensors=(1, 2), quantities=("forward", "reflected"))
+print(f"Scan command:\t{scan.command}")
+
+t1 = time.perf_counter()
+for j in range(0, 100):
+    reading = scan.run()
+    print(f"S1 FWD = {reading.forward_1:0.3f} W, S1 RFL = {reading.reflected_1:0.3f} W, "
+          f"S2 FWD = {reading.forward_2:0.3f} W, S2 RFL = {reading.reflected_2:0.3f} W")
+dt = time.perf_counter() - t1
+print(f"100 scans in {dt:0.3f} s")
+
+mysensor.disconnect()
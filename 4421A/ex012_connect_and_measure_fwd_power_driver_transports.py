@@ -0,0 +1,59 @@
+"""
+Example Description:
+        This example shows how to connect the 4421A driver over a raw
+        socket or a pyserial port instead of VISA, then query its measured
+        forward and reflected power values.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex012_connect_and_measure_fwd_power_driver_transports.py
+ 
+"""
+from series_4421A import Series4421A
+from transports_4421A import SocketTransport, SerialTransport
+
+USE_SERIAL = False
+
+mysensor = Series4421A()
+
+if USE_SERIAL:
+    mytransport = SerialTransport("COM11", baud_rate=9600, data_bits=8, parity="N", stop_bits=1)
+else:
+    mytransport = SocketTransport("192.168.1.44", 5025)
+
+mysensor.connect(timeout=5000, transport=mytransport)
+
+print(mysensor.idn)
+
+SENSOR = 1
+
+for j in range(0, 100):
+    fwd = mysensor.measure.forward_power(SENSOR)
+    rfl = mysensor.measure.reflected_power(SENSOR)
+    print(f"Forward = {fwd:0.2f} W, Reflected = {rfl:0.2f} W")
+
+mysensor.disconnect()
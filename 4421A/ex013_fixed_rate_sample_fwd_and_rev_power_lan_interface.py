@@ -0,0 +1,59 @@
+"""
+Example Description:
+        This example shows how to sample the 4421A forward and reflected
+        power at a fixed rate with the streaming sampler, and report how
+        many sample ticks overran or were dropped.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex013_fixed_rate_sample_fwd_and_rev_power_lan_interface.py
+ 
+"""
+from series_4421A import Series4421A
+from sampler_4421A import Sampler
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::192.168.1.44::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+RATE_HZ = 20
+TIME_LIMIT_S = 36
+
+sampler = Sampler(mysensor, RATE_HZ, sensors=(1,), overrun="skip",
+                  backpressure="drop", count=RATE_HZ * TIME_LIMIT_S)
+
+t1 = None
+for sample in sampler:
+    if t1 is None:
+        t1 = sample.monotonic
+    print(f"{sample.monotonic - t1:8.3f} s\tFWD {sample.forward:0.3f} W\tRFL {sample.reflected:0.3f} W")
+
+print(sampler.stats())
+
+mysensor.disconnect()
@@ -0,0 +1,68 @@
+"""
+Example Description:
+        This example shows how to capture 4421A forward and reflected power
+        continuously into a fixed-memory ring buffer, then pull the most
+        recent window of samples back out for display.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex014_continuous_capture_to_ring_buffer_lan_interface.py
+ 
+"""
+import time
+
+from series_4421A import Series4421A
+from sampler_4421A import Sampler
+from ringbuffer_4421A import PowerRingBuffer
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::192.168.1.44::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+RATE_HZ = 20
+WINDOW_S = 10
+
+# One week at 20 samples per second on one sensor, in constant memory.
+capture = PowerRingBuffer(RATE_HZ * 60 * 60 * 24 * 7)
+print(f"Ring buffer size:\t{capture.nbytes / 1e6:0.1f} MB")
+
+sampler = Sampler(mysensor, RATE_HZ, sensors=(1,), max_queue=0, sink=capture)
+sampler.start()
+
+for j in range(0, 12):
+    time.sleep(WINDOW_S)
+    window = capture.last_seconds(WINDOW_S)
+    print(f"Last {WINDOW_S} s: {len(window)} samples, "
+          f"FWD mean {window['forward'].mean():0.3f} W, "
+          f"RFL max {window['reflected'].max():0.3f} W")
+
+sampler.stop()
+print(sampler.stats())
+
+mysensor.disconnect()
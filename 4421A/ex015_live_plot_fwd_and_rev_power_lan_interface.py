@@ -0,0 +1,81 @@
+"""
+Example Description:
+        This example shows how to sample the 4421A forward and reflected
+        power into a ring buffer and display the whole capture with the
+        constant-cost live plot, which decimates the data to the screen
+        width and redraws only the power traces each frame.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex015_live_plot_fwd_and_rev_power_lan_interface.py
+ 
+"""
+import time
+
+import matplotlib.pyplot as plt
+
+from series_4421A import Series4421A
+from sampler_4421A import Sampler
+from ringbuffer_4421A import PowerRingBuffer
+from liveplot_4421A import LivePowerPlot
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::172.100.0.79::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+RATE_HZ = 20
+TIME_LIMIT_S = 36
+
+capture = PowerRingBuffer(RATE_HZ * TIME_LIMIT_S * 2)
+sampler = Sampler(mysensor, RATE_HZ, sensors=(1,), max_queue=0, sink=capture)
+
+plot = LivePowerPlot("4421A Forward Power Sampling")
+plt.show(block=False)
+
+sampler.start()
+t1 = None
+plotted = 0
+while sampler.running:
+    # Hand only the samples captured since the last frame to the plot.
+    total = capture.total
+    new = capture.latest(total - plotted, end=total)
+    plotted = total
+    if len(new):
+        if t1 is None:
+            t1 = new["timestamp"][0]
+        plot.extend(new["timestamp"] - t1, new["forward"], new["reflected"])
+        plot.refresh()
+    plt.pause(0.05)
+    if t1 is not None and time.time() - t1 >= TIME_LIMIT_S:
+        sampler.stop()
+
+# Save the data plot to file
+output_data_path = time.strftime("power_capture_%Y-%m-%d_%H-%M-%S.png")
+plot.save("C:\\Temp\\" + output_data_path)
+mysensor.disconnect()
@@ -0,0 +1,56 @@
+"""
+Example Description:
+        This example shows how to run the live power monitor, which samples
+        the 4421A on a background thread and redraws the forward and
+        reflected power plot at its own, independently set frame rate.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex016_live_monitor_fwd_and_rev_power_lan_interface.py
+ 
+"""
+from series_4421A import Series4421A
+from monitor_4421A import LivePowerMonitor
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::172.100.0.79::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+SAMPLE_RATE_HZ = 50
+FRAME_RATE_HZ = 10
+TIME_LIMIT_S = 36
+
+monitor = LivePowerMonitor(mysensor, sample_rate_hz=SAMPLE_RATE_HZ,
+                           frame_rate_hz=FRAME_RATE_HZ, sensor=1,
+                           fwd_ylim=(0, 120e-3), refl_ylim=(0, 10e-3))
+monitor.run(duration=TIME_LIMIT_S)
+
+print(monitor.stats())
+
+mysensor.disconnect()
@@ -0,0 +1,64 @@
+"""
+Example Description:
+        This example shows how to record 4421A forward and reflected power
+        at full rate into rotating binary capture log files instead of
+        keeping only a PNG of the plot.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex017_log_fwd_and_rev_power_to_capture_files_lan_interface.py
+ 
+"""
+import time
+
+from series_4421A import Series4421A
+from sampler_4421A import Sampler
+from capturelog_4421A import CaptureLogWriter
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::172.100.0.79::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+RATE_HZ = 50
+TIME_LIMIT_S = 3600
+
+# Roll over to a new file every hour or every 64 MB, whichever comes first.
+writer = CaptureLogWriter("C:\\Temp\\4421A_captures", idn=mysensor.idn, sensor=1,
+                          max_bytes=64 * 1024 * 1024, max_seconds=3600)
+
+sampler = Sampler(mysensor, RATE_HZ, sensors=(1,), max_queue=0, sink=writer)
+sampler.start()
+time.sleep(TIME_LIMIT_S)
+sampler.stop()
+
+writer.close()
+print(sampler.stats())
+print(f"{writer.records} samples in {writer.chunks} chunks across {len(writer.files)} file(s)")
+
+mysensor.disconnect()
@@ -0,0 +1,56 @@
+"""
+Example Description:
+        This example shows how to pull a time window of forward and
+        reflected power out of a directory of 4421A capture log files
+        without loading the rest of the capture.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex018_read_capture_window.py
+ 
+"""
+from datetime import datetime
+
+from capturereader_4421A import CaptureLogReader
+
+CAPTURE_DIR = "C:\\Temp\\4421A_captures"
+
+captures = CaptureLogReader(CAPTURE_DIR)
+print(f"{len(captures)} samples in {captures.chunk_count} chunks")
+for meta in captures.meta:
+    print(f"{meta['path']}\t{meta['idn']}\tsensor {meta['sensor']}")
+
+# The window around an event.
+window = captures.range(datetime(2026, 3, 2, 13, 2), datetime(2026, 3, 2, 13, 5))
+print(f"Window:\t{len(window['timestamp'])} samples, "
+      f"FWD max {window['forward'].max():0.3f} W, RFL max {window['reflected'].max():0.3f} W")
+
+# Whole-capture statistics, streamed one chunk at a time.
+peak = 0.0
+for chunk in captures.iter_chunks():
+    peak = max(peak, float(chunk["reflected"].max()))
+print(f"Peak reflected power:\t{peak:0.3f} W")
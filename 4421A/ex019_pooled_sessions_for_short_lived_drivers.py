@@ -0,0 +1,59 @@
+"""
+Example Description:
+        This example shows how many short-lived 4421A driver objects can
+        share one VISA resource manager and reuse warm sessions from the
+        session pool instead of opening a new session for every test step.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex019_pooled_sessions_for_short_lived_drivers.py
+ 
+"""
+import time
+
+from series_4421A import Series4421A
+from pool_4421A import SessionPool
+
+MYSENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+
+mypool = SessionPool(max_sessions=8, idle_timeout=60.0, check_after=10.0)
+
+t1 = time.perf_counter()
+for step in range(0, 100):
+    # Each test step builds its own driver; connect() checks out the warm
+    # session and disconnect() hands it back to the pool.
+    mysensor = Series4421A(MYSENSOR, pool=mypool)
+    mysensor.connect(timeout=5000)
+    fwd = mysensor.measure.forward_power(1)
+    mysensor.disconnect()
+dt = time.perf_counter() - t1
+
+print(f"Last FWD Power:\t{fwd} W")
+print(f"100 connect/measure/disconnect cycles in {dt:0.3f} s")
+print(mypool.stats())
+
+mypool.close()
@@ -0,0 +1,64 @@
+"""
+Example Description:
+        This example shows how to run identical 4421A driver code over the
+        VISA, raw socket and pyserial transport backends and compare how
+        many forward power readings per second each one delivers.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex020_compare_transport_backends.py
+ 
+"""
+import time
+
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SERIAL_SENSOR = "ASRL4::INSTR"
+READINGS = 200
+
+setups = [
+    ("visa (LAN)", LAN_SENSOR, "visa", {}),
+    ("socket (LAN)", LAN_SENSOR, "socket", {}),
+    ("visa (RS232)", SERIAL_SENSOR, "visa", {"baud_rate": 9600}),
+    ("serial (RS232)", SERIAL_SENSOR, "serial", {"baud_rate": 9600}),
+]
+
+for name, resource, backend, settings in setups:
+    mysensor = Series4421A(resource, backend=backend)
+    mysensor.connect(timeout=5000, **settings)
+    if mysensor.measure is None:
+        print(f"{name}:\tnot connected")
+        continue
+
+    t1 = time.perf_counter()
+    for j in range(0, READINGS):
+        mysensor.measure.forward_power(1)
+    dt = time.perf_counter() - t1
+
+    print(f"{name}:\t{READINGS / dt:8.1f} readings/s\t{dt / READINGS * 1000:6.2f} ms/reading")
+    mysensor.disconnect()
@@ -0,0 +1,72 @@
+"""
+Example Description:
+        This example shows how to run the 4421A driver against the bundled
+        emulator instead of a real meter, first on a clean link and then
+        with latency, jitter and dropped, garbled and reset replies, and
+        count how the driver copes.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex021_emulated_meter_with_fault_injection.py
+ 
+"""
+import time
+
+from emulator_4421A import Emulator4421A, Faults, normal_latency, sine_power
+from series_4421A import Series4421A
+
+READINGS = 200
+
+setups = [
+    ("clean", Faults()),
+    ("lossy", Faults(drop=0.01, garble=0.01, reset=0.005)),
+]
+
+for name, faults in setups:
+    emulator = Emulator4421A(port=0, latency=normal_latency(0.002, 0.0005),
+                             waveform=sine_power(mean=100.0, amplitude=10.0, period=2.0),
+                             faults=faults, seed=4421)
+    with emulator:
+        mysensor = Series4421A(emulator.resource_string, backend="socket")
+        mysensor.connect(timeout=100)
+        print(f"{name}: {mysensor.idn}")
+
+        good = errors = 0
+        t1 = time.perf_counter()
+        for j in range(0, READINGS):
+            try:
+                fwd = mysensor.measure.forward_power(1)
+                good += 1
+            except (TimeoutError, ConnectionError, ValueError):
+                # Reconnect to get back to a known state after any fault.
+                errors += 1
+                mysensor.disconnect()
+                mysensor.connect(timeout=100)
+        dt = time.perf_counter() - t1
+        mysensor.disconnect()
+
+        print(f"{name}:\t{good} good, {errors} errors, {READINGS / dt:8.1f} readings/s")
+        print(f"{name}:\t{emulator.stats()}")
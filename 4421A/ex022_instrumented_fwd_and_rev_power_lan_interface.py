@@ -0,0 +1,63 @@
+"""
+Example Description:
+        This example shows how to turn on the driver's I/O instrumentation
+        for a LAN connected Bird 4421A Multifuntion Power Meter and print
+        per-command call counts, bytes and latency percentiles.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex022_instrumented_fwd_and_rev_power_lan_interface.py
+ 
+"""
+import json
+
+from instrumentation_4421A import Instrumentation
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SENSOR = 1
+
+stats = Instrumentation()
+
+# Log any call slower than 50 ms as it happens.
+def slow_call(command, start_ns, end_ns, bytes_out, bytes_in, error):
+    if end_ns - start_ns > 50e6 or error is not None:
+        print(f"{command}: {(end_ns - start_ns) / 1e6:.1f} ms {error or ''}")
+
+stats.hooks.append(slow_call)
+
+mysensor = Series4421A(LAN_SENSOR, instrumentation=stats)
+mysensor.connect(timeout=5000)
+
+print(mysensor.idn)
+
+for j in range(0, 100):
+    fwd = mysensor.measure.forward_power(SENSOR)
+    rfl = mysensor.measure.reflected_power(SENSOR)
+
+mysensor.disconnect()
+
+print(json.dumps(stats.snapshot(), indent=2))
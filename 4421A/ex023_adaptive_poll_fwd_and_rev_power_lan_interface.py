@@ -0,0 +1,59 @@
+"""
+Example Description:
+        This example shows how to read forward and reflected power from a
+        LAN connected Bird 4421A Multifuntion Power Meter with the adaptive
+        poller, which reads only as often as the meter produces new
+        averaged values.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex023_adaptive_poll_fwd_and_rev_power_lan_interface.py
+ 
+"""
+from adaptive_4421A import AdaptivePoller
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SENSOR = 1
+
+mysensor = Series4421A(LAN_SENSOR)
+mysensor.connect(timeout=5000)
+
+print(mysensor.idn)
+
+poller = AdaptivePoller(mysensor, sensors=(SENSOR,), min_interval=0.02, max_interval=2.0)
+
+for j, sample in enumerate(poller):
+    interval = poller.update_interval
+    estimate = "estimating" if interval is None else f"{interval * 1000:0.0f} ms"
+    print(f"Forward = {sample.forward:0.2f} W, Reflected = {sample.reflected:0.2f} W, "
+          f"meter update interval {estimate}")
+    if j >= 100:
+        poller.stop()
+
+print(poller.stats())
+
+mysensor.disconnect()
@@ -0,0 +1,79 @@
+"""
+Example Description:
+        This example shows how to log forward and reflected power from a
+        LAN connected Bird 4421A Multifuntion Power Meter through a
+        swinging-door compression stage, so a stable transmitter stores a
+        few points per minute instead of every sample, and how to redraw
+        the full-rate series from the stored points.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex024_compressed_capture_fwd_and_rev_power_lan_interface.py
+ 
+"""
+import time
+
+import numpy as np
+
+from capturelog_4421A import CaptureLogWriter
+from capturereader_4421A import CaptureLogReader
+from compression_4421A import CompressingSink, reconstruct
+from sampler_4421A import Sampler
+from series_4421A import Series4421A
+
+CAPTURE_DIR = "C:\\Temp\\4421A_compressed"
+RATE_HZ = 50
+TIME_LIMIT_S = 600
+
+mysensor = Series4421A()
+
+mysensor.connect("TCPIP0::172.100.0.79::5025::SOCKET", 5000)
+
+print(mysensor.idn)
+
+writer = CaptureLogWriter(CAPTURE_DIR, idn=mysensor.idn, sensor=1)
+
+# Keep forward power within 0.5 W and reflected power within 2 %, and store
+# at least one point a minute.
+compressor = CompressingSink(writer, tolerance={"forward": 0.5, "reflected": "2%"},
+                             method="swinging_door", max_interval=60.0)
+
+sampler = Sampler(mysensor, RATE_HZ, sensors=(1,), max_queue=0, sink=compressor)
+sampler.start()
+time.sleep(TIME_LIMIT_S)
+sampler.stop()
+
+compressor.close()
+mysensor.disconnect()
+print(compressor.stats())
+
+reader = CaptureLogReader(CAPTURE_DIR)
+stored = reader.range(reader.start_time, reader.end_time)
+times = np.arange(reader.start_time, reader.end_time, 1.0 / RATE_HZ)
+fwd = reconstruct(stored["timestamp"], stored["forward"], times)
+rfl = reconstruct(stored["timestamp"], stored["reflected"], times)
+print(f"{len(stored['timestamp'])} stored points redrawn as {len(times)} samples")
+print(f"Forward {fwd.min():0.2f} to {fwd.max():0.2f} W, Reflected {rfl.min():0.2f} to {rfl.max():0.2f} W")
@@ -0,0 +1,68 @@
+"""
+Example Description:
+        This example shows how to derive VSWR, return loss and rolling
+        statistics live from a LAN connected Bird 4421A Multifuntion Power
+        Meter while the samples are also kept in a ring buffer, and how to
+        compute the same metrics over the buffered arrays in one call.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex025_live_vswr_and_return_loss_lan_interface.py
+ 
+"""
+import time
+
+from metrics_4421A import DerivedMetrics, derived
+from ringbuffer_4421A import PowerRingBuffer
+from sampler_4421A import Sampler
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SENSOR = 1
+RATE_HZ = 20
+
+mysensor = Series4421A(LAN_SENSOR)
+mysensor.connect(timeout=5000)
+
+print(mysensor.idn)
+
+buffer = PowerRingBuffer(RATE_HZ * 600)
+# Rolling statistics over the last 10 seconds, then on into the buffer.
+metrics = DerivedMetrics(window=RATE_HZ * 10, duration=10.0, sink=buffer)
+
+with Sampler(mysensor, RATE_HZ, sensors=(SENSOR,), max_queue=0, sink=metrics):
+    for j in range(0, 30):
+        time.sleep(1.0)
+        now = metrics.latest(SENSOR)
+        stats = metrics.stats(SENSOR)["vswr"]
+        print(f"VSWR = {now['vswr']:0.3f} (10 s mean {stats['mean']:0.3f}, max {stats['max']:0.3f}), "
+              f"Return loss = {now['return_loss_db']:0.1f} dB")
+
+mysensor.disconnect()
+
+history = buffer.latest()
+summary = derived(history["forward"], history["reflected"])
+print(f"Worst VSWR over {len(history)} samples: {summary['vswr'].max():0.3f}")
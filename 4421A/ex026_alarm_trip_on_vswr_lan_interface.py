@@ -0,0 +1,82 @@
+"""
+Example Description:
+        This example shows how to trip an alarm within one sample of a
+        fault on a LAN connected Bird 4421A Multifuntion Power Meter. The
+        alarm rules run on the acquisition thread before the samples reach
+        the ring buffer, and the time from reading to callback is reported.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex026_alarm_trip_on_vswr_lan_interface.py
+ 
+"""
+import time
+
+from alarm_4421A import AlarmEngine, RateOfChange, Threshold
+from ringbuffer_4421A import PowerRingBuffer
+from sampler_4421A import Sampler
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SENSOR = 1
+RATE_HZ = 50
+
+
+def trip(event):
+    # Runs on the acquisition thread: switch off the source here, log later.
+    print(f"{event.state.upper()} {event.rule}: {event.metric} = {event.value:0.3f} "
+          f"({event.latency * 1e3:0.3f} ms after the reading)")
+
+
+mysensor = Series4421A(LAN_SENSOR)
+mysensor.connect(timeout=5000)
+
+print(mysensor.idn)
+
+alarms = AlarmEngine([
+    # Trip above VSWR 2.0 and clear only once it is back under 1.8. VSWR
+    # has no value without forward power; no_drive covers that case.
+    Threshold("high_vswr", "vswr", above=2.0, hysteresis=0.2, sensor=SENSOR,
+              trip_on_invalid=False),
+    # Loss of drive: forward power under 1 W for 3 samples in a row, or
+    # over range or missing (NaN) for as long.
+    Threshold("no_drive", "forward", below=1.0, count=3, sensor=SENSOR),
+    # Reflected power climbing faster than 50 W/s.
+    RateOfChange("reflected_rising", "reflected", max_rate=50.0, hold=0.5, sensor=SENSOR),
+], callbacks=[trip])
+
+buffer = PowerRingBuffer(RATE_HZ * 600)
+
+with Sampler(mysensor, RATE_HZ, sensors=(SENSOR,), max_queue=0, sink=buffer, on_sample=alarms):
+    time.sleep(30.0)
+
+mysensor.disconnect()
+
+stats = alarms.stats()
+print(f"{stats['samples']} samples, {stats['trips']} trips, active: {stats['active']}")
+print(f"Reading to callback p50 = {stats['callback_latency_p50_ms']:0.3f} ms, "
+      f"p99 = {stats['callback_latency_p99_ms']:0.3f} ms, "
+      f"max = {stats['callback_latency_max_ms']:0.3f} ms")
@@ -0,0 +1,92 @@
+"""
+Example Description:
+        This example shows how to share live samples from one LAN connected
+        Bird 4421A Multifuntion Power Meter with several local processes.
+        Only the acquisition process talks to the meter; it publishes every
+        sample into a shared-memory ring that each consumer reads on its own.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex027_share_live_samples_between_processes_lan_interface.py
+ 
+"""
+import multiprocessing
+import time
+
+from sampler_4421A import Sampler
+from series_4421A import Series4421A
+from sharedring_4421A import SharedRingReader, SharedRingWriter
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+SENSORS = (1, 2)
+RATE_HZ = 50
+RING_NAME = "bird_4421A_live"
+
+
+def logger(name, seconds):
+    # Consumes every sample, and learns how many it missed if it falls behind.
+    with SharedRingReader(name) as ring:
+        cursor = ring.sequence
+        stop = time.monotonic() + seconds
+        while time.monotonic() < stop:
+            time.sleep(1.0)
+            records, cursor, missed = ring.read_since(cursor)
+            print(f"logger: {len(records)} new samples, {missed} missed, up to #{cursor}")
+
+
+def dashboard(name, seconds):
+    # Only looks at the newest samples, straight from shared memory.
+    with SharedRingReader(name) as ring:
+        stop = time.monotonic() + seconds
+        while time.monotonic() < stop:
+            time.sleep(0.5)
+            view = ring.latest(len(SENSORS))
+            for record in view:
+                print(f"dashboard: sensor {record['sensor']} Fwd = {record['forward']:0.2f} W, "
+                      f"Refl = {record['reflected']:0.2f} W")
+            if not ring.intact(view).all():
+                print("dashboard: the samples above were overwritten while shown")
+            del view
+
+
+if __name__ == "__main__":
+    mysensor = Series4421A(LAN_SENSOR)
+    mysensor.connect(timeout=5000)
+
+    print(mysensor.idn)
+
+    with SharedRingWriter(RATE_HZ * len(SENSORS) * 60, name=RING_NAME) as ring:
+        consumers = [
+            multiprocessing.Process(target=logger, args=(ring.name, 10)),
+            multiprocessing.Process(target=dashboard, args=(ring.name, 10)),
+        ]
+        with Sampler(mysensor, RATE_HZ, sensors=SENSORS, max_queue=0, sink=ring):
+            for consumer in consumers:
+                consumer.start()
+            for consumer in consumers:
+                consumer.join()
+
+    mysensor.disconnect()
@@ -0,0 +1,69 @@
+"""
+Example Description:
+        This example shows how to get the most readings per second out of an
+        RS-232 connected Bird 4421A Multifuntion Power Meter: negotiate the
+        fastest baud rate the meter and cable will hold, read forward and
+        reflected power with one short-form scan list per poll, and report
+        the bytes per reading and the readings per second of the link.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex028_serial_link_throughput_mode.py
+ 
+"""
+from serial_4421A import link_budget, measure_link, negotiate_baud
+from series_4421A import Series4421A
+from transports_4421A import SerialTransport
+
+SERIAL_PORT = "COM11"
+SENSORS = (1,)
+
+port = SerialTransport(SERIAL_PORT, baud_rate=9600, timeout=2000)
+mysensor = Series4421A(transport=port)
+mysensor.connect()
+
+print(mysensor.idn)
+
+# What the long-form mnemonics would have cost at the starting rate.
+long_form = link_budget(port.baud_rate, "MEASure:AVERage? 1;:MEASure:REFLected:AVERage? 1", 25, values=2)
+print(f"Long form at {port.baud_rate} baud: {long_form['bytes_per_reading']:0.1f} bytes/reading, "
+      f"at most {long_form['readings_per_s']:0.1f} readings/s")
+
+rate = negotiate_baud(port)
+print(f"Link running at {rate} baud")
+
+budget = measure_link(port, sensors=SENSORS)
+print(f"Short form at {rate} baud: {budget['bytes_per_reading']:0.1f} bytes/reading, "
+      f"wire {budget['wire_ms']:0.2f} ms + turnaround "
+      f"{budget['query_ms'] - budget['wire_ms']:0.2f} ms per poll, "
+      f"{budget['readings_per_s']:0.1f} readings/s")
+
+scan = mysensor.measure.scan_list(SENSORS)
+for j in range(0, 100):
+    reading = scan.run()
+    print(f"Forward = {reading.forward_1:0.2f} W, Reflected = {reading.reflected_1:0.2f} W")
+
+mysensor.disconnect()
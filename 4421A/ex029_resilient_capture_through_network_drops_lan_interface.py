@@ -0,0 +1,80 @@
+"""
+Example Description:
+        This example shows how to keep a long capture from a LAN connected
+        Bird 4421A Multifuntion Power Meter running through network drops.
+        The driver reconnects on its own with backoff, checks it is back on
+        the same meter, and the sampler keeps its schedule, marking each
+        outage as a gap instead of stopping. The session comes from a
+        SessionPool, which drops the dead session rather than reusing it.
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex029_resilient_capture_through_network_drops_lan_interface.py
+ 
+"""
+import time
+from datetime import datetime
+
+from pool_4421A import SessionPool
+from ringbuffer_4421A import PowerRingBuffer
+from sampler_4421A import Sampler
+from series_4421A import Series4421A
+
+LAN_SENSOR = "TCPIP0::192.168.1.44::5025::SOCKET"
+RATE_HZ = 20
+TIME_LIMIT_S = 3600
+
+pool = SessionPool()
+
+# Retry after 0.5 s, doubling up to 30 s, and clear the error queue after
+# every reconnect.
+mysensor = Series4421A(LAN_SENSOR, pool=pool,
+                       resilient={"base_delay": 0.5, "max_delay": 30.0, "setup": ("*CLS",)})
+mysensor.connect(timeout=2000)
+
+print(mysensor.idn)
+
+buffer = PowerRingBuffer(RATE_HZ * TIME_LIMIT_S)
+
+with Sampler(mysensor, RATE_HZ, sensors=(1,), max_queue=0, sink=buffer) as sampler:
+    stop = time.monotonic() + TIME_LIMIT_S
+    while time.monotonic() < stop:
+        time.sleep(10.0)
+        link = mysensor.resilience.stats()
+        state = "up" if link["connected"] else f"down, retrying in {link['next_attempt_s']:0.1f} s"
+        print(f"{len(buffer)} samples, link {state}, {link['reconnects']} reconnects, "
+              f"{link['outage_s']:0.1f} s offline in total")
+
+mysensor.disconnect()
+pool.close()
+
+# Each reconnect opens a fresh session ("misses"); a broken session is
+# never handed out again.
+print(pool.stats())
+
+for gap in sampler.gaps:
+    print(f"No readings from {datetime.fromtimestamp(gap.start):%H:%M:%S.%f} "
+          f"to {datetime.fromtimestamp(gap.end):%H:%M:%S.%f} ({gap.ticks} samples)")
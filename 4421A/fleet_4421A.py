@@ -0,0 +1,248 @@
+"""
+Example Description:
+        This example is a fleet poller used to acquire forward and
+        reflected power from many Bird 4421A Multifuntion Power Meters
+        concurrently, merging every reading into one timestamped stream.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file fleet_4421A.py
+
+"""
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from series_4421A import Series4421A
+
+FleetSample = namedtuple("FleetSample", ["timestamp", "meter", "sensor", "forward", "reflected"])
+
+
+class MeterHealth():
+    """Running health statistics for one meter in the fleet.
+    """
+    def __init__(self, meter:str):
+        self.meter = meter
+        self.polls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.stalls = 0
+        self.last_latency = None
+        self.max_latency = 0.0
+        self.mean_latency = None
+        self.last_success = None
+        self.last_error = None
+
+    def record_success(self, latency:float, timestamp:float):
+        self.polls += 1
+        self.consecutive_failures = 0
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.mean_latency is None:
+            self.mean_latency = latency
+        else:
+            self.mean_latency += 0.1 * (latency - self.mean_latency)
+        self.last_success = timestamp
+
+    def record_failure(self, error:Exception):
+        self.polls += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{error}"
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class Fleet4421A():
+    """Polls a list of 4421A meters concurrently with a bounded worker pool.
+
+    Each poll cycle hands every idle meter to the pool and waits for the
+    replies. A meter that has not answered by the end of the wait stays
+    busy, is counted as a stall, and is not polled again until its
+    outstanding reading completes; its reading is still delivered in a later
+    cycle. One slow meter therefore never holds up the rest of the fleet.
+
+    By default the wait follows the fleet: once half of the polled meters
+    have answered, the time that took is the cycle's median round trip, and
+    the rest get straggler times that long again before the cycle ends.
+    Give cycle_timeout in seconds to wait a fixed time instead. No wait is
+    longer than the instrument timeout.
+    """
+    def __init__(self, resource_strings, sensors=(1,), max_workers:int=8,
+                 timeout:int=5000, cycle_timeout:float=None, straggler:float=1.0,
+                 backend:str="visa", **kwargs):
+        if not sensors:
+            raise ValueError("give at least one sensor to read")
+        self.__resource_strings = list(resource_strings)
+        self.__sensors = tuple(sensors)
+        self.__max_workers = max_workers
+        self.__timeout = timeout
+        self.__cycle_timeout = cycle_timeout
+        self.__straggler = straggler
+        self.__backend = backend
+        self.__connect_kwargs = kwargs
+        self.__meters = {}
+        self.__scans = {}
+        self.__health = {rsrc: MeterHealth(rsrc) for rsrc in self.__resource_strings}
+        self.__in_flight = {}
+        self.__pool = None
+
+    def connect(self):
+        """Opens a Series4421A session to every meter in the fleet.
+        """
+        self.__pool = ThreadPoolExecutor(max_workers=self.__max_workers,
+                                         thread_name_prefix="fleet4421A")
+        futures = {
+            self.__pool.submit(self.__open, rsrc): rsrc
+            for rsrc in self.__resource_strings
+        }
+        wait(futures)
+        for future, rsrc in futures.items():
+            if future.exception() is not None:
+                self.__health[rsrc].record_failure(future.exception())
+
+    def __open(self, resource_string:str):
+        meter = Series4421A(resource_string, backend=self.__backend)
+        meter.connect(timeout=self.__timeout, **self.__connect_kwargs)
+        self.__meters[resource_string] = meter
+        if meter.measure is not None:
+            self.__scans[resource_string] = meter.measure.scan_list(self.__sensors)
+
+    def disconnect(self):
+        """Closes every meter session and shuts the worker pool down.
+        """
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=True)
+            self.__pool = None
+        self.__in_flight.clear()
+        for meter in self.__meters.values():
+            meter.disconnect()
+        self.__meters.clear()
+        self.__scans.clear()
+
+    @property
+    def health(self):
+        """Reports the per-meter health statistics.
+
+        Returns:
+            dict: MeterHealth for each resource string.
+        """
+        return self.__health
+
+    def __read(self, resource_string:str):
+        scan = self.__scans.get(resource_string)
+        if scan is None:
+            raise ConnectionError("meter is not connected")
+        t1 = time.perf_counter()
+        reading = scan.run()
+        latency = time.perf_counter() - t1
+        timestamp = time.time()
+        records = [
+            FleetSample(timestamp, resource_string, sensor, reading[2 * i], reading[2 * i + 1])
+            for i, sensor in enumerate(self.__sensors)
+        ]
+        return records, latency, timestamp
+
+    def __wait(self, submitted):
+        if self.__cycle_timeout is not None:
+            wait(submitted, timeout=self.__cycle_timeout)
+            return
+        start = time.monotonic()
+        deadline = start + self.__timeout / 1000
+        pending = set(submitted)
+        # Wait for the first half to answer, then give the rest as long
+        # again (times straggler), never past the instrument timeout.
+        stragglers = len(submitted) // 2
+        while len(pending) > stragglers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if pending:
+            now = time.monotonic()
+            grace = min(deadline, now + self.__straggler * (now - start)) - now
+            wait(pending, timeout=max(0.0, grace))
+
+    def poll(self):
+        """Runs one poll cycle across the fleet.
+
+        Returns:
+            list: FleetSample records for every reading completed this cycle.
+        """
+        busy = set(self.__in_flight.values())
+        submitted = []
+        for rsrc in self.__resource_strings:
+            if rsrc not in busy:
+                future = self.__pool.submit(self.__read, rsrc)
+                self.__in_flight[future] = rsrc
+                submitted.append(future)
+
+        # Only this cycle's polls are waited on; meters still busy from an
+        # earlier cycle are collected if they happen to have finished.
+        self.__wait(submitted)
+        done = [future for future in self.__in_flight if future.done()]
+        not_done = [future for future in self.__in_flight if not future.done()]
+
+        records = []
+        for future in done:
+            rsrc = self.__in_flight.pop(future)
+            health = self.__health[rsrc]
+            try:
+                readings, latency, timestamp = future.result()
+            except Exception as err:
+                health.record_failure(err)
+                continue
+            health.record_success(latency, timestamp)
+            records.extend(readings)
+        for future in not_done:
+            self.__health[self.__in_flight[future]].stalls += 1
+
+        records.sort(key=lambda record: record.timestamp)
+        return records
+
+    def stream(self, period:float=0.0, cycles:int=None):
+        """Polls the fleet repeatedly and yields one merged sample stream.
+
+        Args:
+            period (float, optional): Minimum time between cycle starts in seconds. Defaults to 0.0.
+            cycles (int, optional): Number of cycles to run. Defaults to None (run forever).
+
+        Yields:
+            FleetSample: Timestamped (meter, sensor, forward, reflected) records.
+        """
+        count = 0
+        next_cycle = time.monotonic()
+        while cycles is None or count < cycles:
+            yield from self.poll()
+            count += 1
+            next_cycle += period
+            delay = next_cycle - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_cycle = time.monotonic()
@@ -0,0 +1,290 @@
+"""
+Example Description:
+        This example is opt-in I/O instrumentation for the Bird 4421A
+        Multifuntion Power Meter driver. It counts calls, bytes sent and
+        received, and errors for each SCPI command and keeps a latency
+        histogram per command, so a slow rack can be traced to the
+        network, the VISA layer or the meter.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file instrumentation_4421A.py
+
+"""
+import math
+import re
+import threading
+import time
+
+# Histogram resolution: sub-buckets per power of two, 12.5% wide or less.
+SUB_BUCKETS = 8
+
+_ARGUMENTS = re.compile(r"\s[^;]*")
+
+
+class LatencyHistogram():
+    """Log-bucketed latency histogram.
+
+    Each power of two of nanoseconds is split into SUB_BUCKETS buckets, so
+    percentiles are accurate to about a tenth from microseconds to seconds
+    while recording stays a handful of integer operations.
+    Buckets are kept in a dict, so only latencies seen use memory.
+    """
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @staticmethod
+    def bucket(ns:int):
+        # The bit length picks the power of two and the three bits below
+        # the leading one pick the sub-bucket.
+        exponent = ns.bit_length()
+        shift = exponent - 4
+        top = ns >> shift if shift >= 0 else ns << -shift
+        return exponent * SUB_BUCKETS + (top & (SUB_BUCKETS - 1))
+
+    @staticmethod
+    def upper_bound(bucket:int):
+        """The upper edge of a bucket in ns."""
+        exponent, sub = divmod(bucket, SUB_BUCKETS)
+        return math.ldexp(SUB_BUCKETS + sub + 1, exponent - 4)
+
+    def record(self, ns:int):
+        # bucket() inlined; this runs on every I/O call.
+        exponent = ns.bit_length()
+        shift = exponent - 4
+        index = exponent * SUB_BUCKETS + ((ns >> shift if shift >= 0 else ns << -shift) & 7)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q:float):
+        """
+        Return the q-th percentile latency in ns, rounded up to its bucket.
+
+        Args:
+            q (float): Percentile, 0 to 100.
+
+        Returns:
+            float: Latency in ns, or 0.0 with no samples.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max_ns)
+        return float(self.max_ns)
+
+
+class CommandStats():
+    """Counters and latency histogram for one SCPI command."""
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self):
+        latency = self.latency
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "mean_ms": latency.total_ns / latency.count / 1e6 if latency.count else 0.0,
+            "p50_ms": latency.percentile(50) / 1e6,
+            "p99_ms": latency.percentile(99) / 1e6,
+            "max_ms": latency.max_ns / 1e6,
+        }
+
+
+class Instrumentation():
+    """Per-command I/O statistics shared by one or more instrumented drivers.
+
+    Commands are grouped by their SCPI headers with arguments removed, so
+    "MEAS:AVER? 1" and "MEAS:AVER? 2" are both counted as "MEAS:AVER?".
+
+    Hooks are called after every recorded operation with
+    (command, start_ns, end_ns, bytes_out, bytes_in, error), where the
+    times are time.perf_counter_ns() values and error is the exception
+    raised or None. They run on the calling thread, so a profiler can
+    attach its own spans or counters; keep them short.
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__commands = {}
+        self.__headers = {}
+        self.__started = time.time()
+        self.hooks = []
+
+    def header(self, cmd):
+        """The statistics key for a command string."""
+        key = self.__headers.get(cmd)
+        if key is None:
+            text = cmd.decode(errors="replace") if isinstance(cmd, (bytes, bytearray)) else cmd
+            key = _ARGUMENTS.sub("", text.strip()).upper()
+            if len(self.__headers) < 4096:
+                self.__headers[cmd] = key
+        return key
+
+    def record(self, cmd, start_ns:int, end_ns:int, bytes_out:int=0, bytes_in:int=0, error=None,
+               call:bool=True):
+        """
+        Record one I/O operation.
+
+        Args:
+            cmd (str or bytes): The command sent.
+            start_ns (int): perf_counter_ns() before the operation.
+            end_ns (int): perf_counter_ns() after the operation.
+            bytes_out (int, optional): Bytes sent. Defaults to 0.
+            bytes_in (int, optional): Bytes received. Defaults to 0.
+            error (Exception, optional): The exception raised, if any. Defaults to None.
+            call (bool, optional): Count the operation as a call and record its
+                latency; False only adds bytes and errors. Defaults to True.
+        """
+        key = self.header(cmd)
+        with self.__lock:
+            stats = self.__commands.get(key)
+            if stats is None:
+                stats = self.__commands[key] = CommandStats()
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+            if error is not None:
+                stats.errors += 1
+            if call:
+                stats.count += 1
+                stats.latency.record(end_ns - start_ns)
+        for hook in self.hooks:
+            hook(key, start_ns, end_ns, bytes_out, bytes_in, error)
+
+    def reset(self):
+        with self.__lock:
+            self.__commands.clear()
+            self.__started = time.time()
+
+    def snapshot(self):
+        """
+        Return the statistics gathered so far.
+
+        Returns:
+            dict: "since" (epoch seconds), "commands" (header to counters and
+                latency percentiles in ms) and "total" (all commands together).
+        """
+        with self.__lock:
+            commands = {key: stats.as_dict() for key, stats in self.__commands.items()}
+            total = CommandStats()
+            for stats in self.__commands.values():
+                total.count += stats.count
+                total.errors += stats.errors
+                total.bytes_out += stats.bytes_out
+                total.bytes_in += stats.bytes_in
+                latency = total.latency
+                for index, count in stats.latency.buckets.items():
+                    latency.buckets[index] = latency.buckets.get(index, 0) + count
+                latency.count += stats.latency.count
+                latency.total_ns += stats.latency.total_ns
+                latency.max_ns = max(latency.max_ns, stats.latency.max_ns)
+            return {"since": self.__started, "commands": commands, "total": total.as_dict()}
+
+
+def _length(data):
+    # Commands and replies are ASCII; add one for the line terminator.
+    return len(data) if isinstance(data, (bytes, bytearray)) else len(data) + 1
+
+
+class InstrumentedTransport():
+    """Wraps any transport and records each write, read and query.
+
+    A write is counted as a call with its own latency. A read adds its
+    bytes and any error to the command written before it without counting
+    a second call.
+    """
+    def __init__(self, transport, instrumentation:Instrumentation):
+        self.__transport = transport
+        self.__instrumentation = instrumentation
+        self.__last = ""
+
+    @property
+    def transport(self):
+        """The wrapped transport."""
+        return self.__transport
+
+    @property
+    def timeout(self):
+        return self.__transport.timeout
+
+    @timeout.setter
+    def timeout(self, value:int):
+        self.__transport.timeout = value
+
+    def open(self):
+        self.__transport.open()
+
+    def close(self):
+        self.__transport.close()
+
+    def write(self, cmd):
+        self.__last = cmd
+        start = time.perf_counter_ns()
+        try:
+            self.__transport.write(cmd)
+        except Exception as err:
+            self.__instrumentation.record(cmd, start, time.perf_counter_ns(), _length(cmd), 0, err)
+            raise
+        self.__instrumentation.record(cmd, start, time.perf_counter_ns(), _length(cmd))
+
+    def read(self):
+        start = time.perf_counter_ns()
+        try:
+            reply = self.__transport.read()
+        except Exception as err:
+            self.__instrumentation.record(self.__last, start, time.perf_counter_ns(), 0, 0, err,
+                                         call=False)
+            raise
+        self.__instrumentation.record(self.__last, start, time.perf_counter_ns(), 0, _length(reply),
+                                     call=False)
+        return reply
+
+    def query(self, cmd):
+        self.__last = cmd
+        start = time.perf_counter_ns()
+        try:
+            reply = self.__transport.query(cmd)
+        except Exception as err:
+            self.__instrumentation.record(cmd, start, time.perf_counter_ns(), _length(cmd), 0, err)
+            raise
+        self.__instrumentation.record(cmd, start, time.perf_counter_ns(), _length(cmd), _length(reply))
+        return reply
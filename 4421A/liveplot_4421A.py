@@ -0,0 +1,245 @@
+"""
+Example Description:
+        This example is a live plotting class used to display Bird 4421A
+        forward and reflected power as it is captured. Existing line
+        artists are updated in place, redrawn with blitting, and the data
+        is decimated to min/max pairs so each frame costs the same however
+        long the capture runs.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file liveplot_4421A.py
+
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+
+COLOR_FWD_W = "#69b3a2"
+COLOR_REV_W = "#3399e6"
+
+
+def _ordered_points(t_min, y_min, t_max, y_max, t_gap):
+    # Emit each bucket's min, max and gap point in time order. A bucket
+    # without a gap has t_gap NaN; that point sorts last and is dropped.
+    t = np.stack((t_min, t_max, t_gap), axis=1)
+    y = np.stack((y_min, y_max, np.full(len(t_gap), np.nan)), axis=1)
+    order = np.argsort(t, axis=1)
+    t = np.take_along_axis(t, order, axis=1).ravel()
+    y = np.take_along_axis(y, order, axis=1).ravel()
+    keep = ~np.isnan(t)
+    return t[keep], y[keep]
+
+
+def _extremes(tb, yb):
+    # Min and max of each row ignoring NaN, as nanargmin and nanargmax
+    # would, except that an all-NaN row gives its first (NaN) point instead
+    # of raising. The first NaN in a row, if any, is kept as its gap.
+    rows = np.arange(len(yb))
+    missing = np.isnan(yb)
+    i_min = np.argmin(np.where(missing, np.inf, yb), axis=1)
+    i_max = np.argmax(np.where(missing, -np.inf, yb), axis=1)
+    i_gap = np.argmax(missing, axis=1)
+    t_gap = np.where(missing[rows, i_gap], tb[rows, i_gap], np.nan)
+    return tb[rows, i_min], yb[rows, i_min], tb[rows, i_max], yb[rows, i_max], t_gap
+
+
+class MinMaxDecimator():
+    """Incremental min/max decimation of an ever-growing series.
+
+    New samples are folded into fixed-count buckets as they arrive. Once
+    more than max_buckets buckets exist, neighbouring buckets are merged in
+    pairs and the bucket size doubles, so the stored summary never exceeds
+    max_buckets and each update costs only the new samples.
+
+    NaN samples, such as the Sampler's gap markers, do not count as a
+    bucket's min or max. The first one in a bucket is kept as a point of
+    its own, so the plotted line still breaks at the gap.
+    """
+    def __init__(self, max_buckets:int):
+        self.__max_buckets = max(int(max_buckets), 1)
+        self.__size = 1
+        self.__t_min = np.empty(0)
+        self.__y_min = np.empty(0)
+        self.__t_max = np.empty(0)
+        self.__y_max = np.empty(0)
+        self.__t_gap = np.empty(0)
+        self.__pending_t = np.empty(0)
+        self.__pending_y = np.empty(0)
+
+    def extend(self, t, y):
+        t = np.concatenate((self.__pending_t, np.asarray(t, dtype=float)))
+        y = np.concatenate((self.__pending_y, np.asarray(y, dtype=float)))
+        used = (len(t) // self.__size) * self.__size
+        if used:
+            t_min, y_min, t_max, y_max, t_gap = _extremes(
+                t[:used].reshape(-1, self.__size), y[:used].reshape(-1, self.__size)
+            )
+            self.__t_min = np.concatenate((self.__t_min, t_min))
+            self.__y_min = np.concatenate((self.__y_min, y_min))
+            self.__t_max = np.concatenate((self.__t_max, t_max))
+            self.__y_max = np.concatenate((self.__y_max, y_max))
+            self.__t_gap = np.concatenate((self.__t_gap, t_gap))
+        self.__pending_t = t[used:]
+        self.__pending_y = y[used:]
+        while len(self.__t_min) > self.__max_buckets:
+            self.__merge()
+
+    def __merge(self):
+        pairs = len(self.__t_min) // 2
+        odd = len(self.__t_min) - 2 * pairs
+        head = slice(0, 2 * pairs)
+        tail = slice(2 * pairs, 2 * pairs + odd)
+        t_min, y_min, _, _, _ = _extremes(
+            self.__t_min[head].reshape(pairs, 2), self.__y_min[head].reshape(pairs, 2)
+        )
+        _, _, t_max, y_max, _ = _extremes(
+            self.__t_max[head].reshape(pairs, 2), self.__y_max[head].reshape(pairs, 2)
+        )
+        gaps = self.__t_gap[head].reshape(pairs, 2)
+        t_gap = np.where(np.isnan(gaps[:, 0]), gaps[:, 1], gaps[:, 0])
+        self.__t_min = np.concatenate((t_min, self.__t_min[tail]))
+        self.__y_min = np.concatenate((y_min, self.__y_min[tail]))
+        self.__t_max = np.concatenate((t_max, self.__t_max[tail]))
+        self.__y_max = np.concatenate((y_max, self.__y_max[tail]))
+        self.__t_gap = np.concatenate((t_gap, self.__t_gap[tail]))
+        self.__size *= 2
+
+    def points(self):
+        """
+        Returns:
+            tuple: x and y arrays of the decimated series, in time order.
+        """
+        summary = (self.__t_min, self.__y_min, self.__t_max, self.__y_max, self.__t_gap)
+        if len(self.__pending_y) > 2:
+            # The partly filled last bucket is summarised the same way.
+            last = _extremes(self.__pending_t[np.newaxis], self.__pending_y[np.newaxis])
+            return _ordered_points(*(np.concatenate(pair) for pair in zip(summary, last)))
+        x, y = _ordered_points(*summary)
+        return np.concatenate((x, self.__pending_t)), np.concatenate((y, self.__pending_y))
+
+
+class LivePowerPlot():
+    """Forward and reflected power on a primary and secondary y axis.
+
+    The two line artists are created once and updated with set_data. Frames
+    are drawn by restoring a cached background and blitting only the lines;
+    the full figure is redrawn only when the axis limits have to grow, and
+    they grow in steps so that this stays rare.
+    """
+    def __init__(self, title:str="4421A Forward Power Sampling", fwd_ylim=None, refl_ylim=None,
+                 figsize=(8, 8)):
+        self.fig, self.ax1 = plt.subplots(figsize=figsize)
+        self.ax2 = self.ax1.twinx()
+
+        (self.__fwd_line,) = self.ax1.plot([], [], color=COLOR_FWD_W, lw=1, animated=True)
+        (self.__refl_line,) = self.ax2.plot([], [], color=COLOR_REV_W, lw=1, animated=True)
+
+        self.ax1.set_xlabel("Time (s)")
+        self.ax1.set_ylabel("FWD Power (W)", color=COLOR_FWD_W, fontsize=14)
+        self.ax1.tick_params(axis="y", labelcolor=COLOR_FWD_W)
+        self.ax2.set_ylabel("REV Power (W)", color=COLOR_REV_W, fontsize=14)
+        self.ax2.tick_params(axis="y", labelcolor=COLOR_REV_W)
+        self.fig.suptitle(title, fontsize=20)
+
+        self.__fixed_fwd = fwd_ylim is not None
+        self.__fixed_refl = refl_ylim is not None
+        self.ax1.set_ylim(*(fwd_ylim or (0, 1)))
+        self.ax2.set_ylim(*(refl_ylim or (0, 1)))
+        self.ax1.set_xlim(0, 1)
+
+        # Two points (a min and a max) per horizontal pixel.
+        buckets = int(self.ax1.bbox.width)
+        self.__fwd = MinMaxDecimator(buckets)
+        self.__refl = MinMaxDecimator(buckets)
+
+        self.__canvas = self.fig.canvas
+        self.__background = None
+        self.__canvas.mpl_connect("draw_event", self.__on_draw)
+
+    def __on_draw(self, event):
+        self.__background = self.__canvas.copy_from_bbox(self.fig.bbox)
+        self.ax1.draw_artist(self.__fwd_line)
+        self.ax2.draw_artist(self.__refl_line)
+
+    @staticmethod
+    def __grow(ax, low, high, fixed, axis="y"):
+        get_lim = ax.get_xlim if axis == "x" else ax.get_ylim
+        set_lim = ax.set_xlim if axis == "x" else ax.set_ylim
+        lo, hi = get_lim()
+        if fixed or not np.isfinite(low) or not np.isfinite(high) or (low >= lo and high <= hi):
+            return False
+        if axis == "x":
+            set_lim(low, high + 0.25 * max(high - low, 1.0))
+        else:
+            span = max(high - low, abs(high), 1e-12)
+            set_lim(min(lo, low - 0.1 * span), max(hi, high + 0.1 * span))
+        return True
+
+    def extend(self, t, forward, reflected):
+        """
+        Add newly captured samples to the plot.
+
+        Args:
+            t (numpy.ndarray): Sample times in seconds.
+            forward (numpy.ndarray): Forward power in Watts.
+            reflected (numpy.ndarray): Reflected power in Watts.
+        """
+        self.__fwd.extend(t, forward)
+        self.__refl.extend(t, reflected)
+
+    def refresh(self):
+        """
+        Draw one frame with the data added so far.
+        """
+        x1, y1 = self.__fwd.points()
+        x2, y2 = self.__refl.points()
+        self.__fwd_line.set_data(x1, y1)
+        self.__refl_line.set_data(x2, y2)
+
+        if len(x1):
+            redraw = self.__grow(self.ax1, x1[0], x1[-1], False, axis="x")
+            redraw |= self.__grow(self.ax1, np.nanmin(y1), np.nanmax(y1), self.__fixed_fwd)
+            redraw |= self.__grow(self.ax2, np.nanmin(y2), np.nanmax(y2), self.__fixed_refl)
+        else:
+            redraw = False
+
+        if redraw or self.__background is None:
+            # draw_event recaptures the background and draws the lines.
+            self.__canvas.draw()
+        else:
+            self.__canvas.restore_region(self.__background)
+            self.ax1.draw_artist(self.__fwd_line)
+            self.ax2.draw_artist(self.__refl_line)
+            self.__canvas.blit(self.fig.bbox)
+        self.__canvas.flush_events()
+
+    def save(self, path:str):
+        self.__fwd_line.set_animated(False)
+        self.__refl_line.set_animated(False)
+        self.fig.savefig(path)
+        self.__fwd_line.set_animated(True)
+        self.__refl_line.set_animated(True)
@@ -0,0 +1,319 @@
+"""
+Example Description:
+        This example is a derived-metrics stage for the Bird 4421A
+        Multifuntion Power Meter. It turns paired forward and reflected
+        power into reflection coefficient, VSWR, return loss and mismatch
+        loss, for a single reading or whole NumPy arrays, and keeps
+        constant-time rolling mean, min, max and standard deviation over
+        a sliding window of samples or seconds.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file metrics_4421A.py
+
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+METRICS = ("forward", "reflected", "rho", "vswr", "return_loss_db", "mismatch_loss_db")
+
+
+def _result(value):
+    # Plain floats in, plain float out; arrays in, arrays out.
+    return value.item() if isinstance(value, np.ndarray) and value.ndim == 0 else value
+
+
+def reflection_coefficient(forward, reflected):
+    """
+    Magnitude of the reflection coefficient, rho = sqrt(Pr / Pf).
+
+    Args:
+        forward (float or array): Forward power in Watts.
+        reflected (float or array): Reflected power in Watts.
+
+    Returns:
+        float or numpy.ndarray: rho; NaN where forward power is not positive.
+    """
+    forward = np.asarray(forward, dtype=float)
+    reflected = np.asarray(reflected, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(forward > 0, np.clip(reflected, 0, None) / forward, np.nan)
+    return _result(np.sqrt(ratio))
+
+
+def vswr(forward, reflected):
+    """
+    Voltage standing wave ratio, (1 + rho) / (1 - rho).
+
+    Returns:
+        float or numpy.ndarray: VSWR; inf where rho >= 1, NaN where forward
+            power is not positive.
+    """
+    rho = np.asarray(reflection_coefficient(forward, reflected))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(rho < 1, (1 + rho) / (1 - rho), np.where(np.isnan(rho), np.nan, np.inf))
+    return _result(result)
+
+
+def return_loss_db(forward, reflected):
+    """
+    Return loss in dB, 10 log10(Pf / Pr).
+
+    Returns:
+        float or numpy.ndarray: Return loss; inf with no reflected power,
+            NaN where forward power is not positive.
+    """
+    forward = np.asarray(forward, dtype=float)
+    reflected = np.asarray(reflected, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(forward > 0, 10 * np.log10(forward / np.clip(reflected, 0, None)), np.nan)
+    return _result(result)
+
+
+def mismatch_loss_db(forward, reflected):
+    """
+    Mismatch loss in dB, -10 log10(1 - rho^2).
+
+    Returns:
+        float or numpy.ndarray: Mismatch loss; inf where rho >= 1, NaN where
+            forward power is not positive.
+    """
+    rho = np.asarray(reflection_coefficient(forward, reflected))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 10 * np.log10(1 / np.clip(1 - rho * rho, 0, None))
+    return _result(result)
+
+
+def derived(forward, reflected):
+    """
+    Every derived metric at once.
+
+    Args:
+        forward (float or array): Forward power in Watts.
+        reflected (float or array): Reflected power in Watts.
+
+    Returns:
+        dict: rho, vswr, return_loss_db and mismatch_loss_db.
+    """
+    return {
+        "rho": reflection_coefficient(forward, reflected),
+        "vswr": vswr(forward, reflected),
+        "return_loss_db": return_loss_db(forward, reflected),
+        "mismatch_loss_db": mismatch_loss_db(forward, reflected),
+    }
+
+
+def derive_sample(forward:float, reflected:float):
+    """
+    The derived metrics of one reading, in plain Python for the
+    per-sample path where NumPy call overhead would dominate.
+
+    Returns:
+        tuple: (rho, vswr, return_loss_db, mismatch_loss_db)
+    """
+    # NaN in either input, which is how over range arrives, is NaN out,
+    # never a perfect match.
+    if not forward > 0 or reflected != reflected:
+        return math.nan, math.nan, math.nan, math.nan
+    ratio = max(reflected, 0.0) / forward
+    rho = math.sqrt(ratio)
+    if ratio == 0:
+        return_loss = math.inf
+    elif ratio == math.inf:
+        return_loss = -math.inf
+    else:
+        return_loss = 10 * math.log10(1 / ratio)
+    if rho >= 1:
+        return rho, math.inf, return_loss, math.inf
+    return rho, (1 + rho) / (1 - rho), return_loss, 10 * math.log10(1 / (1 - ratio))
+
+
+class RollingStats():
+    """Sliding-window mean, standard deviation, min and max in O(1) per sample.
+
+    The mean and variance are kept with Welford's update, run forwards
+    for each new value and backwards for each value leaving the window.
+    Min and max come from monotonic deques, whose fronts are always the
+    extreme of the window. The window holds the last window samples and,
+    when duration is given, only those from the last duration seconds.
+    NaN values are skipped.
+    """
+    def __init__(self, window:int=100, duration:float=None):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.__window = window
+        self.__duration = duration
+        self.__values = deque()
+        self.__minima = deque()
+        self.__maxima = deque()
+        self.__pushed = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __evict(self):
+        index, _, value = self.__values.popleft()
+        n = len(self.__values)
+        if n == 0:
+            self.__mean = 0.0
+            self.__m2 = 0.0
+        else:
+            delta = value - self.__mean
+            self.__mean -= delta / n
+            self.__m2 = max(0.0, self.__m2 - delta * (value - self.__mean))
+        if self.__minima and self.__minima[0][0] == index:
+            self.__minima.popleft()
+        if self.__maxima and self.__maxima[0][0] == index:
+            self.__maxima.popleft()
+
+    def push(self, value:float, timestamp:float=None):
+        """
+        Add a value, dropping those that have left the window.
+
+        Args:
+            value (float): The new value.
+            timestamp (float, optional): Its time in seconds; needed with duration.
+        """
+        if value != value:
+            return
+        index = self.__pushed
+        self.__pushed += 1
+        self.__values.append((index, timestamp, value))
+        delta = value - self.__mean
+        self.__mean += delta / len(self.__values)
+        self.__m2 += delta * (value - self.__mean)
+
+        while self.__minima and self.__minima[-1][1] >= value:
+            self.__minima.pop()
+        self.__minima.append((index, value))
+        while self.__maxima and self.__maxima[-1][1] <= value:
+            self.__maxima.pop()
+        self.__maxima.append((index, value))
+
+        while len(self.__values) > self.__window:
+            self.__evict()
+        if self.__duration is not None and timestamp is not None:
+            while timestamp - self.__values[0][1] > self.__duration:
+                self.__evict()
+
+    @property
+    def mean(self):
+        return self.__mean if self.__values else math.nan
+
+    @property
+    def variance(self):
+        """Sample variance of the window (n - 1 denominator)."""
+        n = len(self.__values)
+        return self.__m2 / (n - 1) if n > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        return self.__minima[0][1] if self.__minima else math.nan
+
+    @property
+    def max(self):
+        return self.__maxima[0][1] if self.__maxima else math.nan
+
+    def as_dict(self):
+        return {
+            "count": len(self.__values),
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class DerivedMetrics():
+    """Sink that derives VSWR, return loss and friends from every sample and
+    keeps rolling statistics of each metric, per sensor.
+
+    It takes append(timestamp, sensor, forward, reflected) like the other
+    sinks and passes each sample on unchanged to sink, when one is given,
+    so it can sit in front of a buffer or log.
+    """
+    def __init__(self, window:int=100, duration:float=None, metrics=METRICS, sink=None):
+        for name in metrics:
+            if name not in METRICS:
+                raise ValueError(f"unknown metric: {name}")
+        self.__window = window
+        self.__duration = duration
+        self.__metrics = tuple(metrics)
+        self.__sink = sink
+        self.__stats = {}
+        self.__latest = {}
+
+    def append(self, timestamp:float, sensor:int, forward:float, reflected:float):
+        rho, swr, return_loss, mismatch_loss = derive_sample(forward, reflected)
+        latest = {
+            "timestamp": timestamp,
+            "forward": forward,
+            "reflected": reflected,
+            "rho": rho,
+            "vswr": swr,
+            "return_loss_db": return_loss,
+            "mismatch_loss_db": mismatch_loss,
+        }
+        self.__latest[sensor] = latest
+        stats = self.__stats.get(sensor)
+        if stats is None:
+            stats = self.__stats[sensor] = {
+                name: RollingStats(self.__window, self.__duration) for name in self.__metrics
+            }
+        for name, rolling in stats.items():
+            value = latest[name]
+            # An infinite VSWR or return loss would poison the mean.
+            if not math.isinf(value):
+                rolling.push(value, timestamp)
+        if self.__sink is not None:
+            self.__sink.append(timestamp, sensor, forward, reflected)
+
+    def latest(self, sensor:int=1):
+        """
+        The most recent reading of a sensor with its derived metrics.
+
+        Returns:
+            dict: Timestamp, powers and metrics, or None before the first sample.
+        """
+        return self.__latest.get(sensor)
+
+    def stats(self, sensor:int=1):
+        """
+        Rolling statistics of each metric for a sensor.
+
+        Returns:
+            dict: Metric name to count, mean, std, min and max.
+        """
+        return {name: rolling.as_dict() for name, rolling in self.__stats.get(sensor, {}).items()}
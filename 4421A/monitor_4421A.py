@@ -0,0 +1,155 @@
+"""
+Example Description:
+        This example is a live power monitor for the Bird 4421A
+        Multifuntion Power Meter that acquires on a background thread and
+        renders on the GUI thread, each at its own rate.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file monitor_4421A.py
+
+"""
+import time
+
+import matplotlib.pyplot as plt
+
+from sampler_4421A import Sampler
+from ringbuffer_4421A import PowerRingBuffer
+from liveplot_4421A import LivePowerPlot
+
+
+class LivePowerMonitor():
+    """Live forward/reflected power display with independent sample and
+    frame rates.
+
+    A Sampler thread writes every reading straight into a PowerRingBuffer;
+    it never waits on the display. The GUI thread wakes at frame_rate_hz,
+    takes whatever arrived since the previous frame from the ring and
+    redraws. When a frame takes longer than the frame interval, the frames
+    that would have queued up behind it are skipped instead of delayed, so
+    the display always shows the latest data.
+    """
+    def __init__(self, meter, sample_rate_hz:float=20, frame_rate_hz:float=10,
+                 sensor:int=1, capacity:int=None, title:str="4421A Forward Power Sampling",
+                 fwd_ylim=None, refl_ylim=None):
+        self.__frame_interval = 1.0 / frame_rate_hz
+        if capacity is None:
+            # Room for several frames' worth of samples between redraws.
+            capacity = max(int(16 * sample_rate_hz / frame_rate_hz), 1024)
+        self.buffer = PowerRingBuffer(capacity)
+        self.sampler = Sampler(meter, sample_rate_hz, sensors=(sensor,), max_queue=0, sink=self.buffer)
+        self.plot = LivePowerPlot(title, fwd_ylim=fwd_ylim, refl_ylim=refl_ylim)
+
+        self.__timer = None
+        self.__t1 = None
+        self.__plotted = 0
+        self.__skip = 0
+
+        self.frames = 0
+        self.frames_skipped = 0
+        self.samples_missed = 0
+        self.last_frame_time = 0.0
+
+    def stats(self):
+        """Reports the acquisition and rendering counters.
+
+        Returns:
+            dict: Sampler statistics plus frame, skip and missed sample counts.
+        """
+        stats = self.sampler.stats()
+        stats.update({
+            "frames": self.frames,
+            "frames_skipped": self.frames_skipped,
+            "samples_missed": self.samples_missed,
+            "last_frame_time": self.last_frame_time,
+        })
+        return stats
+
+    def render(self):
+        """
+        Draw one frame from the samples acquired since the previous frame.
+        Normally driven by the GUI timer.
+        """
+        if self.__skip > 0:
+            self.__skip -= 1
+            self.frames_skipped += 1
+            return
+        now = time.monotonic()
+
+        total = self.buffer.total
+        new_samples = total - self.__plotted
+        # Samples the writer has already lapped cannot be shown any more.
+        visible = min(new_samples, self.buffer.capacity - 1)
+        self.samples_missed += new_samples - visible
+        self.__plotted = total
+
+        if visible > 0:
+            # Slice [total - visible, total) against the same count, however
+            # many samples the sampler thread has appended since.
+            new = self.buffer.latest(visible, end=total)
+            if self.__t1 is None:
+                self.__t1 = new["timestamp"][0]
+            self.plot.extend(new["timestamp"] - self.__t1, new["forward"], new["reflected"])
+            self.plot.refresh()
+            self.frames += 1
+
+        self.last_frame_time = time.monotonic() - now
+        self.__skip = int(self.last_frame_time // self.__frame_interval)
+
+    def start(self):
+        """Starts acquisition and the frame timer without blocking.
+        """
+        self.sampler.start()
+        self.__timer = self.plot.fig.canvas.new_timer(interval=int(self.__frame_interval * 1000))
+        self.__timer.add_callback(self.render)
+        self.__timer.start()
+
+    def stop(self):
+        """Stops the frame timer and acquisition.
+        """
+        if self.__timer is not None:
+            self.__timer.stop()
+            self.__timer = None
+        self.sampler.stop()
+
+    def run(self, duration:float=None):
+        """
+        Run the monitor until the window is closed or duration has elapsed.
+
+        Args:
+            duration (float, optional): Run time in seconds. Defaults to None (until the window closes).
+        """
+        self.start()
+        try:
+            if duration is None:
+                plt.show()
+            else:
+                end = time.monotonic() + duration
+                while time.monotonic() < end and plt.fignum_exists(self.plot.fig.number):
+                    plt.pause(self.__frame_interval)
+        finally:
+            self.stop()
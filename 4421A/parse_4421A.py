@@ -0,0 +1,127 @@
+"""
+Example Description:
+        This example is a bulk reply parser for the Bird 4421A Multifuntion
+        Power Meter. It turns comma or semicolon separated replies, and
+        blocks of buffered reply lines, into NumPy arrays in one pass.
+        SCPI over-range and not-a-number sentinels, NaN and INF replies
+        and unparsable values become NaN and are flagged in a validity
+        mask instead of raising.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file parse_4421A.py
+
+"""
+import re
+from itertools import chain
+
+import numpy as np
+
+from series_4421A import OVERRANGE
+
+_NUMBER = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+
+
+def _convert(tokens):
+    """Tokens to (values, valid); at most one exception per call."""
+    try:
+        # One C-level conversion for the whole list in the common case.
+        values = np.array(tokens, dtype=np.float64)
+    except ValueError:
+        # Something in the block is not a number. Convert only the tokens
+        # that look like numbers, so no per-value exceptions are raised.
+        values = np.full(len(tokens), np.nan)
+        numeric = [i for i, token in enumerate(tokens) if _NUMBER.fullmatch(token)]
+        if numeric:
+            values[numeric] = np.array([tokens[i] for i in numeric], dtype=np.float64)
+    valid = np.abs(values) < OVERRANGE
+    values[~valid] = np.nan
+    return values, valid
+
+
+def _text(data):
+    return data.decode(errors="replace") if isinstance(data, (bytes, bytearray)) else data
+
+
+def _split(line:str):
+    # str.replace and str.split are several times faster than re.split.
+    # An empty field stays in as an empty, invalid token.
+    return line.replace(",", ";").split(";")
+
+
+def parse_values(reply):
+    """
+    Parse every value in a reply, or in several replies joined by newlines.
+
+    Args:
+        reply (str or bytes): Comma, semicolon or newline separated values.
+
+    Returns:
+        tuple: (values, valid), a float64 array with NaN for every sentinel
+            or invalid value, and a bool array that is False at those values.
+    """
+    text = _text(reply).strip()
+    if not text:
+        return np.empty(0), np.empty(0, dtype=bool)
+    return _convert(_split(text.replace("\n", ";")))
+
+
+def parse_block(lines, width:int=None):
+    """
+    Parse a block of buffered reply lines of the same shape, such as scan
+    list replies read back from a log, into one row per line.
+
+    A line with the wrong number of values is kept as a row of NaN with
+    its mask cleared, so rows stay aligned with the lines they came from.
+
+    Args:
+        lines (str, bytes or iterable of str): Newline separated block or
+            its lines.
+        width (int, optional): Values per line. Defaults to the number in
+            the first line.
+
+    Returns:
+        tuple: (values, valid), float64 and bool arrays of shape
+            (lines, width).
+    """
+    if isinstance(lines, (str, bytes, bytearray)):
+        lines = _text(lines).replace(",", ";").splitlines()
+    else:
+        lines = [_text(line).replace(",", ";") for line in lines]
+    rows = [line.split(";") for line in lines if line and not line.isspace()]
+    if not rows:
+        return np.empty((0, width or 0)), np.empty((0, width or 0), dtype=bool)
+    if width is None:
+        width = len(rows[0])
+
+    misshapen = [i for i, row in enumerate(rows) if len(row) != width]
+    padding = ["NaN"] * width
+    for i in misshapen:
+        rows[i] = padding
+    tokens = list(chain.from_iterable(rows))
+    values, valid = _convert(tokens)
+    return values.reshape(len(rows), width), valid.reshape(len(rows), width)
@@ -0,0 +1,322 @@
+"""
+Example Description:
+        This example is a process-wide VISA resource manager and session
+        pool for the Bird 4421A Multifuntion Power Meter, so short-lived
+        driver objects can reuse warm, already-configured sessions.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file pool_4421A.py
+
+"""
+import sys
+import threading
+import time
+
+SERIAL_SETTINGS = ("baud_rate", "data_bits", "stop_bits", "parity", "flow_control")
+
+_resource_manager = None
+_lock = threading.Lock()
+
+
+def visa_exception(name:str="VisaIOError"):
+    """
+    Returns a pyvisa exception class for use in an except clause without
+    importing pyvisa. Until pyvisa has been imported no VISA call can have
+    raised, so an empty tuple (which matches nothing) is returned instead.
+
+    Args:
+        name (str, optional): Exception class name. Defaults to "VisaIOError".
+
+    Returns:
+        type or tuple: The exception class, or ().
+    """
+    pyvisa = sys.modules.get("pyvisa")
+    return () if pyvisa is None else getattr(pyvisa, name)
+
+
+def shared_resource_manager():
+    """
+    Returns the process-wide pyvisa ResourceManager, creating it on first use.
+
+    Returns:
+        pyvisa.ResourceManager: The shared resource manager.
+    """
+    global _resource_manager
+    if _resource_manager is None:
+        with _lock:
+            if _resource_manager is None:
+                import pyvisa
+
+                _resource_manager = pyvisa.ResourceManager()
+    return _resource_manager
+
+
+def configure_session(session, **settings):
+    """
+    Apply the 4421A line terminations and any RS232 settings to a VISA
+    session.
+
+    Args:
+        session: An open pyvisa message-based resource.
+        stop_bits, data_bits, baud_rate, parity, flow_control (optional): RS232 settings.
+    """
+    session.write_termination = "\n"
+    session.read_termination = "\n"
+    try:
+        session.send_end = True
+    except visa_exception():
+        # Not every backend exposes END on socket sessions.
+        pass
+    for name in SERIAL_SETTINGS:
+        if settings.get(name) is not None:
+            setattr(session, name, settings[name])
+
+
+def _idn_health_check(session):
+    return bool(session.query("*IDN?").strip())
+
+
+def _drain(session):
+    """Clear the session and discard any reply still waiting to be read."""
+    session.clear()
+    timeout = session.timeout
+    session.timeout = 0
+    try:
+        while True:
+            session.read()
+    except visa_exception():
+        # Nothing left to read.
+        pass
+    finally:
+        session.timeout = timeout
+
+
+class SessionPool():
+    """Warm VISA sessions keyed by resource string and serial settings.
+
+    checkout() hands back an idle session for the same resource string
+    and serial settings when one is available, with terminations, timeout
+    and serial settings already applied; otherwise it opens and configures
+    a new one. checkin() clears the session and drains any unread reply,
+    so the next user cannot read the previous user's data, and returns
+    it for reuse instead of closing it. A session whose last user hit an
+    I/O error or timeout must be given to discard() instead: a late reply
+    may still be on its way.
+
+    At most max_idle_per_key idle sessions are kept per key and at most
+    max_sessions are open in total; sessions idle for longer than
+    idle_timeout seconds are closed. A session that has been idle for
+    check_after seconds or more is passed to health_check before it is
+    handed out and is replaced if the check fails or raises.
+    """
+    def __init__(self, max_sessions:int=64, max_idle_per_key:int=4, idle_timeout:float=300.0,
+                 health_check=_idn_health_check, check_after:float=30.0, wait_timeout:float=5.0,
+                 resource_manager=None):
+        self.__max_sessions = max_sessions
+        self.__max_idle_per_key = max_idle_per_key
+        self.__idle_timeout = idle_timeout
+        self.__health_check = health_check
+        self.__check_after = check_after
+        self.__wait_timeout = wait_timeout
+        self.__resource_manager = resource_manager
+        self.__idle = {}
+        self.__keys = {}
+        self.__open = 0
+        self.__condition = threading.Condition()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.failed_checks = 0
+
+    @staticmethod
+    def key(resource_string:str, **settings):
+        """The pool key for a resource string and its serial settings."""
+        return (resource_string, tuple(sorted(
+            (name, settings[name]) for name in SERIAL_SETTINGS if settings.get(name) is not None
+        )))
+
+    def stats(self):
+        with self.__condition:
+            return {
+                "open": self.__open,
+                "idle": sum(len(sessions) for sessions in self.__idle.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "failed_checks": self.failed_checks,
+            }
+
+    def __close(self, session):
+        self.__keys.pop(id(session), None)
+        self.__open -= 1
+        try:
+            session.close()
+        except visa_exception():
+            pass
+
+    def __evict_expired(self, now:float):
+        for key in list(self.__idle):
+            sessions = self.__idle[key]
+            while sessions and now - sessions[0][1] >= self.__idle_timeout:
+                self.__close(sessions.pop(0)[0])
+                self.evictions += 1
+            if not sessions:
+                del self.__idle[key]
+
+    def __evict_oldest(self):
+        oldest = None
+        for key, sessions in self.__idle.items():
+            if sessions and (oldest is None or sessions[0][1] < self.__idle[oldest][0][1]):
+                oldest = key
+        if oldest is None:
+            return False
+        self.__close(self.__idle[oldest].pop(0)[0])
+        if not self.__idle[oldest]:
+            del self.__idle[oldest]
+        self.evictions += 1
+        return True
+
+    def evict_idle(self):
+        """Closes every idle session that has passed the idle timeout.
+        """
+        with self.__condition:
+            self.__evict_expired(time.monotonic())
+
+    def __open_session(self, resource_string:str, settings:dict):
+        rm = self.__resource_manager or shared_resource_manager()
+        session = rm.open_resource(resource_string)
+        configure_session(session, **settings)
+        return session
+
+    def checkout(self, resource_string:str, timeout:int=5000, **settings):
+        """
+        Take a configured session for the resource, reusing an idle one
+        when possible.
+
+        Args:
+            resource_string (str): VISA instrument resource string.
+            timeout (int, optional): The instrument timeout response value in ms. Defaults to 5000.
+            stop_bits, data_bits, baud_rate, parity, flow_control (optional): RS232 settings.
+
+        Returns:
+            pyvisa.resources.MessageBasedResource: The session.
+        """
+        key = self.key(resource_string, **settings)
+        while True:
+            session = None
+            with self.__condition:
+                now = time.monotonic()
+                self.__evict_expired(now)
+                sessions = self.__idle.get(key)
+                if sessions:
+                    session, idle_since = sessions.pop()
+                    if not sessions:
+                        del self.__idle[key]
+                else:
+                    deadline = now + self.__wait_timeout
+                    while self.__open >= self.__max_sessions and not self.__evict_oldest():
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RuntimeError("session pool exhausted")
+                        self.__condition.wait(remaining)
+                    self.__open += 1
+
+            if session is None:
+                self.misses += 1
+                try:
+                    session = self.__open_session(resource_string, settings)
+                except Exception:
+                    with self.__condition:
+                        self.__open -= 1
+                        self.__condition.notify()
+                    raise
+                with self.__condition:
+                    self.__keys[id(session)] = key
+                session.timeout = timeout
+                return session
+
+            session.timeout = timeout
+            if self.__health_check is not None and now - idle_since >= self.__check_after:
+                try:
+                    healthy = self.__health_check(session)
+                except Exception:
+                    healthy = False
+                if not healthy:
+                    self.failed_checks += 1
+                    with self.__condition:
+                        self.__close(session)
+                        self.__condition.notify()
+                    continue
+            self.hits += 1
+            return session
+
+    def checkin(self, session):
+        """
+        Return a session to the pool for reuse.
+
+        Args:
+            session: A session obtained from checkout().
+        """
+        with self.__condition:
+            if id(session) not in self.__keys:
+                return
+        try:
+            _drain(session)
+        except Exception:
+            self.discard(session)
+            return
+        with self.__condition:
+            key = self.__keys.get(id(session))
+            if key is None:
+                return
+            sessions = self.__idle.setdefault(key, [])
+            if len(sessions) >= self.__max_idle_per_key:
+                self.__close(session)
+            else:
+                sessions.append((session, time.monotonic()))
+            self.__condition.notify()
+
+    def discard(self, session):
+        """
+        Close a session instead of returning it, for example after an I/O error.
+        """
+        with self.__condition:
+            if id(session) in self.__keys:
+                self.__close(session)
+                self.__condition.notify()
+
+    def close(self):
+        """Closes every idle session. Sessions still checked out are closed on checkin.
+        """
+        with self.__condition:
+            for sessions in self.__idle.values():
+                for session, _ in sessions:
+                    self.__close(session)
+            self.__idle.clear()
+            self.__max_idle_per_key = 0
@@ -0,0 +1,258 @@
+"""
+Example Description:
+        This example is a self-healing connection for the Bird 4421A
+        Multifuntion Power Meter. It wraps any of the driver transports,
+        notices when the link has broken, and reconnects in the background
+        of ordinary calls with jittered exponential backoff, restoring the
+        session settings and checking with *IDN? that it is talking to the
+        same meter before any reading is trusted again.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file resilient_4421A.py
+
+"""
+import random
+import sys
+import time
+from collections import deque
+
+from pool_4421A import visa_exception
+
+
+def _is_timeout(err):
+    if isinstance(err, TimeoutError):
+        return True
+    pyvisa = sys.modules.get("pyvisa")
+    return (pyvisa is not None and isinstance(err, visa_exception("VisaIOError"))
+            and err.error_code == pyvisa.constants.StatusCode.error_timeout)
+
+
+def _is_link_error(err):
+    # Garbled replies raise ValueError and are not a broken link.
+    return isinstance(err, (OSError, visa_exception("VisaIOError")))
+
+
+class ResilientTransport():
+    """A transport that reconnects itself after the link breaks.
+
+    It wraps a VisaTransport, SocketTransport or SerialTransport and has
+    the same open/close/write/read/query/timeout contract, so Series4421A
+    uses it like any other transport. A connection error, or timeouts
+    consecutive timeouts, mark the link broken. The failing call still
+    raises, so the caller sees the missed reading.
+
+    The transport is closed as soon as the link is found broken, which
+    for a pooled VisaTransport discards the session instead of returning
+    it to the pool. While broken, each call first tries to reconnect: the
+    transport is (re)opened, which re-applies its terminations and serial
+    settings, the timeout is restored, *IDN? must match the identity
+    read at the first open, and the setup commands are sent again. Until
+    it succeeds, calls raise ConnectionError at once without touching the
+    link, and attempts are spaced by exponential backoff from base_delay
+    to max_delay, each delay shortened by up to jitter (a fraction) at
+    random so that many clients do not retry in lockstep. Nothing blocks
+    between attempts, so a Sampler keeps its schedule through an outage.
+
+    Args:
+        transport: The transport to keep connected, not yet opened.
+        setup (tuple, optional): SCPI commands sent after every (re)connect.
+        base_delay (float, optional): First retry delay in seconds. Defaults to 0.5.
+        max_delay (float, optional): Longest retry delay in seconds. Defaults to 30.
+        jitter (float, optional): Random fraction taken off each delay. Defaults to 0.5.
+        timeouts (int, optional): Consecutive timeouts that mean the link is
+            broken. Defaults to 2.
+        seed (int, optional): Seed for the jitter. Defaults to None.
+    """
+    def __init__(self, transport, setup=(), base_delay:float=0.5, max_delay:float=30.0,
+                 jitter:float=0.5, timeouts:int=2, seed:int=None):
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        self.__transport = transport
+        self.__setup = tuple(setup)
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__jitter = jitter
+        self.__max_timeouts = timeouts
+        self.__rng = random.Random(seed)
+        self.__timeout = transport.timeout
+        self.__identity = None
+        self.__broken = False
+        self.__timeouts = 0
+        self.__failing_since = None
+        self.__failures = 0
+        self.__next_attempt = 0.0
+        self.__down_since = None
+        self.outages = deque(maxlen=100)
+
+        self.disconnects = 0
+        self.reconnects = 0
+        self.attempts = 0
+        self.last_error = None
+
+    @property
+    def transport(self):
+        """The wrapped transport.
+        """
+        return self.__transport
+
+    @property
+    def identity(self):
+        """The *IDN? reply every reconnect must match.
+        """
+        return self.__identity
+
+    @property
+    def connected(self):
+        return self.__identity is not None and not self.__broken
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, value:int):
+        self.__timeout = value
+        self.__transport.timeout = value
+
+    def stats(self):
+        """Reports the connection state and reconnect counters.
+
+        Returns:
+            dict: Whether connected, disconnect, reconnect and attempt
+                counts, the total and last outage in seconds, the seconds
+                until the next attempt while down, and the last error.
+        """
+        total = sum((end - start for start, end in self.outages), 0.0)
+        return {
+            "connected": self.connected,
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "attempts": self.attempts,
+            "outage_s": total,
+            "last_outage_s": self.outages[-1][1] - self.outages[-1][0] if self.outages else 0.0,
+            "next_attempt_s": max(0.0, self.__next_attempt - time.monotonic()) if self.__broken else 0.0,
+            "last_error": self.last_error,
+        }
+
+    def __restore(self):
+        self.__transport.timeout = self.__timeout
+        if hasattr(self.__transport, "clear"):
+            self.__transport.clear()
+        identity = self.__transport.query("*IDN?").rstrip()
+        if self.__identity is None:
+            self.__identity = identity
+        elif identity != self.__identity:
+            raise ConnectionError(f"reconnected to {identity!r}, expected {self.__identity!r}")
+        for cmd in self.__setup:
+            self.__transport.write(cmd)
+
+    def open(self):
+        """Opens the link and records the identity to check on reconnect.
+        """
+        self.__transport.open()
+        self.__restore()
+        self.__broken = False
+        self.__timeouts = 0
+
+    def close(self):
+        self.__broken = False
+        self.__transport.close()
+
+    def __fail(self, err, started:float):
+        self.last_error = f"{err}"
+        if self.__failing_since is None:
+            self.__failing_since = time.time() - (time.monotonic() - started)
+        if _is_timeout(err):
+            self.__timeouts += 1
+            if self.__timeouts < self.__max_timeouts:
+                return
+        elif not _is_link_error(err):
+            return
+        self.__broken = True
+        self.__timeouts = 0
+        self.__failures = 0
+        self.__next_attempt = time.monotonic()
+        # The outage began with the first of the failing calls that led
+        # here, when it was made, not when it finally timed out.
+        self.__down_since = self.__failing_since
+        self.__failing_since = None
+        self.disconnects += 1
+        # Let go of the dead link now. A pooled VisaTransport discards its
+        # session rather than checking it back in, so the reconnect gets a
+        # fresh one instead of the same broken session.
+        self.__drop()
+
+    def __drop(self):
+        try:
+            self.__transport.close()
+        except Exception:
+            pass
+
+    def __reconnect(self):
+        now = time.monotonic()
+        if now < self.__next_attempt:
+            raise ConnectionError(
+                f"link down, next reconnect in {self.__next_attempt - now:0.1f} s: {self.last_error}"
+            )
+        self.attempts += 1
+        try:
+            self.__drop()
+            self.__transport.open()
+            self.__restore()
+        except Exception as err:
+            self.last_error = f"{err}"
+            delay = min(self.__max_delay, self.__base_delay * 2 ** self.__failures)
+            delay *= 1 - self.__jitter * self.__rng.random()
+            self.__failures += 1
+            self.__next_attempt = time.monotonic() + delay
+            raise ConnectionError(f"reconnect attempt {self.__failures} failed: {err}") from err
+        self.__broken = False
+        self.reconnects += 1
+        self.outages.append((self.__down_since, time.time()))
+
+    def __call(self, method, cmd=None):
+        if self.__broken:
+            self.__reconnect()
+        started = time.monotonic()
+        try:
+            result = method() if cmd is None else method(cmd)
+        except Exception as err:
+            self.__fail(err, started)
+            raise
+        self.__timeouts = 0
+        self.__failing_since = None
+        return result
+
+    def write(self, cmd):
+        return self.__call(self.__transport.write, cmd)
+
+    def read(self):
+        return self.__call(self.__transport.read)
+
+    def query(self, cmd):
+        return self.__call(self.__transport.query, cmd)
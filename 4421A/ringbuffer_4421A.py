@@ -0,0 +1,158 @@
+"""
+Example Description:
+        This example is a fixed-memory ring buffer used to hold a
+        continuous capture of Bird 4421A forward and reflected power
+        samples in a preallocated NumPy structured array.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ringbuffer_4421A.py
+
+"""
+import numpy as np
+
+SAMPLE_DTYPE = np.dtype([
+    ("timestamp", "f8"),
+    ("sensor", "u1"),
+    ("forward", "f8"),
+    ("reflected", "f8"),
+])
+
+
+class PowerRingBuffer():
+    """A preallocated ring of power samples with O(1) append.
+
+    Every record is written twice, at its slot and at the same slot in a
+    mirror copy directly after the ring, so the most recent N records
+    (for any N up to the capacity) always sit in one contiguous stretch of
+    memory and can be returned as a view without copying. Memory use is
+    fixed at 2 * capacity * SAMPLE_DTYPE.itemsize bytes however long the
+    capture runs.
+
+    The buffer has a single writer. A reader on another thread sees only
+    completed records, but should ask for fewer than capacity records if
+    the writer may lap it while it is still using the view.
+    """
+    def __init__(self, capacity:int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.__capacity = capacity
+        self.__data = np.zeros(2 * capacity, dtype=SAMPLE_DTYPE)
+        self.__count = 0
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def total(self):
+        """The number of samples appended since the buffer was created.
+        """
+        return self.__count
+
+    @property
+    def nbytes(self):
+        return self.__data.nbytes
+
+    def __len__(self):
+        return min(self.__count, self.__capacity)
+
+    def append(self, timestamp:float, sensor:int, forward:float, reflected:float):
+        """
+        Store one sample, overwriting the oldest once the buffer is full.
+
+        Args:
+            timestamp (float): Sample time in seconds since the epoch.
+            sensor (int): Sensor channel the sample came from.
+            forward (float): Forward power in Watts.
+            reflected (float): Reflected power in Watts.
+        """
+        slot = self.__count % self.__capacity
+        record = (timestamp, sensor, forward, reflected)
+        self.__data[slot] = record
+        self.__data[slot + self.__capacity] = record
+        self.__count += 1
+
+    def extend(self, records):
+        """
+        Store a block of samples given as a SAMPLE_DTYPE array.
+
+        Args:
+            records (numpy.ndarray): Samples in time order.
+        """
+        records = np.asarray(records, dtype=SAMPLE_DTYPE)
+        if len(records) > self.__capacity:
+            self.__count += len(records) - self.__capacity
+            records = records[-self.__capacity:]
+        slot = self.__count % self.__capacity
+        first = min(len(records), self.__capacity - slot)
+        for offset in (0, self.__capacity):
+            self.__data[offset + slot:offset + slot + first] = records[:first]
+            self.__data[offset:offset + len(records) - first] = records[first:]
+        self.__count += len(records)
+
+    def latest(self, n:int=None, end:int=None):
+        """
+        Return the most recent samples, oldest first.
+
+        With end, the window stops at that absolute sample count instead of
+        at the newest sample. A reader racing the writer takes total once
+        and passes it as end, so the slice matches the count it was given.
+
+        Args:
+            n (int, optional): Number of samples. Defaults to None (all stored samples).
+            end (int, optional): Total the window ends at. Defaults to None (total now).
+
+        Returns:
+            numpy.ndarray: A read-only view into the buffer.
+        """
+        total = self.__count
+        end = total if end is None else min(end, total)
+        stored = max(0, end - max(0, total - self.__capacity))
+        n = stored if n is None else max(0, min(n, stored))
+        stop = end % self.__capacity + (self.__capacity if end >= self.__capacity else 0)
+        view = self.__data[stop - n:stop]
+        view.flags.writeable = False
+        return view
+
+    def last_seconds(self, seconds:float, now:float=None):
+        """
+        Return the samples taken in the last given number of seconds.
+
+        Args:
+            seconds (float): Length of the window.
+            now (float, optional): End of the window. Defaults to None (the newest sample).
+
+        Returns:
+            numpy.ndarray: A read-only view into the buffer.
+        """
+        window = self.latest()
+        if len(window) == 0:
+            return window
+        stamps = window["timestamp"]
+        end = stamps[-1] if now is None else now
+        return window[np.searchsorted(stamps, end - seconds, side="left"):]
@@ -0,0 +1,278 @@
+"""
+Example Description:
+        This example is a streaming sampler used to acquire forward and
+        reflected power from the Bird 4421A Multifuntion Power Meter at a
+        fixed rate, independent of how quickly the samples are consumed.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file sampler_4421A.py
+
+"""
+import asyncio
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+Sample = namedtuple("Sample", ["timestamp", "monotonic", "sensor", "forward", "reflected"])
+Gap = namedtuple("Gap", ["start", "end", "ticks"])
+
+NAN = float("nan")
+
+
+class Sampler():
+    """Acquires samples from a connected Series4421A on a fixed schedule.
+
+    Acquisition runs on its own thread against ticks of a monotonic clock,
+    so the rate does not drift and does not depend on the consumer. When a
+    reading finishes after the next tick was due the sampler records an
+    overrun and either runs the missed ticks back to back ("catchup") or
+    drops them and waits for the next tick in the future ("skip").
+
+    Samples are handed to the consumer through a bounded queue. When the
+    consumer falls behind and the queue fills, the "drop" policy discards
+    the oldest queued sample so acquisition keeps its rate, and the "block"
+    policy holds acquisition until the consumer catches up.
+
+    A sink, such as a PowerRingBuffer, receives every sample directly on
+    the acquisition thread through its append(timestamp, sensor, forward,
+    reflected) method. Pass max_queue=0 when only the sink is used.
+
+    on_sample, such as an AlarmEngine, is called with each Sample on the
+    acquisition thread before the sink and the queue see it, so it acts
+    on a reading as soon as it arrives. Keep it short: it delays the
+    next tick. An exception it raises is counted as an error.
+
+    A failed reading does not stop acquisition; the schedule carries on
+    and, with mark_gaps, the first failed tick of an outage is marked by
+    a sample of NaN power for each sensor, so sinks, plots and logs show
+    a break rather than a line across it. When readings resume, the
+    outage is added to gaps as a Gap of start and end timestamps and the
+    number of ticks without a reading. With a resilient Series4421A this
+    covers a reconnect.
+    """
+    def __init__(self, meter, rate_hz:float, sensors=(1,), overrun:str="skip",
+                 backpressure:str="drop", max_queue:int=1024, count:int=None, sink=None,
+                 on_sample=None, mark_gaps:bool=True):
+        if overrun not in ("skip", "catchup"):
+            raise ValueError(f"unknown overrun policy: {overrun}")
+        if backpressure not in ("drop", "block"):
+            raise ValueError(f"unknown backpressure policy: {backpressure}")
+        self.__meter = meter
+        self.__period = 1.0 / rate_hz
+        self.__sensors = tuple(sensors)
+        self.__overrun = overrun
+        self.__backpressure = backpressure
+        self.__count = count
+        self.__sink = sink
+        self.__on_sample = on_sample
+        self.__mark_gaps = mark_gaps
+        self.__gap_start = None
+        self.__gaps = deque(maxlen=1000)
+        self.__queue = queue.Queue(maxsize=max_queue) if max_queue > 0 else None
+        self.__stop = threading.Event()
+        self.__done = threading.Event()
+        self.__thread = None
+
+        self.ticks = 0
+        self.samples = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error = None
+
+    @property
+    def period(self):
+        """The sample period in seconds.
+        """
+        return self.__period
+
+    @property
+    def gaps(self):
+        """The most recent outages, oldest first, as Gap tuples.
+        """
+        return list(self.__gaps)
+
+    @property
+    def running(self):
+        return self.__thread is not None and not self.__done.is_set()
+
+    def stats(self):
+        """Reports the acquisition counters.
+
+        Returns:
+            dict: Tick, sample, overrun, skip, drop and error counts.
+        """
+        return {
+            "ticks": self.ticks,
+            "samples": self.samples,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "gaps": len(self.__gaps),
+            "in_gap": self.__gap_start is not None,
+            "queued": 0 if self.__queue is None else self.__queue.qsize(),
+        }
+
+    def start(self):
+        """Starts the acquisition thread if it is not already running.
+        """
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self.__run, name="sampler4421A", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stops acquisition and waits for the acquisition thread to exit.
+        """
+        self.__stop.set()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __publish(self, sample:Sample):
+        if self.__backpressure == "block":
+            while not self.__stop.is_set():
+                try:
+                    self.__queue.put(sample, timeout=self.__period)
+                    return
+                except queue.Full:
+                    continue
+            return
+        while True:
+            try:
+                self.__queue.put_nowait(sample)
+                return
+            except queue.Full:
+                try:
+                    self.__queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def __acquire(self, scan):
+        started = time.monotonic()
+        try:
+            reading = scan.run()
+        except Exception as err:
+            self.errors += 1
+            self.last_error = f"{err}"
+            if self.__gap_start is None:
+                # The gap starts when the failed reading was asked for; a
+                # dead link can take the whole timeout to fail.
+                self.__gap_start = (time.time() - (time.monotonic() - started), started)
+                if self.__mark_gaps:
+                    self.__deliver(self.__gap_start[0], self.__gap_start[1],
+                                   (NAN,) * (2 * len(self.__sensors)))
+            return
+        timestamp = time.time()
+        now = time.monotonic()
+        if self.__gap_start is not None:
+            start, start_monotonic = self.__gap_start
+            self.__gap_start = None
+            self.__gaps.append(Gap(start, timestamp, round((now - start_monotonic) / self.__period)))
+        self.__deliver(timestamp, now, reading)
+
+    def __deliver(self, timestamp:float, now:float, reading):
+        for i, sensor in enumerate(self.__sensors):
+            fwd = reading[2 * i]
+            refl = reading[2 * i + 1]
+            sample = None
+            if self.__on_sample is not None:
+                sample = Sample(timestamp, now, sensor, fwd, refl)
+                try:
+                    self.__on_sample(sample)
+                except Exception as err:
+                    self.errors += 1
+                    self.last_error = f"{err}"
+            if self.__sink is not None:
+                self.__sink.append(timestamp, sensor, fwd, refl)
+            if self.__queue is not None:
+                self.__publish(sample or Sample(timestamp, now, sensor, fwd, refl))
+            self.samples += 1
+
+    def __run(self):
+        try:
+            scan = self.__meter.measure.scan_list(self.__sensors)
+            period = self.__period
+            next_tick = time.monotonic()
+            while not self.__stop.is_set():
+                delay = next_tick - time.monotonic()
+                if delay > 0 and self.__stop.wait(delay):
+                    break
+
+                self.__acquire(scan)
+                self.ticks += 1
+                if self.__count is not None and self.ticks >= self.__count:
+                    break
+
+                next_tick += period
+                late = time.monotonic() - next_tick
+                if late > 0:
+                    self.overruns += 1
+                    if self.__overrun == "skip":
+                        missed = int(late // period) + 1
+                        self.skipped += missed
+                        next_tick += missed * period
+        finally:
+            self.__done.set()
+
+    def __next_sample(self):
+        if self.__queue is None:
+            raise RuntimeError("sampler was created without a sample queue")
+        while True:
+            try:
+                return self.__queue.get(timeout=self.__period)
+            except queue.Empty:
+                if self.__done.is_set() and self.__queue.empty():
+                    return None
+
+    def __iter__(self):
+        self.start()
+        while True:
+            sample = self.__next_sample()
+            if sample is None:
+                return
+            yield sample
+
+    async def __aiter__(self):
+        self.start()
+        while True:
+            sample = await asyncio.to_thread(self.__next_sample)
+            if sample is None:
+                return
+            yield sample
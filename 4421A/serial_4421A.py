@@ -0,0 +1,211 @@
+"""
+Example Description:
+        This example is a serial link toolkit for the Bird 4421A Multifuntion
+        Power Meter on RS-232. It moves the meter and the port to the fastest
+        baud rate both will hold, verifying the link with *IDN? and falling
+        back to the last rate that worked, and works out how many bytes each
+        reading costs on the wire and how many readings per second the link
+        can carry with the current settings.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file serial_4421A.py
+
+"""
+import time
+
+from series_4421A import ScanList
+
+BAUD_RATES = (115200, 57600, 38400, 19200, 9600)
+
+# The SCPI-1999 node for the serial port rate. Pass another command to
+# negotiate_baud() if the meter's firmware uses a different one.
+BAUD_COMMAND = "SYST:COMM:SER:BAUD"
+
+
+def character_bits(data_bits:int=8, parity:str="N", stop_bits:float=1):
+    """
+    Bits on the wire per byte: start bit, data bits, parity bit and stop bits.
+
+    Returns:
+        float: Bits per character, such as 10 for 8N1.
+    """
+    return 1 + data_bits + (0 if parity in ("N", None) else 1) + stop_bits
+
+
+def link_budget(baud_rate:int, command:str, reply, values:int=1, data_bits:int=8,
+                parity:str="N", stop_bits:float=1, turnaround:float=0.0):
+    """
+    Work out what a query costs on a serial link.
+
+    Args:
+        baud_rate (int): Line rate in bits per second.
+        command (str): The query as sent, without terminator.
+        reply (str or int): A typical reply without terminator, or its length.
+        values (int, optional): Readings returned by one query, as in a scan
+            list. Defaults to 1.
+        data_bits (int, optional): Defaults to 8.
+        parity (str, optional): "N", "E", "O", "M" or "S". Defaults to "N".
+        stop_bits (float, optional): Defaults to 1.
+        turnaround (float, optional): Seconds the meter takes to answer,
+            added to each query. Defaults to 0 (the wire alone).
+
+    Returns:
+        dict: Bytes out and in per query, bytes per reading, wire and query
+            time in ms, and achievable queries and readings per second.
+    """
+    bytes_out = len(command) + 1
+    bytes_in = (reply if isinstance(reply, int) else len(reply)) + 1
+    bits = character_bits(data_bits, parity, stop_bits)
+    wire = (bytes_out + bytes_in) * bits / baud_rate
+    query = wire + turnaround
+    return {
+        "baud_rate": baud_rate,
+        "bits_per_byte": bits,
+        "bytes_out": bytes_out,
+        "bytes_in": bytes_in,
+        "bytes_per_reading": (bytes_out + bytes_in) / values,
+        "wire_ms": wire * 1e3,
+        "query_ms": query * 1e3,
+        "queries_per_s": 1 / query,
+        "readings_per_s": values / query,
+    }
+
+
+def measure_link(transport, sensors=(1,), quantities=("forward", "reflected"), queries:int=20):
+    """
+    Measure the budget of a scan list on an open SerialTransport.
+
+    The scan list is sent queries times. Its reply sets the bytes in, and
+    the time each query took beyond the wire time is taken as the meter's
+    turnaround.
+
+    Args:
+        transport (SerialTransport): The open port to the meter.
+        sensors (tuple, optional): Sensors to read. Defaults to (1,).
+        quantities (tuple, optional): Defaults to ("forward", "reflected").
+        queries (int, optional): Queries to time. Defaults to 20.
+
+    Returns:
+        dict: As link_budget(), plus the measured mean query time in ms.
+    """
+    scan = ScanList(transport, sensors, quantities)
+    reply = transport.query(scan.command)
+    start = time.perf_counter()
+    for _ in range(queries):
+        reply = transport.query(scan.command)
+    measured = (time.perf_counter() - start) / queries
+
+    settings = dict(
+        values=len(scan.fields),
+        data_bits=transport.data_bits,
+        parity=transport.parity,
+        stop_bits=transport.stop_bits,
+    )
+    wire = link_budget(transport.baud_rate, scan.command, reply, **settings)["wire_ms"] / 1e3
+    budget = link_budget(transport.baud_rate, scan.command, reply,
+                         turnaround=max(0.0, measured - wire), **settings)
+    budget["measured_ms"] = measured * 1e3
+    return budget
+
+
+def _identify(transport, timeout:int):
+    """The *IDN? reply at the port's current rate, or None if garbled or silent."""
+    saved = transport.timeout
+    transport.timeout = timeout
+    try:
+        transport.clear()
+        return transport.query("*IDN?").rstrip()
+    except (TimeoutError, ValueError):
+        # A mismatched rate shows up as silence or as bytes that do not
+        # decode (UnicodeDecodeError is a ValueError).
+        return None
+    finally:
+        transport.timeout = saved
+
+
+def _switch(transport, command:str, rate:int, settle:float):
+    # A failed *IDN? leaves the port waiting to resync, which cannot work
+    # while the rates disagree.
+    transport.clear()
+    transport.write(f"{command} {rate}")
+    # The command must be on the wire at the old rate before the port changes.
+    transport.drain()
+    time.sleep(settle)
+    transport.baud_rate = rate
+
+
+def negotiate_baud(transport, rates=BAUD_RATES, command:str=BAUD_COMMAND, settle:float=0.1,
+                   verify_timeout:int=500):
+    """
+    Move the meter and the port to the fastest rate that verifies.
+
+    Starting from the fastest of rates above the current one, the meter
+    is told to switch, the port follows, and *IDN? must return the same
+    identity as before. If it does not, the port goes back to the old
+    rate; if the meter did switch but the link cannot carry the new rate,
+    it is told to switch back from the new rate. The next slower rate is
+    then tried. The port is left at the last rate that verified.
+
+    Args:
+        transport (SerialTransport): The open port to the meter.
+        rates (tuple, optional): Candidate rates. Defaults to BAUD_RATES.
+        command (str, optional): The rate setting command, sent as
+            "<command> <rate>". Defaults to BAUD_COMMAND.
+        settle (float, optional): Seconds to let the meter change rate. Defaults to 0.1.
+        verify_timeout (int, optional): *IDN? timeout in ms. Defaults to 500.
+
+    Returns:
+        int: The baud rate in use.
+
+    Raises:
+        ConnectionError: The meter did not answer at the starting rate, or
+            was lost and could not be recovered.
+    """
+    original = transport.baud_rate
+    identity = _identify(transport, verify_timeout)
+    if identity is None:
+        raise ConnectionError(f"no *IDN? reply at {original} baud")
+
+    current = original
+    for rate in sorted(rates, reverse=True):
+        if rate <= current:
+            break
+        _switch(transport, command, rate, settle)
+        if _identify(transport, verify_timeout) == identity:
+            return rate
+
+        # Fall back: either the meter ignored the command and is still at
+        # the old rate, or it switched and the link will not hold the rate.
+        transport.baud_rate = current
+        if _identify(transport, verify_timeout) == identity:
+            continue
+        transport.baud_rate = rate
+        _switch(transport, command, current, settle)
+        if _identify(transport, verify_timeout) != identity:
+            raise ConnectionError(f"meter lost while trying {rate} baud; last good rate {current}")
+    return current
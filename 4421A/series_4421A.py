@@ -32,41 +32,73 @@ SOFTWARE.
 @file series_4421A.py
  
 """
-import pyvisa
+from collections import namedtuple
+
+from instrumentation_4421A import Instrumentation, InstrumentedTransport
+from pool_4421A import visa_exception
+from resilient_4421A import ResilientTransport
+from transports_4421A import transport_for
+
+# SCPI reports over-range as 9.9E37 (+/-INF) and no reading as 9.91E37 (NaN).
+OVERRANGE = 9.9e37
+NAN = float("nan")
+
+
+def parse_float(text:str):
+    """
+    Convert one numeric reply to a float, mapping the SCPI over-range and
+    not-a-number sentinels, and NaN or INF replies, to NaN.
+
+    Args:
+        text (str): The reply text.
+
+    Returns:
+        float: The value, or NaN.
+    """
+    value = float(text)
+    # NaN fails both comparisons, so it is returned unchanged.
+    return value if -OVERRANGE < value < OVERRANGE else NAN
 
 class Series4421A():
     """_summary_
     """
-    def __init__(self, instrument_resource_string=None):
+    def __init__(self, instrument_resource_string=None, pool=None, transport=None, backend:str="visa",
+                 instrumentation=None, resilient=False):
         self.__instrument_resource_string = instrument_resource_string
-        self.__resource_manager = None
+        self.__pool = pool
+        self.__transport = transport
+        self.__backend = backend
         self.__instr_obj = None
         self.__timeout = 5000
         self.__echo_cmds = False
-        self.__mfg_id = ""
-        self.__model = ""
-        self.__sn = ""
-        self.__fw = ""
+        self.__identity = IdentityCache()
         self.__general = ""
-
-        self.measure = None
-        self.system = None
-
-        try:
-            if self.__resource_manager is None:
-                self.__resource_manager = pyvisa.ResourceManager()
-        except pyvisa.VisaIOError as visaerror:
-            print(f"{visaerror}")
-        except pyvisa.VisaIOWarning as visawarning:
-            print(f"{visawarning}")
-
-    def connect(self, instrument_resource_string:str=None, timeout:int=None, **kwargs):
-        """Creates the VISA session connection to the instrument represented by the
-        instrument resource string. 
+        # True builds a private Instrumentation; an instance may be shared.
+        if instrumentation is True:
+            instrumentation = Instrumentation()
+        self.__instrumentation = instrumentation or None
+        # True uses the ResilientTransport defaults; a dict is passed on as
+        # its options, such as setup commands and backoff delays.
+        self.__resilient = resilient
+        self.__resilience = None
+
+        self.__measure = None
+        self.__system = None
+
+    def connect(self, instrument_resource_string:str=None, timeout:int=None, transport=None,
+                resilient=None, **kwargs):
+        """Creates the session connection to the instrument represented by the
+        instrument resource string, over the transport given to the constructor
+        or to connect(), or else one built for the backend ("visa", "socket"
+        or "serial") chosen at construction.
 
         Args:
             instrument_resource_string (str, optional): VISA instrument resource string. Defaults to None.
             timeout (int, optional): The instrument timeout response value. Defaults to None.
+            transport (optional): A VisaTransport, SocketTransport or SerialTransport. Defaults to None.
+            resilient (bool or dict, optional): Keep the connection up with a
+                ResilientTransport, which reconnects after the link breaks. A
+                dict gives its options. Defaults to the constructor's setting.
             stop_bits (pyvisa.constant.StopBits, optional): The number of stop bits used for RS232 comms.
             data_bits (int, optional): The number of data bits used for RS232 comms. 
             baud_rate (int, optional): The baud rate used for RS232 comms.
@@ -75,39 +107,81 @@ class Series4421A():
         try:
             if instrument_resource_string != None:
                 self.__instrument_resource_string = instrument_resource_string
-                
-            self.__instr_obj = self.__resource_manager.open_resource(
-                self.__instrument_resource_string
-            )
-
-            if timeout is None:
-                self.__instr_obj.timeout = self.__timeout
-            else:
-                self.__instr_obj.timeout = timeout
+
+            if timeout is not None:
                 self.__timeout = timeout
 
-            self.__instr_obj.send_end = True
-            self.__instr_obj.write_termination = "\n"
-            self.__instr_obj.read_termination = "\n"   
-
-            for key, value in kwargs.items():
-                print(f"key = {key} and value = {value}")
-                if key == 'stop_bits':
-                    self.__instr_obj.stop_bits = value
-                if key == 'data_bits':
-                    self.__instr_obj.data_bits = value
-                if key == 'baud_rate':
-                    self.__instr_obj.baud_rate = value
-                if key == 'parity':
-                    self.__instr_obj.parity = value
-
-            self.measure = self.Measure(self.__instr_obj)
-            self.system = self.System(self.__instr_obj)
-
-        except pyvisa.VisaIOError as visaerr:
+            if transport is not None:
+                self.__transport = transport
+            elif self.__transport is None or instrument_resource_string is not None:
+                self.__transport = transport_for(
+                    self.__instrument_resource_string, self.__backend,
+                    timeout=self.__timeout, pool=self.__pool, **kwargs
+                )
+
+            if resilient is not None:
+                self.__resilient = resilient
+
+            self.__transport.timeout = self.__timeout
+            instrobj = self.__transport
+            self.__resilience = None
+            if self.__resilient not in (None, False):
+                options = self.__resilient if isinstance(self.__resilient, dict) else {}
+                instrobj = self.__resilience = ResilientTransport(self.__transport, **options)
+            instrobj.open()
+            self.__attach(instrobj)
+
+        except visa_exception("VisaIOError") as visaerr:
             print(f"{visaerr}")
+        except visa_exception("VisaIOWarning") as visawarning:
+            print(f"{visawarning}")
+        except OSError as oserr:
+            print(f"{oserr}")
         return
     
+    def __attach(self, instrobj):
+        # Measure and System are built on first use, not on every connect.
+        # Without instrumentation the transport is used directly, so the
+        # disabled path adds no work to any call.
+        if self.__instrumentation is not None:
+            instrobj = InstrumentedTransport(instrobj, self.__instrumentation)
+        self.__instr_obj = instrobj
+        self.__identity.bind(instrobj)
+        self.__measure = None
+        self.__system = None
+
+    @property
+    def instrumentation(self):
+        """The Instrumentation recording this driver's I/O, or None when
+        instrumentation is off.
+        """
+        return self.__instrumentation
+
+    @property
+    def resilience(self):
+        """The ResilientTransport keeping the connection up, or None when
+        resilient mode is off.
+        """
+        return self.__resilience
+
+    @property
+    def measure(self):
+        """The Measure functions for the connected instrument, or None
+        before connect().
+        """
+        if self.__measure is None and self.__instr_obj is not None:
+            self.__measure = self.Measure(self.__instr_obj)
+        return self.__measure
+
+    @property
+    def system(self):
+        """The System functions for the connected instrument, or None
+        before connect().
+        """
+        if self.__system is None and self.__instr_obj is not None:
+            self.__system = self.System(self.__instr_obj, self.__identity)
+        return self.__system
+
     def write(self, cmd):
         self.__instr_obj.write(f"{cmd}")
 
@@ -124,22 +198,24 @@ class Series4421A():
         Returns:
             None
         """
+        self.__identity.bind(None)
         try:
             self.__instr_obj.close()
-        except pyvisa.VisaIOError as visaerr:
+        except visa_exception("VisaIOError") as visaerr:
             print(f"{visaerr}")
+        except OSError as oserr:
+            print(f"{oserr}")
         return
     
     @property
     def idn(self):
-        """Returns the full instrument ID string.
+        """Returns the full instrument ID string. The *IDN? query is sent
+        once per connection and the reply cached.
 
         Returns:
             str: Returns the full instrument ID string. 
         """
-        str = self.__instr_obj.query("*IDN?").rstrip()
-        self.__mfg_id, self.__model, self.__sn, self.__fw = str.split(',')
-        return str
+        return self.__identity.idn
     
     @property
     def manufacturer(self):
@@ -148,7 +224,7 @@ class Series4421A():
         Returns:
             str: The instrument manufacaturer name. 
         """
-        return self.__mfg_id
+        return self.__identity.manufacturer
     
     @property
     def model(self):
@@ -157,7 +233,7 @@ class Series4421A():
         Returns:
             str: The instrument model number. 
         """
-        return self.__model
+        return self.__identity.model
     
     @property
     def fw_version(self):
@@ -166,7 +242,7 @@ class Series4421A():
         Returns:
             str: The instrument firmware version. 
         """
-        return self.__fw
+        return self.__identity.fw_version
     
     @property
     def serial_number(self):
@@ -175,7 +251,7 @@ class Series4421A():
         Returns:
             str: The instrument serial number. 
         """
-        return self.__sn
+        return self.__identity.serial_number
     
     class Measure():
         def __init__(self, instrobj):
@@ -190,11 +266,11 @@ class Series4421A():
                 sensor_number (int): The number of the sensor connected to the meter input.
 
             Returns:
-                float: Power in Watts
+                float: Power in Watts, NaN when over range or unavailable.
             """
             if sensor_number is None:
                 sensor_number = 1
-            return float(self.__instr_obj.query(f"MEAS:AVER? {sensor_number}").rstrip())
+            return parse_float(self.__instr_obj.query(f"MEAS:AVER? {sensor_number}"))
         
         def reflected_power(self, sensor_number:int=1):
             """
@@ -205,24 +281,42 @@ class Series4421A():
                 sensor_number (int): The number of the sensor connected to the meter input.
 
             Returns:
-                float: Power in Watts
+                float: Power in Watts, NaN when over range or unavailable.
             """
             if sensor_number is None:
                 sensor_number = 1
-            return float(self.__instr_obj.query(f"MEAS:REFL:AVER? {sensor_number}").rstrip())
+            return parse_float(self.__instr_obj.query(f"MEAS:REFL:AVER? {sensor_number}"))
+
+        def scan_list(self, sensors=(1,), quantities=("forward", "reflected")):
+            """
+            Compile a scan list that reads every requested quantity on every
+            requested sensor with a single compound SCPI query.
+
+            Args:
+                sensors (tuple): Sensor channels to read (1 and/or 2).
+                quantities (tuple): Any of "forward" and "reflected".
+
+            Returns:
+                ScanList: The compiled scan list; call run() to take a reading.
+            """
+            return ScanList(self.__instr_obj, sensors, quantities)
     
     class System():
-        def __init__(self, instrobj):
+        def __init__(self, instrobj, identity=None):
             self.__instr_obj = instrobj
+            if identity is None:
+                identity = IdentityCache()
+                identity.bind(instrobj)
+            self.__identity = identity
 
         def firmware_version(self):
             """
-            Reads the MCU firmware revision.
+            Reads the MCU firmware revision, from the cached *IDN? response.
 
             Returns:
                 str: MCU firmware revision
             """
-            return self.__instr_obj.query("SYST:IDEN:FWR?").rstrip()
+            return self.__identity.fw_version
         
         def model_number(self):
             """
@@ -231,7 +325,7 @@ class Series4421A():
             Returns:
                 str: Instrument model number
             """
-            return self.__instr_obj.query("SYSTem:IDENtity:MODel?").rstrip()
+            return self.__identity.model
         
         def serial_number(self):
             """
@@ -240,14 +334,16 @@ class Series4421A():
             Returns:
                 str: Instrument serial number
             """
-            return self.__instr_obj.query("SYSTem:IDENtity:SN?").rstrip()
+            return self.__identity.serial_number
         
         def preset(self):
             """
             Restores factory settings without changing the RS232 or LAN
-            settings.
+            settings. The cached identity is refreshed on next use.
+            SYST:PRES is a command and has no reply.
             """
-            return self.__instr_obj.query("SYSTem:PRESet").rstrip()
+            self.__identity.invalidate()
+            self.__instr_obj.write("SYST:PRES")
         
         def scpi_version(self):
             """
@@ -256,4 +352,110 @@ class Series4421A():
             Returns:
                 str: SCPI version.
             """
-            return self.__instr_obj.query("SYSTem:VERSion?").rstrip()
+            return self.__instr_obj.query("SYST:VERS?").rstrip()
+
+
+class IdentityCache():
+    """The instrument identity, fetched lazily with a single *IDN? query.
+
+    The reply is split once into manufacturer, model, serial number and
+    firmware version and shared by the Series4421A properties and the
+    System methods. Binding a new session, or calling invalidate(), clears
+    it so the next access queries the instrument again.
+    """
+    def __init__(self):
+        self.__instr_obj = None
+        self.__fields = None
+
+    def bind(self, instrobj):
+        self.__instr_obj = instrobj
+        self.__fields = None
+
+    def invalidate(self):
+        self.__fields = None
+
+    def __get(self, index:int):
+        if self.__fields is None:
+            if self.__instr_obj is None:
+                return ""
+            idn = self.__instr_obj.query("*IDN?").rstrip()
+            parts = [part.strip() for part in idn.split(",")]
+            parts += [""] * (4 - len(parts))
+            self.__fields = (idn, *parts[:4])
+        return self.__fields[index]
+
+    @property
+    def idn(self):
+        return self.__get(0)
+
+    @property
+    def manufacturer(self):
+        return self.__get(1)
+
+    @property
+    def model(self):
+        return self.__get(2)
+
+    @property
+    def serial_number(self):
+        return self.__get(3)
+
+    @property
+    def fw_version(self):
+        return self.__get(4)
+
+
+class ScanList():
+    """A precompiled set of measurements read in one round trip.
+
+    The SCPI command is built once, joining every query with ";:" so the
+    meter answers them all on one line, and each reply is unpacked into a
+    fixed-layout ScanRecord named tuple with fields such as forward_1 and
+    reflected_2.
+    """
+    QUERIES = {
+        "forward": "MEAS:AVER?",
+        "reflected": "MEAS:REFL:AVER?",
+    }
+
+    def __init__(self, instrobj, sensors=(1,), quantities=("forward", "reflected")):
+        self.__instr_obj = instrobj
+        for quantity in quantities:
+            if quantity not in self.QUERIES:
+                raise ValueError(f"unknown scan quantity: {quantity}")
+
+        self.channels = tuple(
+            (sensor, quantity) for sensor in sensors for quantity in quantities
+        )
+        self.fields = tuple(f"{quantity}_{sensor}" for sensor, quantity in self.channels)
+        self.command = ";:".join(
+            f"{self.QUERIES[quantity]} {sensor}" for sensor, quantity in self.channels
+        )
+        self.record = namedtuple("ScanRecord", self.fields)
+        self.__width = len(self.fields)
+
+    def parse(self, reply:str):
+        """
+        Unpack a compound reply into a ScanRecord.
+
+        Args:
+            reply (str): The raw reply line from the meter.
+
+        Returns:
+            ScanRecord: One float per scan list field, in scan order; NaN
+                where the meter reported over range or no reading.
+        """
+        values = reply.rstrip().replace(",", ";").split(";")
+        if len(values) != self.__width:
+            raise ValueError(f"expected {self.__width} values in scan reply, got {reply!r}")
+        return self.record._make(map(parse_float, values))
+
+    def run(self):
+        """
+        Send the compiled scan list and return its reading.
+
+        Returns:
+            ScanRecord: One float per scan list field, in scan order; NaN
+                where the meter reported over range or no reading.
+        """
+        return self.parse(self.__instr_obj.query(self.command))
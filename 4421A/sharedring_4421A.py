@@ -0,0 +1,296 @@
+"""
+Example Description:
+        This example is a shared-memory ring of power samples for the Bird
+        4421A Multifuntion Power Meter. One acquisition process publishes
+        sequence-numbered samples into a multiprocessing.shared_memory
+        block, and any number of local processes attach to it by name to
+        read the latest samples without copying and to detect the samples
+        they missed, without ever contacting the meter.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file sharedring_4421A.py
+
+"""
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from ringbuffer_4421A import SAMPLE_DTYPE
+
+MAGIC = b"B4421RNG"
+VERSION = 1
+HEADER_SIZE = 64
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "u4"),
+    ("record_size", "u4"),
+    ("capacity", "u8"),
+    ("sequence", "u8"),
+])
+
+SHARED_DTYPE = np.dtype([("sequence", "u8")] + SAMPLE_DTYPE.descr)
+
+
+def _layout(buf, capacity:int):
+    """Header and record arrays laid over a shared memory buffer."""
+    header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=buf)
+    data = np.ndarray((2 * capacity,), dtype=SHARED_DTYPE, buffer=buf, offset=HEADER_SIZE)
+    return header, data
+
+
+class SharedRingWriter():
+    """The publishing side of a shared-memory sample ring.
+
+    Samples are laid out as in PowerRingBuffer, written at their slot and
+    again in a mirror copy after the ring so the latest N are contiguous,
+    with a sequence number in front of each record: the first sample is 1.
+    The header holds the sequence of the newest completed sample and is
+    only advanced after the whole record, both copies, has been written.
+    While a slot is being rewritten its sequence reads 0.
+
+    It takes append(timestamp, sensor, forward, reflected), so a Sampler
+    can publish to it directly as its sink. There must be a single writer.
+    The memory block is removed when the writer is closed; readers that
+    are still attached keep their mapping until they close.
+
+    Args:
+        capacity (int): Samples kept in the ring.
+        name (str, optional): Shared memory name. Defaults to a generated one.
+    """
+    def __init__(self, capacity:int, name:str=None):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        size = HEADER_SIZE + 2 * capacity * SHARED_DTYPE.itemsize
+        self.__shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.__capacity = capacity
+        self.__header, self.__data = _layout(self.__shm.buf, capacity)
+        self.__sequences = self.__data["sequence"]
+        self.__head = self.__header["sequence"]
+        self.__data[:] = np.zeros(1, dtype=SHARED_DTYPE)
+        self.__header[0] = (MAGIC, VERSION, SHARED_DTYPE.itemsize, capacity, 0)
+        self.__count = 0
+
+    @property
+    def name(self):
+        """The name readers attach with.
+        """
+        return self.__shm.name
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def sequence(self):
+        """The sequence number of the newest sample, 0 before the first.
+        """
+        return self.__count
+
+    @property
+    def nbytes(self):
+        return self.__shm.size
+
+    def append(self, timestamp:float, sensor:int, forward:float, reflected:float):
+        """
+        Publish one sample, overwriting the oldest once the ring is full.
+
+        Args:
+            timestamp (float): Sample time in seconds since the epoch.
+            sensor (int): Sensor channel the sample came from.
+            forward (float): Forward power in Watts.
+            reflected (float): Reflected power in Watts.
+        """
+        slot = self.__count % self.__capacity
+        mirror = slot + self.__capacity
+        sequence = self.__count + 1
+        record = (0, timestamp, sensor, forward, reflected)
+        self.__data[slot] = record
+        self.__data[mirror] = record
+        self.__sequences[slot] = sequence
+        self.__sequences[mirror] = sequence
+        self.__head[0] = sequence
+        self.__count = sequence
+
+    def close(self):
+        """Releases and removes the shared memory block.
+        """
+        if self.__shm is None:
+            return
+        # The numpy views hold exports of the buffer; drop them first.
+        self.__header = self.__data = self.__sequences = self.__head = None
+        self.__shm.close()
+        # A reader in this process tree may have unregistered the block
+        # from the shared resource tracker; unlink() expects it registered.
+        resource_tracker.register(self.__shm._name, "shared_memory")
+        self.__shm.unlink()
+        self.__shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedRingReader():
+    """The reading side of a shared-memory sample ring.
+
+    Readers only map the block; they never write to it and never contact
+    the meter, so any number can attach. Records come back as
+    SHARED_DTYPE arrays: the SAMPLE_DTYPE fields with their sequence
+    number in front.
+
+    latest() returns a view straight into shared memory. The writer keeps
+    running, so once the reader is done with a view it should pass it to
+    intact() to learn which records were overwritten while it was in use.
+    read_since() copies, checks and returns only intact records, with a
+    count of the samples the reader was too slow to see.
+
+    Args:
+        name (str): The writer's name.
+    """
+    def __init__(self, name:str):
+        try:
+            self.__shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with this
+            # process' resource tracker, which would unlink it on exit.
+            self.__shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(self.__shm._name, "shared_memory")
+        header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=self.__shm.buf)
+        if header["magic"][0] != MAGIC or header["version"][0] != VERSION:
+            header = None
+            self.__shm.close()
+            raise ValueError(f"{name} is not a 4421A sample ring")
+        if header["record_size"][0] != SHARED_DTYPE.itemsize:
+            header = None
+            self.__shm.close()
+            raise ValueError(f"{name} has records of an unknown layout")
+        self.__capacity = int(header["capacity"][0])
+        self.__header, self.__data = _layout(self.__shm.buf, self.__capacity)
+        self.__head = self.__header["sequence"]
+
+    @property
+    def name(self):
+        return self.__shm.name
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def sequence(self):
+        """The sequence number of the newest published sample.
+        """
+        return int(self.__head[0])
+
+    def __view(self, head:int, n:int):
+        end = head % self.__capacity + (self.__capacity if head >= self.__capacity else 0)
+        view = self.__data[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def latest(self, n:int=None):
+        """
+        Return the most recent samples, oldest first, without copying.
+
+        Args:
+            n (int, optional): Number of samples. Defaults to None (all
+                stored samples but the oldest, which the writer may be
+                overwriting).
+
+        Returns:
+            numpy.ndarray: A read-only SHARED_DTYPE view into shared memory.
+        """
+        head = self.sequence
+        stored = min(head, self.__capacity - 1)
+        n = stored if n is None else min(n, stored)
+        return self.__view(head, n)
+
+    def intact(self, records):
+        """
+        Check records read from the ring are still as the writer left them.
+
+        Call it after using a view: a record is intact if it was complete
+        when read and its slot has not been reused since.
+
+        Args:
+            records (numpy.ndarray): Records from latest() or read_since().
+
+        Returns:
+            numpy.ndarray: A bool mask, False where a record may be torn.
+        """
+        # The writer may already be filling the slot after the newest
+        # published sample, which is the slot of sequence head + 1 - capacity.
+        oldest = self.sequence + 2 - self.__capacity
+        sequences = records["sequence"]
+        return (sequences != 0) & (sequences.astype(np.int64) >= oldest)
+
+    def read_since(self, cursor:int=0):
+        """
+        Copy every sample published after a sequence number.
+
+        Args:
+            cursor (int, optional): The newest sequence already seen, from the
+                previous call. Defaults to 0 (everything still in the ring).
+
+        Returns:
+            tuple: (records, cursor, missed), a SHARED_DTYPE array copy of the
+                intact new samples, the cursor to pass next time, and the
+                number of samples that were overwritten before they could be
+                read.
+        """
+        head = self.sequence
+        if cursor > head:
+            raise ValueError(f"cursor {cursor} is ahead of the ring at {head}")
+        first = max(cursor + 1, head + 2 - self.__capacity, 1)
+        records = self.__view(head, head - first + 1).copy()
+        expected = np.arange(first, head + 1, dtype=np.uint64)
+        good = self.intact(records) & (records["sequence"] == expected)
+        # Only the oldest records can be lost to the writer, so keep the
+        # tail after the last bad one.
+        bad = np.flatnonzero(~good)
+        skip = int(bad[-1]) + 1 if len(bad) else 0
+        missed = first - cursor - 1 + skip
+        return records[skip:], head, missed
+
+    def close(self):
+        """Detaches from the shared memory block, leaving it for others.
+        """
+        if self.__shm is None:
+            return
+        self.__header = self.__data = self.__head = None
+        self.__shm.close()
+        self.__shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,428 @@
+"""
+Example Description:
+        This example is a set of transport classes used to talk to the
+        Bird 4421A Multifuntion Power Meter over VISA, a raw TCP socket or
+        a pyserial port. Any of them can be handed to Series4421A, and the
+        Measure and System functions behave the same on each.
+
+        Every transport provides the same small contract:
+
+            open() / close()    start and end the session
+            write(cmd)          send one command, terminator appended
+            read()              return the next reply line, unterminated
+            query(cmd)          write(cmd) then read()
+            timeout             I/O timeout in milliseconds (read/write)
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file transports_4421A.py
+
+"""
+import re
+import socket
+import sys
+import time
+from abc import ABC, abstractmethod
+
+from pool_4421A import configure_session, shared_resource_manager
+
+SCPI_PORT = 5025
+RECVSIZE = 4096
+
+
+class LineTransport(ABC):
+    """Common line framing for the byte-stream transports.
+
+    Received bytes are kept in a persistent buffer, so a reply split across
+    several reads, or several replies arriving in one read, are framed
+    correctly on the newline terminator. Reads wait on the link itself up to
+    a deadline computed from the timeout; there are no fixed sleeps.
+
+    A read that times out leaves the link out of step: its reply may
+    still arrive, or may never come. The next write therefore resyncs
+    first. It sends *OPC? as a marker and discards every line up to the
+    marker's "1", so the reply to the new command is the next line. If the
+    marker does not come back within the timeout, the write raises
+    TimeoutError and the next write tries again.
+    """
+    RESYNC_QUERY = "*OPC?"
+    RESYNC_REPLY = "1"
+
+    def __init__(self, timeout:int=5000):
+        self._timeout = timeout
+        self.__buffer = bytearray()
+        self.__encoded = {}
+        self.__resync = False
+
+    @property
+    def timeout(self):
+        """The I/O timeout in milliseconds, as with a VISA session.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value:int):
+        self._timeout = value
+
+    @abstractmethod
+    def open(self):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    @abstractmethod
+    def _send(self, data:bytes):
+        pass
+
+    @abstractmethod
+    def _recv(self, timeout:float):
+        """Returns the bytes available within timeout seconds, b"" on timeout."""
+
+    @property
+    def resyncing(self):
+        """Whether the next write resyncs after a timed out read.
+        """
+        return self.__resync
+
+    def clear(self):
+        """Discards any buffered, unread reply bytes and a pending resync.
+
+        Only call it once no late reply can still arrive, as on a fresh
+        connection or after changing the line rate.
+        """
+        self.__buffer.clear()
+        self.__resync = False
+
+    def __resync_link(self):
+        self._send(f"{self.RESYNC_QUERY}\n".encode())
+        deadline = time.monotonic() + self._timeout / 1000
+        while self.__read_line(deadline) != self.RESYNC_REPLY:
+            pass
+        self.__resync = False
+
+    def write(self, cmd):
+        """Sends one command, appending the newline terminator.
+
+        Args:
+            cmd (str or bytes): SCPI command. Bytes are sent as-is and must
+                already carry their terminator.
+
+        Raises:
+            TimeoutError: The link could not be resynced after a timeout.
+        """
+        if self.__resync:
+            self.__resync_link()
+        if isinstance(cmd, (bytes, bytearray)):
+            self._send(cmd)
+            return
+        encoded = self.__encoded.get(cmd)
+        if encoded is None:
+            encoded = f"{cmd}\n".encode()
+            self.__encoded[cmd] = encoded
+        self._send(encoded)
+
+    def __read_line(self, deadline:float):
+        scanned = 0
+        while True:
+            end = self.__buffer.find(b"\n", scanned)
+            if end >= 0:
+                line = bytes(self.__buffer[:end])
+                del self.__buffer[:end + 1]
+                return line.decode().rstrip("\r")
+            scanned = len(self.__buffer)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("timed out waiting for the instrument reply")
+            self.__buffer += self._recv(remaining)
+
+    def read(self):
+        """Returns the next complete reply line without its terminator.
+
+        Raises:
+            TimeoutError: No complete line arrived within the timeout.
+        """
+        try:
+            return self.__read_line(time.monotonic() + self._timeout / 1000)
+        except TimeoutError:
+            self.__resync = True
+            raise
+
+    def query(self, cmd):
+        self.write(cmd)
+        return self.read()
+
+
+class SocketTransport(LineTransport):
+    """Raw SCPI socket transport (TCP port 5025).
+    """
+    def __init__(self, host:str, port:int=SCPI_PORT, timeout:int=5000):
+        super().__init__(timeout)
+        self.__host = host
+        self.__port = port
+        self.__sock = None
+
+    def open(self):
+        self.__sock = socket.create_connection((self.__host, self.__port), self._timeout / 1000)
+        # Commands are tiny; do not let Nagle hold them back waiting for an ACK.
+        self.__sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.clear()
+
+    def close(self):
+        if self.__sock is not None:
+            self.__sock.close()
+            self.__sock = None
+
+    def _send(self, data:bytes):
+        self.__sock.settimeout(self._timeout / 1000)
+        self.__sock.sendall(data)
+
+    def _recv(self, timeout:float):
+        self.__sock.settimeout(timeout)
+        try:
+            data = self.__sock.recv(RECVSIZE)
+        except socket.timeout:
+            return b""
+        if not data:
+            raise ConnectionError("connection closed by instrument")
+        return data
+
+
+class SerialTransport(LineTransport):
+    """RS-232 transport using pyserial.
+    """
+    def __init__(self, port:str, baud_rate:int=9600, data_bits:int=8, parity:str="N",
+                 stop_bits:float=1, timeout:int=5000):
+        super().__init__(timeout)
+        self.__port = port
+        self.__baud_rate = baud_rate
+        self.__data_bits = data_bits
+        self.__parity = parity
+        self.__stop_bits = stop_bits
+        self.__serial = None
+
+    @property
+    def baud_rate(self):
+        return self.__baud_rate
+
+    @baud_rate.setter
+    def baud_rate(self, value:int):
+        self.__baud_rate = value
+        if self.__serial is not None:
+            self.__serial.baudrate = value
+
+    @property
+    def data_bits(self):
+        return self.__data_bits
+
+    @property
+    def parity(self):
+        return self.__parity
+
+    @property
+    def stop_bits(self):
+        return self.__stop_bits
+
+    def open(self):
+        import serial
+
+        self.__serial = serial.serial_for_url(
+            self.__port,
+            baudrate=self.__baud_rate,
+            bytesize=self.__data_bits,
+            parity=self.__parity,
+            stopbits=self.__stop_bits,
+            timeout=self._timeout / 1000,
+        )
+        self.clear()
+
+    def close(self):
+        if self.__serial is not None:
+            self.__serial.close()
+            self.__serial = None
+
+    def clear(self):
+        """Discards buffered reply bytes, including any still in the driver.
+        """
+        super().clear()
+        if self.__serial is not None:
+            self.__serial.reset_input_buffer()
+
+    def drain(self):
+        """Waits until everything written has left the port, as needed
+        before changing the baud rate.
+        """
+        self.__serial.flush()
+
+    def _send(self, data:bytes):
+        self.__serial.write(data)
+
+    def _recv(self, timeout:float):
+        self.__serial.timeout = timeout
+        # Take whatever has already arrived in one call; block for at most
+        # one byte only when the driver buffer is empty.
+        return self.__serial.read(self.__serial.in_waiting or 1)
+
+
+class VisaTransport():
+    """VISA session transport through pyvisa.
+
+    The session is opened from the shared resource manager, or checked out
+    of a SessionPool when one is given, in which case close() returns it
+    to the pool, or discards it if any I/O on it failed, since a late
+    reply could still arrive on it.
+    """
+    def __init__(self, resource_string:str, timeout:int=5000, pool=None, resource_manager=None,
+                 **settings):
+        self.__resource_string = resource_string
+        self.__timeout = timeout
+        self.__pool = pool
+        self.__resource_manager = resource_manager
+        self.__settings = settings
+        self.__session = None
+        self.__failed = False
+
+    @property
+    def session(self):
+        """The underlying pyvisa resource, or None when closed.
+        """
+        return self.__session
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, value:int):
+        self.__timeout = value
+        if self.__session is not None:
+            self.__session.timeout = value
+
+    def open(self):
+        self.__failed = False
+        if self.__pool is not None:
+            self.__session = self.__pool.checkout(
+                self.__resource_string, self.__timeout, **self.__settings
+            )
+            return
+        rm = self.__resource_manager or shared_resource_manager()
+        session = rm.open_resource(self.__resource_string)
+        session.timeout = self.__timeout
+        configure_session(session, **self.__settings)
+        self.__session = session
+
+    def close(self):
+        session, self.__session = self.__session, None
+        if session is None:
+            return
+        if self.__pool is None:
+            session.close()
+        elif self.__failed:
+            self.__pool.discard(session)
+        else:
+            self.__pool.checkin(session)
+
+    def write(self, cmd):
+        try:
+            if isinstance(cmd, (bytes, bytearray)):
+                self.__session.write_raw(bytes(cmd))
+            else:
+                self.__session.write(cmd)
+        except Exception:
+            self.__failed = True
+            raise
+
+    def read(self):
+        try:
+            return self.__session.read()
+        except Exception:
+            self.__failed = True
+            raise
+
+    def query(self, cmd):
+        try:
+            return self.__session.query(cmd)
+        except Exception:
+            self.__failed = True
+            raise
+
+
+_SOCKET_RESOURCE = re.compile(r"^TCPIP\d*::([^:]+)::(\d+)::SOCKET$", re.IGNORECASE)
+_SERIAL_RESOURCE = re.compile(r"^ASRL(.+)::INSTR$", re.IGNORECASE)
+_VISA_PARITY = {0: "N", 1: "O", 2: "E", 3: "M", 4: "S"}
+_VISA_STOP_BITS = {10: 1, 15: 1.5, 20: 2}
+
+
+def transport_for(resource_string:str, backend:str="visa", timeout:int=5000, pool=None, **settings):
+    """
+    Build the transport for a VISA resource string on the chosen backend.
+
+    The "socket" backend accepts TCPIP::<host>::<port>::SOCKET resources and
+    the "serial" backend accepts ASRL<n>::INSTR (COM<n>) or ASRL<device>::INSTR
+    resources, taking the same RS232 settings, including pyvisa constants,
+    as a VISA session would.
+
+    Args:
+        resource_string (str): VISA instrument resource string.
+        backend (str, optional): "visa", "socket" or "serial". Defaults to "visa".
+        timeout (int, optional): The instrument timeout response value in ms. Defaults to 5000.
+        pool (SessionPool, optional): Session pool for the "visa" backend. Defaults to None.
+
+    Returns:
+        The transport, not yet opened.
+    """
+    if backend == "visa":
+        return VisaTransport(resource_string, timeout, pool=pool, **settings)
+
+    if backend == "socket":
+        match = _SOCKET_RESOURCE.match(resource_string)
+        if match is None:
+            raise ValueError(f"not a TCPIP SOCKET resource: {resource_string}")
+        return SocketTransport(match.group(1), int(match.group(2)), timeout)
+
+    if backend == "serial":
+        match = _SERIAL_RESOURCE.match(resource_string)
+        if match is None:
+            raise ValueError(f"not an ASRL resource: {resource_string}")
+        port = match.group(1)
+        if port.isdigit():
+            port = f"COM{port}" if sys.platform == "win32" else f"/dev/ttyS{int(port) - 1}"
+        # pyvisa Parity and StopBits constants are int enums; plain pyserial
+        # values ("N", 1, 1.5, 2) pass through unchanged.
+        parity = settings.get("parity", "N")
+        stop_bits = settings.get("stop_bits", 1)
+        return SerialTransport(
+            port,
+            baud_rate=settings.get("baud_rate", 9600),
+            data_bits=settings.get("data_bits", 8),
+            parity=_VISA_PARITY.get(parity, parity),
+            stop_bits=_VISA_STOP_BITS.get(stop_bits, stop_bits),
+            timeout=timeout,
+        )
+
+    raise ValueError(f"unknown transport backend: {backend}")